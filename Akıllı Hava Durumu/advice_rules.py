@@ -0,0 +1,275 @@
+# advice_rules.py
+import sys
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+# --- HAVA OLAYI GRUPLARI ---
+# OWM weather[0].id: 2xx gök gürültülü, 3xx çiseleme, 5xx yağmur, 6xx kar,
+# 7xx sis/pus/toz, 800 açık, 80x bulutlu. Açıklama metni dile göre değiştiği için
+# kararlar bu sayısal koddan verilir.
+GROUP_OTHER, GROUP_RAIN, GROUP_SNOW, GROUP_CLEAR = range(4)
+GROUP_COUNT = 4
+
+_GROUP_BY_HUNDREDS = np.array([GROUP_OTHER, GROUP_OTHER, GROUP_RAIN, GROUP_RAIN, GROUP_OTHER,
+                               GROUP_RAIN, GROUP_SNOW, GROUP_OTHER, GROUP_OTHER, GROUP_OTHER], dtype=np.intp)
+_GROUP_LIST = _GROUP_BY_HUNDREDS.tolist()
+
+
+def condition_group(cond_ids):
+    """OWM durum kod(lar)ının grubu. Dizi verilirse dizi döner."""
+    ids = np.asarray(cond_ids, dtype=np.int64)
+    groups = _GROUP_BY_HUNDREDS[np.clip(ids // 100, 0, 9)]
+    return np.where(ids == 800, GROUP_CLEAR, groups)
+
+
+def group_of(cond_id):
+    """condition_group'un tek kod için NumPy'sız hali."""
+    if cond_id == 800:
+        return GROUP_CLEAR
+    return _GROUP_LIST[min(max(cond_id // 100, 0), 9)]
+
+
+def group_from_desc(desc):
+    """Eski metin tabanlı sınıflandırma; sadece elinde durum kodu olmayan çağıranlar için."""
+    desc = desc.lower()
+    if "kar" in desc or "snow" in desc:
+        return GROUP_SNOW
+    if "yağmur" in desc or "sağanak" in desc or "rain" in desc:
+        return GROUP_RAIN
+    if "clear" in desc or "açık" in desc or "sun" in desc:
+        return GROUP_CLEAR
+    return GROUP_OTHER
+
+
+# --- KURAL TABLOLARI ---
+# Her kural: (koşullar, sonuç). Koşullar: "group" (tek grup ya da demet),
+# "temp" / "wind" / "precip" için ("<", 12) gibi bir karşılaştırma ya da bunların
+# demeti. Boş koşul her şeye uyar. Eşikler metrik birimlerdedir: uygulama "temp"
+# olarak hissedilen sıcaklığı (°C), "wind" olarak hamle dahil en yüksek rüzgarı
+# (m/s), "precip" olarak dilimin 3 saatlik yağış miktarını (mm) verir; tahmin hangi
+# birimde çekilmiş olursa olsun (derived_metrics.DerivedMetrics.advice_inputs).
+
+# Tavsiye: yukarıdan aşağı ilk uyan kural kazanır
+ADVICE_RULES = [
+    ({"group": GROUP_SNOW},
+     "❄️ KAR YAĞIŞI: Dışarısı beyaz bir masal gibi ama soğuk şakaya gelmez! Mutlaka su geçirmeyen botlarını ve en kalın montunu giy.\n\n"
+     "🎒 İPUCU: Atkı, bere ve eldiven üçlüsü olmadan çıkma. Araç kullanacaksan buz kazıyıcıyı unutma."),
+    ({"group": GROUP_RAIN, "temp": ("<", 12)},
+     "☔ SOĞUK YAĞMUR: Hava hem ıslak hem üşütücü. Su geçirmeyen kalın bir mont ve sağlam botlar şart.\n\n"
+     "🎒 İPUCU: Rüzgara dayanıklı bir şemsiye al. Ayakların ıslanırsa günün zehir olur, dikkat et!"),
+    ({"group": GROUP_RAIN},
+     "🌦️ ILIK YAĞMUR: Yağmur var ama hava yumuşak. İnce bir yağmurluk veya trençkot işini görür.\n\n"
+     "🎒 İPUCU: Şemsiyeni yanından ayırma. Islanan elektronik cihazlar için çantanda yer aç."),
+    ({"temp": ("<", 5)},
+     "🥶 KURU SOĞUK: Hava buz gibi! Termal içliklerin varsa tam zamanı. Lahana gibi kat kat giyinmek seni sıcak tutar.\n\n"
+     "🎒 İPUCU: Soğuk cildini kurutabilir, nemlendirici sürmeyi ve kulaklarını bereyle korumayı unutma."),
+    ({"temp": ("<=", 18)},
+     "☁️ SERİN HAVA: Tam bir geçiş havası. Tişört üstüne hırka veya mevsimlik bir ceket alarak 'katmanlı' giyin.\n\n"
+     "🎒 İPUCU: Güneşe aldanma, akşam serinliği çarpar. Yanına yedek bir üst al."),
+    ({"temp": ("<=", 25)},
+     "🌤️ HARİKA HAVA: Ne üşütür ne terletir. En sevdiğin tişörtünü, kotunu veya rahat spor kıyafetlerini giy.\n\n"
+     "🎒 İPUCU: Dışarıda vakit geçirmek için mükemmel gün. Güneş gözlüğün yanında olsun."),
+    ({"temp": ("<=", 32)},
+     "☀️ SICAK: Güneş kendini hissettiriyor. Açık renkli, pamuklu ve terletmeyen ince kıyafetler tercih et.\n\n"
+     "🎒 İPUCU: Güneş gözlüğü ve şapka şart. Susuz kalmamak için su mataranı mutlaka yanına al."),
+    ({"temp": (">", 32)},
+     "🔥 AŞIRI SICAK: Hava bunaltıcı seviyede. Mümkünse gölgeden ayrılma ve en ferah, en ince kıyafetlerini giy.\n\n"
+     "🎒 İPUCU: Sıcakta telefon şarjı çabuk biter, powerbank al. Ve tabii ki bol bol su iç!"),
+]
+
+# Tavsiyenin sonuna eklenen notlar: uyanların hepsi eklenir.
+# Kar tavsiyesi zaten kalın mont dediği için rüzgar uyarısı almaz.
+ADVICE_ADDONS = [
+    ({"group": (GROUP_OTHER, GROUP_RAIN, GROUP_CLEAR), "wind": (">", 20)},
+     "\n\n🌬️ UYARI: Rüzgar sert esiyor! Rüzgar kesici (Windbreaker) bir mont giymezsen üşütürsün."),
+    ({"group": GROUP_RAIN, "precip": (">=", 7.5)},
+     "\n\n⛈️ UYARI: Yağış kuvvetli! Alt geçitlerden ve dere yataklarından uzak dur, su geçirmeyen ayakkabı giy."),
+    ({"group": GROUP_SNOW, "precip": (">=", 3)},
+     "\n\n🚧 UYARI: Yoğun kar bekleniyor! Yollar kapanabilir, yola çıkmadan önce durumu kontrol et."),
+]
+
+# Kıyafetler: uyan kuralların hepsi kural sırasıyla eklenir (aynı parça bir kez)
+CLOTHING_RULES = [
+    ({"temp": ("<", 5)}, ("winter_coat", "scarf")),
+    ({"temp": ((">=", 5), ("<", 15))}, ("winter_coat",)),
+    ({"temp": ((">=", 15), ("<", 22))}, ("jacket",)),
+    ({"temp": (">=", 22)}, ("tshirt",)),
+    ({"group": GROUP_SNOW}, ("snow_boots", "scarf")),
+    ({"group": GROUP_RAIN}, ("raincoat", "umbrella")),
+    ({"group": GROUP_CLEAR, "temp": (">", 18)}, ("sunglasses",)),
+    ({"temp": (">", 25)}, ("cap",)),
+]
+
+
+# --- DERLEME ---
+def _comparisons(cond):
+    """("<", 5) ya da (("<", 5), (">=", 1)) -> karşılaştırma listesi."""
+    if not cond:
+        return []
+    return [cond] if isinstance(cond[0], str) else list(cond)
+
+
+class _Axis:
+    """
+    Bir değişkenin (sıcaklık, rüzgar) kurallarda geçen eşiklerine göre bantlara ayrılması.
+
+    Her karşılaştırma "x >= e" ya da "x > e" biçiminde bir eşiğe indirgenir. Eşikler
+    (değer, katılık) sırasına dizilince birinin doğru olması öncekilerin de doğru
+    olmasını gerektirir; bu yüzden bant numarası = doğru olan eşik sayısıdır ve
+    iki searchsorted ile bulunur.
+    """
+
+    def __init__(self, comparisons):
+        steps = set()
+        for op, value in comparisons:
+            steps.add(self._step(op, value))
+        self.steps = sorted(steps)
+        self.ge_edges = [v for v, strict in self.steps if not strict]
+        self.gt_edges = [v for v, strict in self.steps if strict]
+        self._ge = np.asarray(self.ge_edges, dtype=np.float64)
+        self._gt = np.asarray(self.gt_edges, dtype=np.float64)
+        self.size = len(self.steps) + 1
+
+    @staticmethod
+    def _step(op, value):
+        # "<" ve ">=" -> x >= e; "<=" ve ">" -> x > e
+        if op in ("<", ">="):
+            return (float(value), False)
+        if op in ("<=", ">"):
+            return (float(value), True)
+        raise ValueError(f"Bilinmeyen karşılaştırma: {op}")
+
+    def truth(self, op, value):
+        """Karşılaştırmanın her bantta doğru olup olmadığı (bool dizi)."""
+        k = self.steps.index(self._step(op, value))
+        crossed = np.arange(self.size) > k  # Bant b'de ilk b eşik doğrudur
+        return crossed if op in (">=", ">") else ~crossed
+
+    def bands(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        return np.searchsorted(self._ge, values, side="right") + np.searchsorted(self._gt, values, side="left")
+
+    def band(self, value):
+        return bisect_right(self.ge_edges, value) + bisect_left(self.gt_edges, value)
+
+
+class RuleEngine:
+    """
+    Kural tablolarını bir kez (grup x sıcaklık bandı x rüzgar bandı x yağış bandı) ızgarasına derler.
+    Her ızgara hücresi için ilk uyan tavsiye, uyan notlar ve kıyafet parçaları
+    önceden bellidir; değerlendirme bantları bulup tek bir indeksleme yapmaktan ibarettir.
+    """
+
+    VARIABLES = ("temp", "wind", "precip")
+
+    def __init__(self, advice_rules=ADVICE_RULES, addon_rules=ADVICE_ADDONS,
+                 clothing_rules=CLOTHING_RULES):
+        all_rules = advice_rules + addon_rules + clothing_rules
+        self.axes = [_Axis(c for cond, _ in all_rules for c in _comparisons(cond.get(name)))
+                     for name in self.VARIABLES]
+        self.temp_axis, self.wind_axis, self.precip_axis = self.axes
+        self.shape = (GROUP_COUNT, *(axis.size for axis in self.axes))
+
+        self.advice_texts = [text for _, text in advice_rules]
+        self.addon_texts = [text for _, text in addon_rules]
+        self.clothing_items = [items for _, items in clothing_rules]
+        if len(addon_rules) > 8 or len(clothing_rules) > 16:
+            raise ValueError("Not / kıyafet sayısı bit maskesine sığmıyor")
+
+        # İlk uyan tavsiye: henüz karar verilmemiş hücrelere sırayla yaz
+        # (len(advice_rules) = hiçbir kural uymadı)
+        self.advice = np.full(self.shape, len(advice_rules), dtype=np.int16)
+        decided = np.zeros(self.shape, dtype=bool)
+        for i, (cond, _) in enumerate(advice_rules):
+            mask = self._mask(cond) & ~decided
+            self.advice[mask] = i
+            decided |= mask
+
+        self.addons = np.zeros(self.shape, dtype=np.uint8)
+        for i, (cond, _) in enumerate(addon_rules):
+            self.addons[self._mask(cond)] |= 1 << i
+
+        # Parçaların sırası uyan kurallara göre değiştiği için (soğukta atkı kar botundan
+        # önce gelir, ılıkta sonra) hücrede parçalar değil uyan kurallar tutulur
+        self.clothing = np.zeros(self.shape, dtype=np.uint16)
+        for i, (cond, _) in enumerate(clothing_rules):
+            self.clothing[self._mask(cond)] |= 1 << i
+
+        self.table = self._build_table()
+
+    def _build_table(self):
+        """
+        Her hücrenin son hali: (tavsiye metni, kıyafet demeti). Metinler bir kez
+        birleştirilip intern edilir, aynı içerikli hücreler aynı nesneleri paylaşır;
+        sorgular yeni nesne üretmez. Kuralların kapsamadığı hücre varsa hata verir.
+        """
+        uncovered = np.argwhere(self.advice == len(self.advice_texts))
+        no_clothes = np.argwhere(self.clothing == 0)
+        for cells, what in ((uncovered, "tavsiye"), (no_clothes, "kıyafet")):
+            if len(cells):
+                g, t, w, p = cells[0]
+                raise ValueError(f"{len(cells)} hücre için {what} kuralı yok "
+                                 f"(ör. grup={g}, sıcaklık bandı={t}, rüzgar bandı={w}, yağış bandı={p})")
+
+        texts, outfits, table = {}, {}, []
+        for advice, addons, clothing in zip(self.advice.ravel().tolist(), self.addons.ravel().tolist(),
+                                            self.clothing.ravel().tolist()):
+            key = (advice, addons)
+            if key not in texts:
+                text = self.advice_texts[advice] + "".join(
+                    t for i, t in enumerate(self.addon_texts) if addons & (1 << i))
+                texts[key] = sys.intern(text)
+            if clothing not in outfits:
+                outfit = []
+                for i, items in enumerate(self.clothing_items):
+                    if clothing & (1 << i):
+                        outfit.extend(item for item in items if item not in outfit)
+                outfits[clothing] = tuple(outfit)
+            table.append((texts[key], outfits[clothing]))
+        return tuple(table)
+
+    def _mask(self, cond):
+        """Koşulun ızgaradaki doğru olduğu hücreler."""
+        unknown = set(cond) - {"group", *self.VARIABLES}
+        if unknown:
+            raise ValueError(f"Bilinmeyen koşul: {', '.join(sorted(unknown))}")
+        mask = np.ones(self.shape, dtype=bool)
+        if "group" in cond:
+            groups = cond["group"] if isinstance(cond["group"], tuple) else (cond["group"],)
+            in_group = np.zeros(GROUP_COUNT, dtype=bool)
+            in_group[list(groups)] = True
+            mask &= in_group.reshape(-1, *[1] * len(self.axes))
+        for dim, (name, axis) in enumerate(zip(self.VARIABLES, self.axes), 1):
+            # Eksenin doğruluk dizisi kendi boyutuna yerleştirilip diğerlerine yayılır
+            shape = [1] * len(self.shape)
+            shape[dim] = axis.size
+            for op, value in _comparisons(cond.get(name)):
+                mask &= axis.truth(op, value).reshape(shape)
+        return mask
+
+    # --- DEĞERLENDİRME ---
+    def evaluate(self, temps, cond_ids, winds, precips=None):
+        """
+        Tüm dilimler (ya da şehirler) için tek çağrıda hücre indeksleri döner.
+        Hücrenin sonucu ENGINE.table[hücre]'dedir. Yağış verilmezse 0 mm sayılır.
+        """
+        groups = condition_group(cond_ids)
+        if precips is None:
+            precips = np.zeros(np.shape(groups))
+        return np.ravel_multi_index((groups, self.temp_axis.bands(temps), self.wind_axis.bands(winds),
+                                     self.precip_axis.bands(precips)), self.shape)
+
+    def cell(self, temp, group, wind, precip=0.0):
+        """Tek bir dilimin hücresi (NumPy'sız, skaler yol)."""
+        _, temps, winds, precips = self.shape
+        return (((group * temps + self.temp_axis.band(temp)) * winds + self.wind_axis.band(wind)) * precips
+                + self.precip_axis.band(precip))
+
+    def lookup(self, temp, cond_id, wind, precip=0.0):
+        """(tavsiye, kıyafet demeti); önceden hazırlanmış tablodan, O(1)."""
+        return self.table[self.cell(temp, group_of(cond_id), wind, precip)]
+
+
+# Uygulamanın kullandığı derlenmiş kurallar
+ENGINE = RuleEngine()
@@ -0,0 +1,131 @@
+# advisor_cli.py
+"""
+Arayüzsüz (Qt yüklemeden) toplu tavsiye aracı.
+
+Şehir listesini dosyadan ya da stdin'den okur (satır başına bir şehir adı veya
+OWM şehir ID'si, '#' ile başlayan satırlar atlanır), tahminleri aynı anda çeker ve
+her şehir + dilim için bir JSON satırı yazar. Satırlar sonuç geldikçe yazılır;
+bellekte sadece o an işlenen şehirler durur.
+
+    python advisor_cli.py sehirler.txt > tavsiyeler.jsonl
+    cat sehirler.txt | python advisor_cli.py --concurrency 16 --stats
+"""
+import sys
+import json
+import time
+import argparse
+
+import config
+import perf_trace
+import weather_logic
+
+
+def read_cities(stream):
+    for line in stream:
+        city = line.strip()
+        if city and not city.startswith("#"):
+            yield city
+
+
+def slot_records(city, frame):
+    """Bir şehrin tüm dilimleri için yazılacak kayıtlar."""
+    metrics = weather_logic.get_derived_metrics(frame)
+    advice = weather_logic.advise_frame(frame, metrics)
+    apparent, dew = metrics.apparent.tolist(), metrics.dew_point.tolist()
+    for i in range(len(frame)):
+        slot = frame.slot(i)
+        text, clothing = advice[i]
+        yield {
+            "city": city,
+            "city_name": frame.city,
+            "city_id": frame.city_id,
+            "dt": slot["dt"],
+            "time": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(slot["dt"])),
+            "temp": slot["temp"],
+            "description": slot["desc"],
+            "wind_speed": slot["wind_speed"],
+            "wind_gust": slot["wind_gust"],
+            "rain": slot["rain"],
+            "snow": slot["snow"],
+            "apparent_temp": round(apparent[i], 1),
+            "dew_point": round(dew[i], 1),
+            "advice": text,
+            "clothing": clothing,
+        }
+
+
+def run(cities, out, concurrency=config.FETCH_CONCURRENCY, lang="tr", store=None):
+    """
+    Kayıtları `out` akışına yazar; (şehir, satır, hata) sayılarını döner.
+    `store` (ForecastStore) verilirse tahminler STORE_BATCH'lik gruplar halinde oraya da yazılır.
+    """
+    counts = {"cities": 0, "lines": 0, "errors": 0}
+    batch = []
+    for result in weather_logic.fetch_many(cities, concurrency=concurrency, lang=lang):
+        counts["cities"] += 1
+        if result.error is not None:
+            counts["errors"] += 1
+            out.write(json.dumps({"city": result.city, "error": type(result.error).__name__,
+                                  "message": str(result.error)}, ensure_ascii=False) + "\n")
+            continue
+        for record in slot_records(result.city, result.forecast):
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            counts["lines"] += 1
+        out.flush()
+        if store is not None:
+            batch.append(result.forecast)
+            if len(batch) >= config.STORE_BATCH:
+                store.ingest_many(batch)
+                batch = []
+    if store is not None and batch:
+        store.ingest_many(batch)
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Şehir listesi için JSONL hava durumu tavsiyeleri üretir.")
+    parser.add_argument("input", nargs="?", default="-", help="Şehir listesi dosyası ('-' = stdin)")
+    parser.add_argument("-o", "--output", default="-", help="Çıktı dosyası ('-' = stdout)")
+    parser.add_argument("--concurrency", type=int, default=config.FETCH_CONCURRENCY)
+    parser.add_argument("--lang", default="tr")
+    parser.add_argument("--no-disk-cache", action="store_true",
+                        help="Tahminleri diske yazma (sadece bellek önbelleği)")
+    parser.add_argument("--store", action="store_true", help="Tahminleri SQLite geçmişine de yaz")
+    parser.add_argument("--store-path", default=config.STORE_PATH,
+                        help="Geçmiş veritabanı (varsayılan: arayüzün kullandığı dosya)")
+    parser.add_argument("--stats", action="store_true", help="Bitince hız özetini stderr'e yaz")
+    args = parser.parse_args(argv)
+
+    if args.no_disk_cache:
+        weather_logic.forecast_cache.cache_dir = None
+
+    store = None
+    if args.store:
+        from forecast_store import ForecastStore
+        store = ForecastStore(args.store_path)
+
+    src = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    start = time.perf_counter()
+    try:
+        counts = run(read_cities(src), out, args.concurrency, args.lang, store)
+    finally:
+        if store is not None:
+            store.close()
+        if src is not sys.stdin:
+            src.close()
+        if out is not sys.stdout:
+            out.close()
+
+    if args.stats:
+        elapsed = time.perf_counter() - start
+        print(f"{counts['cities']} şehir, {counts['lines']} satır, {counts['errors']} hata, "
+              f"{elapsed:.2f} s ({counts['cities'] / elapsed:.1f} şehir/s, "
+              f"{counts['lines'] / elapsed:.0f} satır/s)", file=sys.stderr)
+        if perf_trace.is_enabled():  # AHD_PERF_TRACE=1 ile aşama süreleri de yazılır
+            print(perf_trace.format_table(), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
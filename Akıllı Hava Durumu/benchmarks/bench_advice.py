@@ -0,0 +1,154 @@
+# benchmarks/bench_advice.py
+"""
+Tavsiye + kıyafet seçimi: eski if/elif ve metin aramalı fonksiyonlar ile
+derlenmiş kural motorunun (advice_rules.ENGINE) sentetik dilimler üzerinde karşılaştırması.
+
+    python benchmarks/bench_advice.py --slots 1000000
+"""
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from advice_rules import ENGINE
+
+# Sentetik dilimlerde kullanılan OWM durumları ve Türkçe açıklamaları
+CONDITIONS = [(800, "açık"), (801, "az bulutlu"), (804, "kapalı"), (500, "hafif yağmur"),
+              (502, "şiddetli yağmur"), (521, "sağanak yağmur"), (600, "hafif kar"),
+              (601, "kar"), (701, "sisli"), (211, "gök gürültülü fırtına")]
+
+
+def legacy_advice(temp, desc, wind_speed):
+    """weather_logic'teki eski get_smart_advice'ın birebir kopyası (metinler kısaltıldı)."""
+    advice = ""
+    desc = desc.lower()
+    if "kar" in desc or "snow" in desc:
+        advice += "❄️ KAR YAĞIŞI\n\n"
+        advice += "🎒 İPUCU: kar"
+        return advice
+    elif "yağmur" in desc or "sağanak" in desc or "rain" in desc:
+        if temp < 12:
+            advice += "☔ SOĞUK YAĞMUR\n\n"
+            advice += "🎒 İPUCU: soğuk yağmur"
+        else:
+            advice += "🌦️ ILIK YAĞMUR\n\n"
+            advice += "🎒 İPUCU: ılık yağmur"
+    elif temp < 5:
+        advice += "🥶 KURU SOĞUK\n\n"
+        advice += "🎒 İPUCU: soğuk"
+    elif 5 <= temp <= 18:
+        advice += "☁️ SERİN HAVA\n\n"
+        advice += "🎒 İPUCU: serin"
+    elif 18 < temp <= 25:
+        advice += "🌤️ HARİKA HAVA\n\n"
+        advice += "🎒 İPUCU: harika"
+    elif 25 < temp <= 32:
+        advice += "☀️ SICAK\n\n"
+        advice += "🎒 İPUCU: sıcak"
+    elif temp > 32:
+        advice += "🔥 AŞIRI SICAK\n\n"
+        advice += "🎒 İPUCU: aşırı sıcak"
+    if wind_speed > 20:
+        advice += "\n\n🌬️ UYARI: rüzgar"
+    if advice == "":
+        advice = "Hava değişken olabilir, tedbirli olmakta fayda var!"
+    return advice
+
+
+def legacy_clothing(temp, desc):
+    """weather_logic'teki eski get_clothing_items'ın birebir kopyası."""
+    items = []
+    desc = desc.lower()
+    if temp < 5:
+        items.append("winter_coat")
+        items.append("scarf")
+    elif 5 <= temp < 15:
+        items.append("winter_coat")
+    elif 15 <= temp < 22:
+        items.append("jacket")
+    else:
+        items.append("tshirt")
+    if "snow" in desc or "kar" in desc:
+        items.append("snow_boots")
+        if "scarf" not in items:
+            items.append("scarf")
+    elif "rain" in desc or "yağmur" in desc or "sağanak" in desc:
+        items.append("raincoat")
+        items.append("umbrella")
+    if ("clear" in desc or "açık" in desc or "sun" in desc) and temp > 18:
+        items.append("sunglasses")
+    if temp > 25:
+        items.append("cap")
+    return items
+
+
+def synthetic_slots(n, seed=42):
+    rng = np.random.default_rng(seed)
+    temps = np.round(rng.uniform(-15, 42, n), 2).astype(np.float32)
+    winds = np.round(rng.gamma(2.0, 4.0, n), 2).astype(np.float32)
+    picks = rng.integers(0, len(CONDITIONS), n)
+    cond_ids = np.array([c for c, _ in CONDITIONS], dtype=np.int16)[picks]
+    descs = [CONDITIONS[i][1] for i in picks.tolist()]
+    return temps, cond_ids, winds, descs
+
+
+def timed(label, fn, n):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<26} {elapsed:8.3f} s   {n / elapsed / 1e6:7.2f} M dilim/s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--slots", type=int, default=1_000_000)
+    args = parser.parse_args()
+    n = args.slots
+    temps, cond_ids, winds, descs = synthetic_slots(n)
+
+    def legacy():
+        for t, d, w in zip(temps.tolist(), descs, winds.tolist()):
+            legacy_advice(t, d, w)
+            legacy_clothing(t, d)
+
+    def decide():
+        ENGINE.evaluate(temps, cond_ids, winds)
+
+    def decide_and_render():
+        table = ENGINE.table
+        for cell in ENGINE.evaluate(temps, cond_ids, winds).tolist():
+            table[cell]
+
+    scalar_args = list(zip(temps.tolist(), cond_ids.tolist(), winds.tolist()))
+
+    def scalar():
+        lookup = ENGINE.lookup
+        for t, c, w in scalar_args:
+            lookup(t, c, w)
+
+    old = timed("eski (if/elif + metin)", legacy, n)
+    new = timed("motor: karar", decide, n)
+    full = timed("motor: karar + metin", decide_and_render, n)
+    one = timed("motor: tek tek lookup()", scalar, n)
+    print(f"hızlanma: karar x{old / new:.1f}, metin dahil x{old / full:.1f}, tek tek x{old / one:.1f}")
+
+    # Sorgu başına bellek ayırma: tablo hazır nesneleri döndürdüğü için ~0 olmalı
+    sample = scalar_args[:100_000]
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for t, c, w in sample:
+        ENGINE.lookup(t, c, w)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    grown = sum(d.size_diff for d in after.compare_to(before, "filename")
+                if d.traceback[0].filename.endswith("advice_rules.py"))
+    print(f"{len(sample)} lookup() sonrası advice_rules.py'de artan bellek: {grown} bayt")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# benchmarks/bench_charts.py
+"""
+Gün değiştirme çizim süresi: eski "clear() + her şeyi yeniden yarat" yöntemi ile
+ChartRenderer'ın artist'leri yerinde güncellemesini karşılaştırır.
+Qt gerekmez; uygulamadaki figürün aynısı Agg üzerinde çizilir.
+
+    python benchmarks/bench_charts.py --rounds 50
+"""
+import os
+import sys
+import time
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+import config
+from chart_renderer import ChartRenderer
+from forecast_frame import ForecastFrame
+from owm_stub import make_forecast
+
+
+def make_figure():
+    fig = Figure(figsize=(6, 6), dpi=90)
+    ax_rain, ax_temp, ax_wind = fig.subplots(3, 1, sharex=True)
+    fig.subplots_adjust(top=0.92, bottom=0.1, hspace=0.5)
+    for ax in (ax_rain, ax_temp, ax_wind):
+        ax.tick_params(axis='x', colors='white', labelsize=9)
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        ax.spines['left'].set_visible(False)
+        ax.get_yaxis().set_visible(False)
+    return FigureCanvasAgg(fig), ax_rain, ax_temp, ax_wind
+
+
+def legacy_draw(canvas, ax_rain, ax_temp, ax_wind, times, temps, rains, winds, wind_degs):
+    """main.py'deki eski draw_charts'ın birebir kopyası (karşılaştırma için)."""
+    temps, rains, winds = list(temps), list(rains), list(winds)
+    ax_rain.clear()
+    ax_temp.clear()
+    ax_wind.clear()
+    ax_rain.tick_params(labelbottom=True)
+    ax_temp.tick_params(labelbottom=True)
+    ax_rain.set_title("Yağış İhtimali (%)", loc='left', color=config.RAIN_COLOR, fontsize=10, fontweight='bold', pad=10)
+    ax_temp.set_title("Sıcaklık (°C)", loc='left', color=config.ACCENT, fontsize=10, fontweight='bold', pad=10)
+    ax_wind.set_title("Rüzgar (km/s)", loc='left', color=config.WIND_COLOR, fontsize=10, fontweight='bold', pad=10)
+    bars = ax_rain.bar(times, rains, color=config.RAIN_COLOR, alpha=0.7, width=0.5)
+    ax_rain.set_ylim(0, 115)
+    for bar in bars:
+        height = bar.get_height()
+        if height > 0:
+            ax_rain.text(bar.get_x() + bar.get_width()/2., height + 1,
+                         f'%{int(height)}', ha='center', va='bottom', color='white', fontsize=8)
+    ax_temp.plot(times, temps, color=config.ACCENT, linewidth=3, marker='o', markerfacecolor='white')
+    ax_temp.fill_between(times, temps, min(temps)-5, color=config.ACCENT, alpha=0.2)
+    ax_temp.set_ylim(min(temps)-2, max(temps)+2)
+    for i, t in enumerate(temps):
+        ax_temp.annotate(f"{t:.0f}°", (times[i], t), xytext=(0, 10),
+                         textcoords="offset points", ha='center', color='white', fontweight='bold', fontsize=9)
+    ax_wind.plot(times, winds, color=config.WIND_COLOR, linewidth=2)
+    ax_wind.set_ylim(min(winds)-1, max(winds)+5)
+    for i, w in enumerate(winds):
+        ax_wind.annotate(f"{w:.0f}", (times[i], w), xytext=(0, -15),
+                         textcoords="offset points", ha='center', color='white', fontsize=9)
+        ax_wind.annotate("⬇", (times[i], w), xytext=(0, 15), textcoords="offset points",
+                         color=config.WIND_COLOR, ha='center', va='center', fontsize=14, rotation=-wind_degs[i])
+    canvas.draw()
+
+
+def measure(label, draw_day, days, rounds):
+    samples = []
+    for r in range(rounds):
+        day = days[r % len(days)]
+        start = time.perf_counter()
+        draw_day(day)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"{label:<12} medyan {statistics.median(samples):7.2f} ms   p95 {p95:7.2f} ms")
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    frame = ForecastFrame.from_json(make_forecast("İstanbul"))
+    days = [frame.day_series(d) for d in range(frame.day_count)]
+    series = lambda d: (d["times"], d["temps"], d["rains"], d["winds"], d["degs"])
+
+    canvas, *axes = make_figure()
+    old = measure("eski", lambda d: legacy_draw(canvas, *axes, *series(d)), days, args.rounds)
+
+    canvas, *axes = make_figure()
+    renderer = ChartRenderer(*axes)
+
+    def incremental(d):
+        renderer.update(*series(d))
+        canvas.draw()  # Uygulamada draw_idle; burada ölçmek için hemen çiz
+
+    new = measure("artımlı", incremental, days, args.rounds)
+    print(f"hızlanma x{old / new:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# benchmarks/bench_cities.py
+"""
+Şehir dizini (city_index): OWM listesi boyutunda (--cities, varsayılan 200 bin)
+sentetik bir listeyle dizin kurulur ve ölçülür:
+
+  prefix   yazılan ilk 2-8 harfle öneri (CityIndex.search, önek bulunan sorgular)
+  typo     tek harfi bozulmuş (silme / ekleme / değiştirme / yer değiştirme) adla öneri
+  resolve  tam adın şehir ID'sine çevrilmesi
+
+Ayrıca dizin dosyasının boyutu ve açılıştan sonra binlerce aramada Python
+tarafında ayrılan kalıcı bellek (tracemalloc) yazılır.
+
+    python benchmarks/bench_cities.py --cities 200000
+    python benchmarks/bench_cities.py --source city.list.json.gz   # gerçek OWM listesiyle
+"""
+import os
+import sys
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import statistics
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import city_index
+
+CONSONANTS = "bcçdfghjklmnprsştvyz"
+VOWELS = "aeıioöuü"
+COUNTRIES = ["TR", "DE", "US", "FR", "IT", "ES", "GB", "RU", "BR", "IN", "CN", "JP", "MX", "PL", "NL"]
+
+
+def word(rnd, syllables):
+    """Ünsüz + ünlü (+ ünsüz) hecelerinden yer adına benzer bir kelime."""
+    return "".join(rnd.choice(CONSONANTS) + rnd.choice(VOWELS) + (rnd.choice(CONSONANTS) if rnd.random() < 0.4 else "")
+                   for _ in range(syllables)).capitalize()
+
+
+def synthetic_cities(count, rnd):
+    cities = []
+    for i in range(count):
+        name = word(rnd, rnd.randint(2, 4))
+        if rnd.random() < 0.15:
+            name += " " + word(rnd, 2)
+        country = "TR" if rnd.random() < 0.05 else rnd.choice(COUNTRIES)
+        cities.append({"id": 100000 + i, "name": name, "country": country, "state": ""})
+    return cities
+
+
+def typo(word, rnd):
+    i = rnd.randrange(1, len(word))  # İlk harf doğru (dizin de bunu varsayar)
+    kind = rnd.choice("dist")
+    if kind == "d":
+        return word[:i] + word[i + 1:]
+    if kind == "i":
+        return word[:i] + rnd.choice("aeiklmnrst") + word[i:]
+    if kind == "s":
+        return word[:i] + rnd.choice("aeiklmnrst") + word[i + 1:]
+    if i < len(word) - 1:
+        return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    return word[:i]
+
+
+def timed(fn, queries):
+    samples = []
+    for q in queries:
+        start = time.perf_counter()
+        fn(q)
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cities", type=int, default=200000)
+    parser.add_argument("--source", help="Sentetik liste yerine OWM city.list.json(.gz)")
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+
+    rnd = random.Random(7)
+    cities = city_index.read_city_list(args.source) if args.source else synthetic_cities(args.cities, rnd)
+    work = tempfile.mkdtemp(prefix="ahd_cities_")
+    try:
+        path = os.path.join(work, "cities.idx")
+        start = time.perf_counter()
+        count, size = city_index.build_index(path, cities)
+        print(f"{count} şehir, dizin {size / 2**20:.1f} MiB, kurulum {time.perf_counter() - start:.1f} s")
+
+        start = time.perf_counter()
+        index = city_index.CityIndex(path)
+        opened = (time.perf_counter() - start) * 1000
+        names = [c["name"] for c in rnd.sample(cities, args.queries)]
+        prefixes = [n[:rnd.randint(2, min(8, len(n)))] for n in names]
+        typos = [(typo(n, rnd), n) for n in names if len(n) >= 5]
+        queries = {"prefix": prefixes, "typo": [q for q, _ in typos], "resolve": names}
+        results = {"prefix": timed(index.search, prefixes), "typo": timed(index.search, queries["typo"]),
+                   "resolve": timed(index.resolve, names)}
+
+        # Bellek ayrı bir geçişte: tracemalloc açıkken süreler anlamsızlaşır
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        for name, fn in (("prefix", index.search), ("typo", index.search), ("resolve", index.resolve)):
+            for q in queries[name]:
+                fn(q)
+        retained = tracemalloc.get_traced_memory()[0] - baseline
+        tracemalloc.stop()
+
+        found = sum(1 for q, n in typos if any(m.label.startswith(n + ",") for m in index.search(q)))
+        print(f"açılış {opened:.2f} ms; aramalardan sonra kalıcı Python belleği {retained / 1024:.1f} KiB")
+        print(f"{'sorgu':<10}{'n':>6}{'medyan µs':>12}{'p95 µs':>10}{'en çok µs':>12}")
+        for name, samples in results.items():
+            print(f"{name:<10}{len(samples):>6}{statistics.median(samples):>12.1f}"
+                  f"{samples[int(len(samples) * 0.95) - 1]:>10.1f}{samples[-1]:>12.1f}")
+        print(f"hatalı yazımda doğru şehir önerilerde: %{100 * found / len(typos):.0f}")
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
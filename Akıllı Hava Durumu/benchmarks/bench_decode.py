@@ -0,0 +1,127 @@
+# benchmarks/bench_decode.py
+"""
+/forecast cevabının çözülmesi: eski yol (gövdenin tamamı + json.loads ile sözlük
+ağacı + ForecastFrame.from_json, ham sözlük önbellekte tutulur) ile akış çözücünün
+(forecast_stream.decode_forecast, sadece ForecastFrame tutulur) karşılaştırması.
+
+Ölçümden önce akış çözücünün doğruluğu denetlenir: tek bir gövde 1'den gövde
+boyuna kadar her parça boyuyla çözülüp ForecastFrame.from_json ile karşılaştırılır
+(parça sınırı bir sayının ortasına, "0." ya da "1e"nin hemen ardına da düşer).
+
+Ölçülenler:
+  - şehir başına çözme süresi ve saniyede şehir
+  - tek cevabın çözülmesi sırasındaki en yüksek bellek (tracemalloc)
+  - toplu alımda (--cities şehir, önbellekte en fazla CACHE_MAX_ITEMS) kalıcı ve en yüksek bellek
+
+    python benchmarks/bench_decode.py --cities 2000
+"""
+import os
+import sys
+import gc
+import json
+import time
+import argparse
+import tracemalloc
+from collections import OrderedDict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import config
+from forecast_frame import ForecastFrame
+from forecast_stream import decode_forecast
+from owm_stub import make_forecast
+
+
+def chunked(body, size=config.HTTP_CHUNK_SIZE):
+    return (body[i:i + size] for i in range(0, len(body), size))
+
+
+def legacy_decode(body):
+    """Eski yol: response.content + response.json() + from_json; ikisi de önbellekte kalırdı."""
+    data = json.loads(b"".join(chunked(body)))
+    return data, ForecastFrame.from_json(data)
+
+
+def stream_decode(body):
+    return None, decode_forecast(chunked(body))
+
+
+def check_chunk_sizes(body):
+    """Gövdeyi her parça boyuyla çözer; from_json'dan farklı çıkan boyları döner."""
+    expected = ForecastFrame.from_json(json.loads(body)).to_columns()
+    failed = []
+    for size in range(1, len(body) + 1):
+        try:
+            got = decode_forecast(chunked(body, size)).to_columns()
+        except ValueError:
+            failed.append(size)
+            continue
+        if got.keys() != expected.keys() or any(got[k] != expected[k] for k in expected):
+            failed.append(size)
+    return failed
+
+
+def throughput(decode, bodies, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for body in bodies:
+            decode(body)
+    elapsed = time.perf_counter() - start
+    return elapsed / (rounds * len(bodies)) * 1e6
+
+
+def single_peak(decode, body):
+    gc.collect()
+    tracemalloc.start()
+    decode(body)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def bulk_memory(decode, bodies, max_items):
+    """Önbelleğin LRU davranışıyla toplu alım: (kalıcı bayt, en yüksek bayt)."""
+    gc.collect()
+    tracemalloc.start()
+    cache = OrderedDict()
+    for i, body in enumerate(bodies):
+        data, frame = decode(body)
+        cache[i] = (data, frame)
+        if len(cache) > max_items:
+            cache.popitem(last=False)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cities", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    bodies = [json.dumps(make_forecast(f"Şehir {i}"), ensure_ascii=False).encode("utf-8")
+              for i in range(args.cities)]
+    print(f"{args.cities} şehir, ortalama gövde {sum(map(len, bodies)) / len(bodies) / 1024:.1f} KiB")
+
+    sample = make_forecast("Kocaeli")
+    sample["message"] = 0.0077  # OWM'nin gerçek cevaplarındaki gibi ondalıklı bir sayı
+    sample["list"][0]["main"]["temp"] = 1.5e-05
+    failed = check_chunk_sizes(json.dumps(sample).encode("utf-8"))
+    if failed:
+        print(f"akış çözücü {len(failed)} parça boyunda yanlış çözdü (ilkleri: {failed[:10]})")
+        sys.exit(1)
+    print("akış çözücü: her parça boyunda from_json ile aynı")
+
+    paths = [("eski (json.loads)", legacy_decode), ("akış (decode_forecast)", stream_decode)]
+    print(f"{'yol':<24}{'µs/şehir':>10}{'şehir/s':>10}{'tek tepe KiB':>14}"
+          f"{'toplu kalıcı MiB':>18}{'toplu tepe MiB':>16}")
+    for name, decode in paths:
+        per_city = throughput(decode, bodies[:200], args.rounds)
+        peak_one = single_peak(decode, bodies[0])
+        current, peak = bulk_memory(decode, bodies, config.CACHE_MAX_ITEMS)
+        print(f"{name:<24}{per_city:10.1f}{1e6 / per_city:10.0f}{peak_one / 1024:14.1f}"
+              f"{current / 2**20:18.1f}{peak / 2**20:16.1f}")
+
+
+if __name__ == "__main__":
+    main()
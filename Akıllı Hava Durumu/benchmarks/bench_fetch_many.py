@@ -0,0 +1,42 @@
+# benchmarks/bench_fetch_many.py
+"""
+fetch_many'nin seri döngüye göre hızlanmasını yerel taklit sunucuya karşı ölçer.
+
+    python benchmarks/bench_fetch_many.py --cities 200 --latency 0.05
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from owm_stub import start_stub, point_config_at
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cities", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    server, base = start_stub(latency=args.latency)
+    point_config_at(base)
+    import weather_logic
+    from forecast_cache import ForecastCache
+
+    cities = [f"Şehir {i}" for i in range(args.cities)]
+    baseline = None
+    for concurrency in args.concurrency:
+        weather_logic.forecast_cache = ForecastCache(cache_dir=None)  # Her turda soğuk önbellek
+        start = time.perf_counter()
+        failed = sum(1 for r in weather_logic.fetch_many(cities, concurrency=concurrency) if r.error)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"concurrency={concurrency:3d}  {elapsed:7.2f} s  "
+              f"hızlanma x{baseline / elapsed:5.2f}  hata={failed}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
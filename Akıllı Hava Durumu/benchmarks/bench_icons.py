@@ -0,0 +1,83 @@
+# benchmarks/bench_icons.py
+"""
+İkon gösterimi: eski yol (disk önbelleğinden PNG -> PIL çözme -> LANCZOS ->
+ImageQt -> QPixmap, ikon başına) ile ikon atlası (mmap -> tek QPixmap -> dikdörtgen
+kopyası) karşılaştırması. Atlas yerel OWM taklidinin ikonlarından oluşturulur.
+
+    python benchmarks/bench_icons.py --dpr 1.5
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from owm_stub import start_stub, point_config_at
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dpr", type=float, default=1.0, help="Ekranın piksel oranı")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    server, base = start_stub()
+    data_dir = tempfile.mkdtemp(prefix="ahd_icons_")
+    point_config_at(base, data_dir)
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication(sys.argv)
+    import config
+    import icon_atlas
+    from icon_cache import IconCache
+
+    try:
+        start = time.perf_counter()
+        count, size = icon_atlas.build_atlas(config.ICON_ATLAS_PATH)
+        print(f"atlas: {count} ikon, {size / 2**20:.1f} MiB, oluşturma {time.perf_counter() - start:.2f} s")
+
+        legacy = IconCache(atlas_path=None)
+        keys = legacy.prewarm_keys(args.dpr)
+        for key in keys:
+            legacy.load_image(key)  # Disk katmanını doldur; ölçüme ağ girmesin
+
+        start = time.perf_counter()
+        for _ in range(args.rounds):
+            for key in keys:
+                legacy.put_image(key, legacy.load_image(key))
+        old = (time.perf_counter() - start) / (args.rounds * len(keys)) * 1e6
+
+        start = time.perf_counter()
+        cache = IconCache()
+        cache.get_pixmap(keys[0])
+        first = (time.perf_counter() - start) * 1000
+
+        samples = []
+        for _ in range(args.rounds):
+            cache = IconCache(max_items=0)  # Bellek katmanı boş: her ikon atlastan kesilsin
+            cache.get_pixmap(keys[0])       # Şeridi hazırla
+            start = time.perf_counter()
+            for key in keys:
+                cache.get_pixmap(key)
+            samples.append(time.perf_counter() - start)
+        new = sum(samples) / (args.rounds * len(keys)) * 1e6
+
+        hits_before = server.hits
+        cache = IconCache()
+        assert all(cache.get_pixmap(key) is not None for key in keys)
+        assert not cache.prewarm_keys(args.dpr)
+        print(f"{len(keys)} ikon, dpr={args.dpr}")
+        print(f"eski yol (PNG çöz + boyutlandır)   {old:9.1f} µs/ikon")
+        print(f"atlas (dikdörtgen kopyası)         {new:9.1f} µs/ikon   x{old / new:.0f}")
+        print(f"atlas açılışı + ilk ikon           {first:9.2f} ms")
+        print(f"atlas varken ikonlar için ağ isteği: {server.hits - hits_before}")
+    finally:
+        server.shutdown()
+        shutil.rmtree(data_dir, ignore_errors=True)
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# benchmarks/bench_interp.py
+"""
+Grafiklerin saatlik ara değerlemesinin (forecast_interp) işlemci maliyeti:
+
+  soğuk       bir şehrin tüm dilimlerinin sıklaştırılması (özet + PCHIP + yön)
+  önbellek    aynı veriyle tekrar istenmesi (sadece özet ve LRU)
+  gün serisi  gün değişiminde grafiğe giden serinin hazırlanması (önbellekten)
+  çizim       bir günün grafiği, ham 3 saatlik seriyle ve saatlik seriyle
+
+Ağ kullanılmaz; veriler owm_stub'ın ürettiği tahminlerdir.
+
+    python benchmarks/bench_interp.py --cities 500 --rounds 30
+"""
+import os
+import sys
+import time
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import forecast_interp
+from chart_renderer import ChartRenderer
+from forecast_frame import ForecastFrame
+from owm_stub import make_forecast
+from bench_charts import make_figure
+
+
+def timed_us(fn, items, rounds):
+    """Öğe başına medyan süre (µs)."""
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for item in items:
+            fn(item)
+        samples.append((time.perf_counter() - start) / len(items) * 1e6)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cities", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=30)
+    args = parser.parse_args()
+
+    frames = [ForecastFrame.from_json(make_forecast(f"Şehir {i}")) for i in range(args.cities)]
+    for f in frames:
+        f.slot_hashes()  # Uygulamada frame kurulurken zaten hesaplanmış olur
+    step = forecast_interp.config.INTERP_STEP_SECONDS
+    series = forecast_interp.CACHE.upsample(frames[0])
+    print(f"{args.cities} şehir, şehir başına {len(frames[0])} dilim -> {len(series.dt)} nokta "
+          f"({step // 60} dk aralık)")
+
+    cold = timed_us(lambda f: forecast_interp.InterpCache(max_items=1).upsample(f), frames, 3)
+    build = timed_us(lambda f: forecast_interp._build(f, step), frames, 3)
+    cache = forecast_interp.InterpCache(max_items=args.cities)
+    for f in frames:
+        cache.upsample(f)
+    hit = timed_us(cache.upsample, frames, args.rounds)
+    days = [(f, d) for f in frames[:50] for d in range(f.day_count)]
+    forecast_interp.CACHE.max_items = len(frames)
+    day = timed_us(lambda item: forecast_interp.day_series(*item), days, args.rounds)
+    raw_day = timed_us(lambda item: item[0].day_series(item[1]), days, args.rounds)
+
+    print(f"{'adım':<34}{'µs':>10}")
+    for name, value in (("soğuk (şehir başına)", cold), ("  sadece ara değerleme", build),
+                        ("önbellekten (şehir başına)", hit), ("gün serisi, ham", raw_day),
+                        ("gün serisi, saatlik (önbellekten)", day)):
+        print(f"{name:<34}{value:10.1f}")
+
+    # Çizim: aynı günler ham ve saatlik serilerle
+    frame = frames[0]
+    interp_days = [forecast_interp.day_series(frame, d) for d in range(frame.day_count)]
+    for label, hourly in (("çizim, ham", False), ("çizim, saatlik", True)):
+        canvas, *axes = make_figure()
+        renderer = ChartRenderer(*axes)
+
+        def draw(d):
+            extra = (d["x"], d["hourly"]) if hourly else ()
+            renderer.update(d["times"], d["temps"], d["rains"], d["winds"], d["degs"], *extra)
+            canvas.draw()
+
+        print(f"{label:<34}{timed_us(draw, interp_days, max(3, args.rounds // 5)) / 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+# benchmarks/bench_metrics.py
+"""
+Türetilmiş ölçülerin (derived_metrics) toplu hesabı: --cities şehir x 40 dilim için
+çiy noktası, sıcaklık endeksi, rüzgar soğuğu, hissedilen sıcaklık, günlük yağış
+toplamları ve en sert hamleler. Karşılaştırma için aynı formüllerin dilim dilim
+Python döngüsüyle hesabı (--loop-cities şehirde ölçülüp ölçeklenir) da yazılır.
+
+    python benchmarks/bench_metrics.py --cities 10000
+"""
+import os
+import sys
+import math
+import time
+import argparse
+import statistics
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import derived_metrics
+from advice_rules import ENGINE
+from forecast_frame import ForecastFrame
+
+SLOTS = 40
+
+
+def synthetic_frames(count, seed=0):
+    """Rastgele ama gerçekçi aralıklarda sütunlarla ForecastFrame'ler (owm_stub'dan çok daha hızlı)."""
+    rnd = np.random.default_rng(seed)
+    start = int(time.time()) // 10800 * 10800
+    dt = (start + np.arange(SLOTS) * 10800).tolist()
+    frames = []
+    temps = rnd.uniform(-25, 42, (count, 1)) + rnd.uniform(-4, 4, (count, SLOTS))
+    humidity = rnd.integers(5, 101, (count, SLOTS))
+    wind = rnd.uniform(0, 25, (count, SLOTS))
+    gust = wind + rnd.uniform(0, 10, (count, SLOTS))
+    wet = rnd.random((count, SLOTS)) < 0.3
+    rain = np.where(wet & (temps > 1), rnd.uniform(0.1, 12, (count, SLOTS)), 0)
+    snow = np.where(wet & (temps <= 1), rnd.uniform(0.1, 6, (count, SLOTS)), 0)
+    cond = np.where(rain > 0, 500, np.where(snow > 0, 600, 800))
+    zeros = [0] * SLOTS
+    for i in range(count):
+        frames.append(ForecastFrame.from_columns({
+            "city": f"Şehir {i}", "city_id": i, "dt": dt, "temp": temps[i], "feels_like": temps[i],
+            "humidity": humidity[i], "pressure": zeros, "visibility": zeros, "pop": zeros,
+            "wind_speed": wind[i], "wind_deg": zeros, "cond_id": cond[i], "wind_gust": gust[i],
+            "rain": rain[i], "snow": snow[i], "icon": ["01d"] * SLOTS, "desc": ["açık"] * SLOTS}))
+    return frames
+
+
+def loop_metrics(frame):
+    """Aynı hesapların dilim dilim, saf Python hali (sadece karşılaştırma için)."""
+    slots, daily = [], []
+    temps, hums = frame.temp.tolist(), frame.humidity.tolist()
+    winds, gusts = frame.wind_speed.tolist(), frame.wind_gust.tolist()
+    rains, snows = frame.rain.tolist(), frame.snow.tolist()
+    for i in range(len(temps)):
+        t, rh, w = temps[i], max(1, min(100, hums[i])), winds[i]
+        g = math.log(rh / 100) + 17.625 * t / (243.04 + t)
+        dew = 243.04 * g / (17.625 - g)
+        f = t * 1.8 + 32
+        hi = 0.5 * (f + 61 + (f - 68) * 1.2 + rh * 0.094)
+        if (hi + f) / 2 >= 80:
+            hi = (-42.379 + 2.04901523 * f + 10.14333127 * rh - 0.22475541 * f * rh - 0.00683783 * f * f
+                  - 0.05481717 * rh * rh + 0.00122874 * f * f * rh + 0.00085282 * f * rh * rh
+                  - 0.00000199 * f * f * rh * rh)
+        hi = (hi - 32) / 1.8
+        v = w * 3.6
+        wc = 13.12 + 0.6215 * t - 11.37 * v ** 0.16 + 0.3965 * t * v ** 0.16 if t <= 10 and v > 4.8 else t
+        apparent = wc if t <= 10 else (hi if t >= 26.7 else t)
+        slots.append((dew, hi, wc, apparent))
+    for d in range(frame.day_count):
+        s = frame.day_slice(d)
+        daily.append((sum(rains[s]) + sum(snows[s]), max(max(winds[s]), max(gusts[s]))))
+    return slots, daily
+
+
+def _day_starts(frames):
+    """Şehirlerin gün başlangıçlarının düz dizideki yerleri."""
+    bases = np.concatenate([[0], np.cumsum([len(f) for f in frames])[:-1]]).tolist()
+    return np.concatenate([f.day_offsets[:-1] + base for f, base in zip(frames, bases)])
+
+
+def timed(fn, rounds):
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), min(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cities", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--loop-cities", type=int, default=500, help="Python döngüsünün ölçüldüğü şehir sayısı")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    frames = synthetic_frames(args.cities)
+    print(f"{args.cities} şehir x {SLOTS} dilim hazırlandı ({time.perf_counter() - start:.1f} s)")
+
+    metrics = derived_metrics.compute(frames)
+    flat = {name: np.concatenate([getattr(f, name) for f in frames])
+            for name in ("temp", "humidity", "wind_speed", "wind_gust", "rain", "snow", "cond_id")}
+    day_starts = _day_starts(frames)
+
+    def arrays_only():
+        derived_metrics.compute_arrays(flat["temp"], flat["humidity"], flat["wind_speed"], flat["wind_gust"],
+                                       flat["rain"], flat["snow"], metrics.slot_offsets, metrics.day_offsets,
+                                       day_starts)
+
+    def with_advice():
+        m = derived_metrics.compute(frames)
+        ENGINE.evaluate(m.apparent, flat["cond_id"], m.wind_peak, m.precip)
+
+    subset = frames[:args.loop_cities]
+    loop_ms, _ = timed(lambda: [loop_metrics(f) for f in subset], 1)
+    loop_ms *= len(frames) / max(1, len(subset))
+
+    rows = [
+        ("compute (frame listesinden)", timed(lambda: derived_metrics.compute(frames), args.rounds)),
+        ("compute_arrays (sadece dizi geçişi)", timed(arrays_only, args.rounds)),
+        ("compute + kural motoru", timed(with_advice, args.rounds)),
+    ]
+    print(f"{'yol':<38}{'medyan ms':>11}{'en iyi ms':>11}")
+    for name, (median, best) in rows:
+        print(f"{name:<38}{median:11.1f}{best:11.1f}")
+    print(f"{'Python döngüsü (ölçeklenmiş)':<38}{loop_ms:11.1f}")
+    total = rows[0][1][0]
+    print(f"{args.cities * SLOTS / total * 1000 / 1e6:.1f} milyon dilim/s; "
+          f"1 saniye sınırı: {'geçti' if total < 1000 else 'KALDI'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+# benchmarks/bench_service.py
+"""
+forecast_service için yük testi. Yerel OWM taklidi (owm_stub) bu süreçte, servis
+ayrı bir süreçte çalışır; istemciler --procs süreçte toplam --connections keep-alive
+bağlantıyla --duration saniye boyunca --cities şehir arasında döner.
+
+Aşamalar:
+  soğuk   her şehir bir kez (OWM'ye gidilir, cevaplar hazırlanır)
+  sıcak   gzip kabul eden, koşulsuz GET'ler (200)
+  304     If-None-Match ile yeniden doğrulama
+
+Her aşama için istek/s, gecikme (medyan / p99) ve durum kodları yazılır; sonunda
+taklit sunucuya giden istek sayısı şehir sayısına eşit olmalıdır (şehir başına,
+tahmin dilimi başına tek OWM çağrısı). Son olarak birkaç şehrin tahmini imperial ve
+standard birimlerle de istenir: aynı hava her birimde aynı tavsiye ve kıyafetleri
+vermelidir.
+
+    python benchmarks/bench_service.py --cities 50 --connections 64 --duration 5
+"""
+import os
+import sys
+import gzip
+import json
+import time
+import shutil
+import asyncio
+import argparse
+import tempfile
+import statistics
+import subprocess
+from collections import Counter
+from multiprocessing import Pool
+from urllib.parse import quote
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, APP_DIR)
+from owm_stub import start_stub
+
+SERVICE_SCRIPT = r"""
+import sys
+sys.path.insert(0, sys.argv[1])
+from owm_stub import point_config_at
+point_config_at(sys.argv[2], sys.argv[3])
+import forecast_service
+sys.exit(forecast_service.main(sys.argv[4:]))
+"""
+
+
+async def request(reader, writer, path, headers=""):
+    """Tek istek; (durum, başlıklar, gövde) döner."""
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: bench\r\n{headers}\r\n".encode("latin-1"))
+    head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+    fields = {}
+    for line in head[1:]:
+        name, _, value = line.partition(":")
+        if name:
+            fields[name.lower()] = value.strip()
+    length = int(fields.get("content-length", 0))
+    body = await reader.readexactly(length) if length else b""
+    return int(head[0].split(" ")[1]), fields, body
+
+
+async def client_loop(host, port, paths, etags, deadline, offset):
+    reader, writer = await asyncio.open_connection(host, port)
+    statuses, latencies, received = Counter(), [], 0
+    i = offset
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        headers = "Accept-Encoding: gzip\r\n"
+        if etags:
+            headers += f"If-None-Match: {etags[path]}\r\n"
+        start = time.perf_counter()
+        status, _, body = await request(reader, writer, path, headers)
+        latencies.append(time.perf_counter() - start)
+        statuses[status] += 1
+        received += len(body)
+    writer.close()
+    return statuses, latencies, received
+
+
+def run_clients(args):
+    """Bir istemci süreci: `connections` bağlantıyı aynı olay döngüsünde sürer."""
+    host, port, paths, etags, duration, connections, seed = args
+
+    async def run():
+        deadline = time.perf_counter() + duration
+        return await asyncio.gather(*[client_loop(host, port, paths, etags, deadline, seed * 997 + c * 31)
+                                      for c in range(connections)])
+
+    statuses, latencies, received = Counter(), [], 0
+    for s, lat, n in asyncio.run(run()):
+        statuses.update(s)
+        latencies.extend(lat)
+        received += n
+    return statuses, latencies, received
+
+
+def load(host, port, paths, etags, args):
+    per_proc = max(1, args.connections // args.procs)
+    jobs = [(host, port, paths, etags, args.duration, per_proc, p) for p in range(args.procs)]
+    start = time.perf_counter()
+    with Pool(args.procs) as pool:
+        parts = pool.map(run_clients, jobs)
+    elapsed = time.perf_counter() - start
+    statuses, latencies, received = Counter(), [], 0
+    for s, lat, n in parts:
+        statuses.update(s)
+        latencies.extend(lat)
+        received += n
+    return statuses, sorted(latencies), received, min(elapsed, args.duration + 0.5)
+
+
+async def warm(host, port, paths):
+    """Soğuk aşama: her şehri aynı anda bir kez ister, ETag'leri toplar ve bir gövdeyi doğrular."""
+    async def one(path):
+        reader, writer = await asyncio.open_connection(host, port)
+        start = time.perf_counter()
+        status, fields, body = await request(reader, writer, path, "Accept-Encoding: gzip\r\n")
+        elapsed = time.perf_counter() - start
+        writer.close()
+        return path, status, fields, body, elapsed
+
+    results = await asyncio.gather(*[one(p) for p in paths])
+    _, status, fields, body, _ = results[0]
+    if fields.get("content-encoding") == "gzip":
+        body = gzip.decompress(body)
+    document = json.loads(body)
+    assert status == 200 and document["days"] and document["days"][0]["slots"], document
+    etags = {path: fields.get("etag") for path, _, fields, _, _ in results}
+    return etags, [r[1] for r in results], [r[4] for r in results]
+
+
+async def advice_by_units(host, port, cities):
+    """Şehirlerin her birimdeki tavsiyeleri: birim -> [(tavsiye, kıyafetler), ...]."""
+    async def one(city, units):
+        reader, writer = await asyncio.open_connection(host, port)
+        _, _, body = await request(reader, writer, f"/forecast?city={quote(city)}&units={units}")
+        writer.close()
+        days = json.loads(body)["days"]
+        return [(day["advice"], day["clothing"]) for day in days] + \
+               [(slot["advice"], slot["clothing"]) for day in days for slot in day["slots"]]
+
+    units = ("metric", "imperial", "standard")
+    results = await asyncio.gather(*[one(city, u) for u in units for city in cities])
+    return {u: results[i * len(cities):(i + 1) * len(cities)] for i, u in enumerate(units)}
+
+
+def report(name, statuses, latencies, received, elapsed):
+    total = sum(statuses.values())
+    p99 = latencies[max(0, int(round(len(latencies) * 0.99)) - 1)] if latencies else 0
+    print(f"{name:<7}{total:9d}{total / elapsed:10.0f}{statistics.median(latencies) * 1000:10.2f}"
+          f"{p99 * 1000:9.2f}{received / elapsed / 2**20:9.1f}  {dict(statuses)}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cities", type=int, default=50)
+    parser.add_argument("--connections", type=int, default=64)
+    parser.add_argument("--procs", type=int, default=max(1, min(4, (os.cpu_count() or 2) - 1)),
+                        help="İstemci süreç sayısı (istemci darboğaz olmasın)")
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--latency", type=float, default=0.05, help="Taklit OWM gecikmesi (saniye)")
+    args = parser.parse_args()
+
+    stub, base = start_stub(latency=args.latency)
+    data_dir = tempfile.mkdtemp(prefix="ahd_bench_")
+    proc = subprocess.Popen([sys.executable, "-c", SERVICE_SCRIPT, BENCH_DIR, base, data_dir, "--port", "0"],
+                            cwd=APP_DIR, stdout=subprocess.PIPE, text=True)
+    try:
+        address = proc.stdout.readline().strip()
+        host, port = address.rsplit("//", 1)[1].rsplit(":", 1)
+        port = int(port)
+        paths = [f"/forecast?city={quote(f'Şehir {i}')}" for i in range(args.cities)]
+
+        print(f"servis {address}, {args.cities} şehir, {args.connections} bağlantı, {args.procs} istemci süreci")
+        print(f"{'aşama':<7}{'istek':>9}{'istek/s':>10}{'medyan ms':>10}{'p99 ms':>9}{'MiB/s':>9}  durumlar")
+        start = time.perf_counter()
+        etags, statuses, latencies = asyncio.run(warm(host, port, paths))
+        report("soğuk", Counter(statuses), sorted(latencies), 0, time.perf_counter() - start)
+        report("sıcak", *load(host, port, paths, None, args))
+        report("304", *load(host, port, paths, etags, args))
+
+        upstream = stub.hits
+        print(f"OWM'ye giden istek: {upstream} (şehir sayısı {args.cities})")
+        status = 0 if upstream == args.cities else 1
+
+        checked = [f"Şehir {i}" for i in range(min(args.cities, 10))]
+        advice = asyncio.run(advice_by_units(host, port, checked))
+        mismatched = [u for u in ("imperial", "standard") if advice[u] != advice["metric"]]
+        print(f"birimler arası tavsiye farkı ({len(checked)} şehir): {', '.join(mismatched) or 'yok'}")
+        status = status or (1 if mismatched else 0)
+    finally:
+        proc.terminate()
+        proc.wait()
+        stub.shutdown()
+        shutil.rmtree(data_dir, ignore_errors=True)
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
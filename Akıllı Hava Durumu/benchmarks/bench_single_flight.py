@@ -0,0 +1,93 @@
+# benchmarks/bench_single_flight.py
+"""
+Aynı anda gelen özdeş isteklerin tek ağ çağrısında birleştiğini (single_flight) ölçer.
+Soğuk önbellekle --burst thread aynı anda (Barrier) aynı şehri, olmayan bir şehri ve
+aynı ikonu ister; her senaryoda taklit sunucuya giden istek sayısı 1 olmalı ve tüm
+thread'ler aynı sonucu (ya da aynı hata tipini) almalıdır.
+
+    python benchmarks/bench_single_flight.py --burst 100 --latency 0.05
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from owm_stub import start_stub, point_config_at
+
+
+def burst(fn, count):
+    """fn'i count thread'de aynı anda çağırır; (sonuçlar, hatalar, süre ms) döner."""
+    barrier = threading.Barrier(count)
+    results, errors = [], []
+    lock = threading.Lock()
+
+    def worker():
+        barrier.wait()
+        try:
+            value = fn()
+            with lock:
+                results.append(value)
+        except Exception as e:
+            with lock:
+                errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(count)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results, errors, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--burst", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    server, base = start_stub(latency=args.latency)
+    data_dir = tempfile.mkdtemp(prefix="ahd_bench_")
+    point_config_at(base, data_dir)
+    import config
+    import weather_logic
+    from icon_cache import IconCache
+    from forecast_cache import ForecastCache
+
+    weather_logic.forecast_cache = ForecastCache(cache_dir=None)
+    icons = IconCache()
+    icon_url = config.ICON_URL.format(code="10d")
+    scenarios = [
+        ("tahmin", lambda: weather_logic.fetch_weather_data("Kocaeli")),
+        ("bulunamadı", lambda: weather_logic.fetch_weather_data("Yok Böyle Şehir")),
+        ("ikon", lambda: icons.get_bytes(icon_url)),
+    ]
+
+    print(f"{'senaryo':<12}{'istek':>7}{'sunucu':>8}{'sonuç':>7}{'hata':>6}{'ms':>9}  tutarlı")
+    failed = False
+    try:
+        for name, fn in scenarios:
+            hits_before = server.hits
+            results, errors, elapsed = burst(fn, args.burst)
+            hits = server.hits - hits_before
+            # Herkes liderin aynı nesnesini ya da aynı tipte hatayı almalı
+            same = (len({id(r) for r in results}) <= 1 and len({type(e) for e in errors}) <= 1
+                    and not (results and errors))
+            failed |= hits != 1 or not same
+            print(f"{name:<12}{args.burst:7d}{hits:8d}{len(results):7d}{len(errors):6d}"
+                  f"{elapsed:9.1f}  {'evet' if same else 'HAYIR'}")
+        print("forecast_flight:", weather_logic.forecast_flights.get_stats())
+        print("download_flight:", weather_logic.download_flights.get_stats())
+        print("ikon önbelleği:", icons.get_stats())
+    finally:
+        server.shutdown()
+        shutil.rmtree(data_dir, ignore_errors=True)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# benchmarks/bench_startup.py
+"""
+Soğuk açılış ölçümü. Her tur yeni bir Python süreci başlatır:
+  1) `import main` sırasında hangi paketlerin ne kadar sürdüğü (-X importtime)
+  2) Süreç başlangıcından pencerenin ilk kez boyanmasına kadar geçen süre
+
+Ekran gerekmez (Qt offscreen). Farklı commit'lerde aynı komutla çalıştırılıp
+sonuçlar karşılaştırılabilir:
+
+    python benchmarks/bench_startup.py --runs 5
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# İzlenen ağır paketler (kök modül adları)
+WATCHED = ["PyQt6.QtWidgets", "matplotlib", "PIL", "numpy", "requests", "weather_logic",
+           "icon_cache", "chart_cache", "main"]
+
+FIRST_PAINT_SCRIPT = r"""
+import time
+t0 = time.perf_counter()
+import os, sys, json
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QObject, QEvent
+app = QApplication(sys.argv)
+t_qt = time.perf_counter()
+import main
+t_import = time.perf_counter()
+window = main.WeatherApp()
+t_init = time.perf_counter()
+
+class FirstPaint(QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint:
+            t_paint = time.perf_counter()
+            heavy = [m for m in ("matplotlib", "PIL", "numpy", "requests") if m in sys.modules]
+            print(json.dumps({"qt_ms": (t_qt - t0) * 1000, "import_main_ms": (t_import - t_qt) * 1000,
+                              "init_ms": (t_init - t_import) * 1000, "first_paint_ms": (t_paint - t0) * 1000,
+                              "heavy_loaded_at_paint": heavy}))
+            sys.stdout.flush()
+            os._exit(0)
+        return False
+
+f = FirstPaint()
+window.installEventFilter(f)
+window.show()
+app.exec()
+"""
+
+
+def child_env():
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    return env
+
+
+def import_breakdown():
+    """-X importtime çıktısından izlenen paketlerin toplam (cumulative) süreleri, ms."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"],
+                          cwd=APP_DIR, env=child_env(), capture_output=True, text=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = [p.strip() for p in line[len("import time:"):].split("|")]
+        if not parts[1].isdigit():
+            continue  # Başlık satırı
+        name = parts[2]
+        if name in WATCHED:
+            times[name] = max(times.get(name, 0), int(parts[1]) / 1000)
+    return times
+
+
+def first_paint():
+    proc = subprocess.run([sys.executable, "-c", FIRST_PAINT_SCRIPT], cwd=APP_DIR,
+                          env=child_env(), capture_output=True, text=True, timeout=120)
+    for line in proc.stdout.splitlines():
+        if line.startswith("{"):
+            return json.loads(line)
+    raise RuntimeError(proc.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="Sonucu tek satır JSON olarak yaz")
+    args = parser.parse_args()
+
+    runs = [first_paint() for _ in range(args.runs)]
+    result = {key: statistics.median(r[key] for r in runs)
+              for key in ("qt_ms", "import_main_ms", "init_ms", "first_paint_ms")}
+    result["heavy_loaded_at_paint"] = runs[-1]["heavy_loaded_at_paint"]
+    result["import_ms"] = import_breakdown()
+
+    if args.json:
+        print(json.dumps(result))
+        return
+    print(f"PyQt6 + QApplication : {result['qt_ms']:8.1f} ms")
+    print(f"import main          : {result['import_main_ms']:8.1f} ms")
+    print(f"WeatherApp()         : {result['init_ms']:8.1f} ms")
+    print(f"İlk boyama           : {result['first_paint_ms']:8.1f} ms  (medyan, {args.runs} tur)")
+    print(f"Boyamada yüklü ağır paketler: {', '.join(result['heavy_loaded_at_paint']) or '-'}")
+    print("import main içindeki paketler (cumulative):")
+    for name, ms in sorted(result["import_ms"].items(), key=lambda kv: -kv[1]):
+        print(f"  {name:<16} {ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# benchmarks/bench_store.py
+"""
+ForecastStore ölçümü: 10 bin şehrin tahmininin ilk yazılması, aynı verinin
+tekrar gelmesi (hiç satır yazılmamalı), dilimlerin bir kısmı değişmiş yeni çekim
+ve tipik geçmiş sorguları. İlk yazma --budget saniyeyi aşarsa çıkış kodu 1 olur.
+
+    python benchmarks/bench_store.py --cities 10000 --budget 5
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import config
+from forecast_frame import ForecastFrame
+from forecast_store import ForecastStore
+from owm_stub import make_forecast
+
+
+def make_frames(n, now):
+    frames = []
+    for i in range(n):
+        data = make_forecast(f"Şehir {i}", now=now)
+        data["city"]["id"] = i + 1  # Sahte ID'ler çakışmasın
+        frames.append(ForecastFrame.from_json(data))
+    return frames
+
+
+def perturb(frames, share, seed=1):
+    """Her şehirde dilimlerin `share` kadarının sıcaklığını değiştirir (yeni çekim gibi)."""
+    rnd = random.Random(seed)
+    for frame in frames:
+        for i in rnd.sample(range(len(frame)), int(len(frame) * share)):
+            frame.temp[i] += 0.5
+
+
+def ingest(store, frames, fetched_at):
+    start = time.perf_counter()
+    written = 0
+    for i in range(0, len(frames), config.STORE_BATCH):
+        written += store.ingest_many(frames[i:i + config.STORE_BATCH], fetched_at)
+    return time.perf_counter() - start, written
+
+
+def timed_query(label, fn):
+    start = time.perf_counter()
+    rows = fn()
+    print(f"{label:<34} {(time.perf_counter() - start) * 1000:8.2f} ms  ({len(rows)} satır)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cities", type=int, default=10_000)
+    parser.add_argument("--budget", type=float, default=5.0, help="İlk yazma için üst sınır (s)")
+    args = parser.parse_args()
+
+    now = time.time()
+    frames = make_frames(args.cities, now)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ForecastStore(os.path.join(tmp, "bench.sqlite3"))
+        slot = config.FORECAST_SLOT_SECONDS
+
+        first, written = ingest(store, frames, now)
+        print(f"ilk yazma      {first:7.2f} s  {written} satır  {args.cities / first:8.0f} şehir/s")
+        again, written = ingest(store, frames, now + slot)
+        print(f"aynı veri      {again:7.2f} s  {written} satır")
+        perturb(frames, 0.25)
+        changed, written = ingest(store, frames, now + 2 * slot)
+        print(f"%25 değişmiş   {changed:7.2f} s  {written} satır")
+
+        tomorrow = (int(now) // 86400 + 1) * 86400
+        timed_query("şehir geçmişi (7 gün)", lambda: store.history(1, now - 7 * 86400, now + 7 * 86400))
+        timed_query("yarın 30°C üstü şehirler", lambda: store.cities_above(30, tomorrow, tomorrow + 86400))
+        timed_query("son tahminden frame (ada göre)", lambda: store.latest_frame("şehir 42", since=now))
+        print(store.get_stats())
+        store.close()
+
+    ok = first <= args.budget
+    print(f"bütçe {args.budget:.1f} s: {'GEÇTİ' if ok else 'AŞILDI'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
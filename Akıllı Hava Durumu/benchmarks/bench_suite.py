@@ -0,0 +1,266 @@
+# benchmarks/bench_suite.py
+"""
+Uçtan uca ölçüm takımı. Yerel OWM taklidine (owm_stub) karşı her aşamayı ayrı ölçer:
+
+  fetch         fetch_weather_data, soğuk önbellek (ağ + JSON)
+  json_decode   /forecast cevabının json.loads süresi
+  parse         ForecastFrame.from_json
+  stream_decode gövdenin parça parça doğrudan ForecastFrame'e çözülmesi (uygulamanın kullandığı yol)
+  group         günlük özet + gün serileri + günün en sıcak dilimi
+  interpolate   grafikler için 3 saatlik serilerin saatliğe sıklaştırılması (boş önbellek)
+  advice        40 dilim için tavsiye + kıyafet (advise_many)
+  chart_render  bir günün grafiğinin Agg ile QImage'e çizilmesi
+  icon_decode   ikonun PNG'den çözülüp boyutlandırılması (disk önbelleği sıcak)
+  search_paint  arayüzde arama -> yeni şehrin grafiğinin boyanması (Qt offscreen, ayrı süreç)
+
+Sonuçlar commit bilgisiyle JSON'a yazılabilir ve başka bir koşuyla karşılaştırılabilir:
+
+    python benchmarks/bench_suite.py --out base.json
+    python benchmarks/bench_suite.py --compare base.json
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import shutil
+import platform
+import statistics
+import subprocess
+import tempfile
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, APP_DIR)
+from owm_stub import start_stub, point_config_at, make_forecast
+
+SEARCH_PAINT_SCRIPT = r"""
+import sys, time, json
+sys.path.insert(0, sys.argv[1])
+from owm_stub import point_config_at
+point_config_at(sys.argv[2], sys.argv[3])
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QObject, QEvent
+app = QApplication(sys.argv)
+import main
+
+window = main.WeatherApp()
+window.show()
+state = {"city": "Kocaeli", "painted": None}
+
+def chart_ready():
+    pix = window.chart_view.pixmap()
+    return window.lbl_city.text() == state["city"] and pix is not None and not pix.isNull()
+
+class PaintWatch(QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and state["painted"] is None and chart_ready():
+            state["painted"] = time.perf_counter()
+        return False
+
+watch = PaintWatch()
+window.chart_view.installEventFilter(watch)
+
+def wait_paint(timeout=20):
+    end = time.perf_counter() + timeout
+    while state["painted"] is None and time.perf_counter() < end:
+        app.processEvents()
+        time.sleep(0.0005)
+    return state["painted"]
+
+wait_paint()  # Açılıştaki Kocaeli araması
+samples = []
+for i in range(int(sys.argv[4])):
+    state["city"], state["painted"] = f"Ölçüm {i}", None
+    window.chart_view.clear()
+    start = time.perf_counter()
+    window.start_search(state["city"])
+    painted = wait_paint()
+    if painted is not None:
+        samples.append((painted - start) * 1000)
+print(json.dumps(samples))
+sys.stdout.flush()
+import os; os._exit(0)
+"""
+
+
+def summarize(samples):
+    samples = sorted(samples)
+    if not samples:
+        return {"n": 0}
+    p95 = samples[max(0, int(round(len(samples) * 0.95)) - 1)]
+    return {"n": len(samples), "median_ms": round(statistics.median(samples), 3),
+            "p95_ms": round(p95, 3), "min_ms": round(samples[0], 3)}
+
+
+def timed(fn, rounds):
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def commit_info():
+    try:
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=APP_DIR,
+                             capture_output=True, text=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--", "."], cwd=APP_DIR,
+                               capture_output=True, text=True).stdout.strip()
+        return rev + ("-dirty" if dirty else "")
+    except OSError:
+        return None
+
+
+# --- AŞAMALAR ---
+def bench_fetch(weather_logic, rounds):
+    from forecast_cache import ForecastCache
+    weather_logic.forecast_cache = ForecastCache(cache_dir=None)
+    cities = iter([f"Getir {i}" for i in range(rounds)])
+    return timed(lambda: weather_logic.fetch_weather_data(next(cities)), rounds)
+
+
+def bench_json(rounds):
+    body = json.dumps(make_forecast("İstanbul")).encode("utf-8")
+    return timed(lambda: json.loads(body), rounds)
+
+
+def bench_stream(rounds):
+    import config
+    from forecast_stream import decode_forecast
+    body = json.dumps(make_forecast("İstanbul"), ensure_ascii=False).encode("utf-8")
+    size = config.HTTP_CHUNK_SIZE
+    chunks = [body[i:i + size] for i in range(0, len(body), size)]
+    return timed(lambda: decode_forecast(chunks), rounds)
+
+
+def bench_parse(rounds):
+    from forecast_frame import ForecastFrame
+    data = make_forecast("İstanbul")
+    return timed(lambda: ForecastFrame.from_json(data), rounds)
+
+
+def bench_group(frame, rounds):
+    def group():
+        frame.daily_summary()
+        frame.day_argmax()
+        for day in range(frame.day_count):
+            frame.day_series(day)
+    return timed(group, rounds)
+
+
+def bench_interp(frame, rounds):
+    from forecast_interp import InterpCache
+    # Her turda boş önbellek: grafik serilerinin soğuk (ilk) hazırlanması ölçülür
+    return timed(lambda: InterpCache(max_items=1).upsample(frame), rounds)
+
+
+def bench_advice(weather_logic, frame, rounds):
+    return timed(lambda: weather_logic.advise_many(frame.temp, frame.cond_id, frame.wind_speed), rounds)
+
+
+def bench_chart(frame, rounds):
+    from chart_cache import OffscreenChart
+    from forecast_interp import day_series
+    chart = OffscreenChart()
+    days = [day_series(frame, d) for d in range(frame.day_count)]
+    chart.render(days[0], (600, 600))  # İlk çizimdeki font / artist kurulumu ölçüme girmesin
+    turn = iter(range(rounds))
+    return timed(lambda: chart.render(days[next(turn) % len(days)], (600, 600)), rounds)
+
+
+def bench_icon(rounds):
+    import config
+    from icon_cache import IconCache, make_key
+    cache = IconCache()
+    keys = [make_key(code, (130, 130)) for code in config.WEATHER_BG_COLORS]
+    for key in keys:
+        cache.get_bytes(config.ICON_URL.format(code=key[0]))  # Disk katmanını doldur
+    turn = iter(range(rounds))
+    return timed(lambda: cache.load_image(keys[next(turn) % len(keys)]), rounds)
+
+
+def bench_search_paint(base, data_dir, rounds):
+    proc = subprocess.run([sys.executable, "-c", SEARCH_PAINT_SCRIPT, BENCH_DIR, base, data_dir, str(rounds)],
+                          cwd=APP_DIR, env={**os.environ, "QT_QPA_PLATFORM": "offscreen"},
+                          capture_output=True, text=True, timeout=300)
+    for line in proc.stdout.splitlines():
+        if line.startswith("["):
+            return json.loads(line)
+    raise RuntimeError(proc.stderr[-2000:])
+
+
+# --- RAPOR ---
+def print_table(results, baseline=None):
+    header = f"{'aşama':<14}{'medyan ms':>12}{'p95 ms':>12}"
+    print(header + (f"{'önceki':>12}{'fark':>9}" if baseline else ""))
+    for name, r in results.items():
+        if not r.get("n"):
+            print(f"{name:<14}{'-':>12}")
+            continue
+        line = f"{name:<14}{r['median_ms']:12.3f}{r['p95_ms']:12.3f}"
+        old = (baseline or {}).get(name, {})
+        if old.get("n"):
+            change = (r["median_ms"] - old["median_ms"]) / old["median_ms"] * 100
+            line += f"{old['median_ms']:12.3f}{change:+8.1f}%"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=50, help="Hızlı aşamalarda tekrar sayısı")
+    parser.add_argument("--paint-rounds", type=int, default=10, help="Arama -> boyama tekrar sayısı")
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--skip", nargs="*", default=[], help="Atlanacak aşamalar (ör. search_paint)")
+    parser.add_argument("--out", help="Sonuçları bu JSON dosyasına yaz")
+    parser.add_argument("--compare", help="Önceki bir --out dosyasıyla karşılaştır")
+    args = parser.parse_args()
+
+    server, base = start_stub(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate)
+    data_dir = tempfile.mkdtemp(prefix="ahd_bench_")
+    point_config_at(base, data_dir)
+    import weather_logic
+    from forecast_frame import ForecastFrame
+
+    frame = ForecastFrame.from_json(make_forecast("İstanbul"))
+    stages = {
+        "fetch": lambda: bench_fetch(weather_logic, args.rounds),
+        "json_decode": lambda: bench_json(args.rounds * 10),
+        "parse": lambda: bench_parse(args.rounds * 10),
+        "stream_decode": lambda: bench_stream(args.rounds * 10),
+        "group": lambda: bench_group(frame, args.rounds * 10),
+        "interpolate": lambda: bench_interp(frame, args.rounds * 10),
+        "advice": lambda: bench_advice(weather_logic, frame, args.rounds * 10),
+        "chart_render": lambda: bench_chart(frame, args.rounds),
+        "icon_decode": lambda: bench_icon(args.rounds),
+        "search_paint": lambda: bench_search_paint(base, data_dir, args.paint_rounds),
+    }
+    results = {}
+    try:
+        for name, run in stages.items():
+            results[name] = summarize([] if name in args.skip else run())
+    finally:
+        server.shutdown()
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    report = {"commit": commit_info(), "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+              "python": platform.python_version(), "machine": platform.machine(),
+              "stub": {"latency": args.latency, "jitter": args.jitter, "error_rate": args.error_rate},
+              "results": results}
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            old = json.load(f)
+        baseline = old["results"]
+        print(f"karşılaştırma: {old.get('commit')} -> {report['commit']}")
+    print_table(results, baseline)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
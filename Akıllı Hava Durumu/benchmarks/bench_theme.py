@@ -0,0 +1,113 @@
+# benchmarks/bench_theme.py
+"""
+Tema (arka plan rengi) değişiminin GUI thread maliyeti:
+
+  restyle       eski yol: ana pencereye setStyleSheet + senkron boyama (bütün ağaç yeniden stillenir)
+  set_theme     ThemeBackground.set_theme(animate=False) + senkron boyama
+  geçiş karesi  animasyonlu geçişte her karenin olay döngüsünde harcadığı süre
+
+Pencere bir aramayla doldurulur (ikonlar atlastan, grafik çizili); renkler
+WEATHER_BG_COLORS içinde sırayla dolaşılır.
+
+    python benchmarks/bench_theme.py --switches 100
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from owm_stub import start_stub, point_config_at, make_forecast
+
+
+def report(name, samples):
+    samples = sorted(samples)
+    print(f"{name:<14}{len(samples):>6}{statistics.median(samples):>12.2f}"
+          f"{samples[int(len(samples) * 0.95) - 1]:>12.2f}{samples[-1]:>12.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--switches", type=int, default=100)
+    args = parser.parse_args()
+
+    server, base = start_stub()
+    data_dir = tempfile.mkdtemp(prefix="ahd_theme_")
+    point_config_at(base, data_dir)
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import QObject, QEvent
+    app = QApplication(sys.argv)
+    import config
+    import icon_atlas
+    icon_atlas.build_atlas(config.ICON_ATLAS_PATH)
+    import main as app_main
+    from theme import THEMES
+    from forecast_frame import ForecastFrame
+
+    class PaintCount(QObject):
+        count = 0
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Type.Paint:
+                PaintCount.count += 1
+            return False
+
+    try:
+        window = app_main.WeatherApp()
+        window._shell_painted = True  # Açılış araması ölçüme karışmasın
+        window.show()
+        app_main.load_heavy_modules()
+        window.on_data_ready(ForecastFrame.from_json(make_forecast("İstanbul")), window.scheduler.new_token("search"))
+        end = time.perf_counter() + 10
+        while window.chart_view.pixmap().isNull() and time.perf_counter() < end:
+            app.processEvents()
+            time.sleep(0.001)
+
+        themes = list(THEMES.values())
+        background = window.background
+        painted = PaintCount()
+        background.installEventFilter(painted)
+
+        def timed(fn):
+            start = time.perf_counter()
+            fn()
+            return (time.perf_counter() - start) * 1000
+
+        restyle, instant, frames = [], [], []
+        for i in range(args.switches):
+            color = themes[i % len(themes)].background.name()
+            restyle.append(timed(lambda: (window.setStyleSheet(f"background-color: {color};"), window.repaint())))
+        window.setStyleSheet("")
+        app.processEvents()
+
+        for i in range(args.switches):
+            theme = themes[i % len(themes)]
+            instant.append(timed(lambda: (background.set_theme(theme, animate=False), window.repaint())))
+
+        transitions = max(1, args.switches // 10)
+        for i in range(transitions):
+            background.set_theme(themes[(i * 7 + 1) % len(themes)])
+            while background.animating:
+                before = PaintCount.count
+                elapsed = timed(app.processEvents)
+                if PaintCount.count != before:
+                    frames.append(elapsed)
+                time.sleep(0.001)
+
+        print(f"{'yol':<14}{'n':>6}{'medyan ms':>12}{'p95 ms':>12}{'en çok ms':>12}")
+        report("restyle", restyle)
+        report("set_theme", instant)
+        report("geçiş karesi", frames)
+        print(f"geçiş başına ortalama {len(frames) / transitions:.1f} kare ({config.THEME_TRANSITION_MS} ms)")
+    finally:
+        server.shutdown()
+        shutil.rmtree(data_dir, ignore_errors=True)
+    os._exit(0)  # Arka plan işçilerini beklemeden çık
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# benchmarks/bench_widgets.py
+"""
+Arama başına GUI thread süresi: on_data_ready + ertelenmiş widget silmeleri +
+yerleşim / boyama olayları. Tahminler önceden hazırlanır (ağ yok), ikonlar
+atlastan gelir ve grafik çizimi kapatılır; ölçülen sadece arayüzün kendi işi.
+Sonda penceredeki widget sayısı da yazılır (uzun oturumda büyümemeli).
+
+    python benchmarks/bench_widgets.py --searches 200
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from owm_stub import start_stub, point_config_at, make_forecast
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--searches", type=int, default=200)
+    parser.add_argument("--cities", type=int, default=20, help="Sırayla gösterilecek farklı şehir sayısı")
+    args = parser.parse_args()
+
+    server, base = start_stub()
+    data_dir = tempfile.mkdtemp(prefix="ahd_widgets_")
+    point_config_at(base, data_dir)
+    from PyQt6.QtWidgets import QApplication, QWidget
+    from PyQt6.QtCore import QEvent
+    app = QApplication(sys.argv)
+    import config
+    import icon_atlas
+    icon_atlas.build_atlas(config.ICON_ATLAS_PATH)
+    import main as app_main
+    from forecast_frame import ForecastFrame
+
+    try:
+        window = app_main.WeatherApp()
+        window._shell_painted = True  # Açılış araması ölçüme karışmasın
+        window.show()
+        app_main.load_heavy_modules()
+        window.render_pool.submit = lambda *a, **k: None  # Grafik çizimi kapalı
+        frames = [ForecastFrame.from_json(make_forecast(f"Şehir {i}")) for i in range(args.cities)]
+
+        def settle():
+            app.sendPostedEvents(None, QEvent.Type.DeferredDelete.value)
+            app.processEvents()
+
+        def search(frame):
+            token = window.scheduler.new_token("search")
+            start = time.perf_counter()
+            window.on_data_ready(frame, token)
+            settle()
+            return (time.perf_counter() - start) * 1000
+
+        for frame in frames:  # Isınma: stiller, fontlar, atlas şeridi
+            search(frame)
+        samples = [search(frames[i % len(frames)]) for i in range(args.searches)]
+        samples.sort()
+        print(f"{args.searches} arama: medyan {statistics.median(samples):.2f} ms, "
+              f"p95 {samples[int(len(samples) * 0.95) - 1]:.2f} ms, en az {samples[0]:.2f} ms")
+        print(f"penceredeki widget sayısı: {len(window.findChildren(QWidget))}")
+    finally:
+        server.shutdown()
+        shutil.rmtree(data_dir, ignore_errors=True)
+    os._exit(0)  # Arka plan işçilerini beklemeden çık
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+# benchmarks/owm_stub.py
+"""
+OpenWeatherMap'i taklit eden yerel HTTP sunucusu: /forecast cevapları, durum
+ikonları (/img/wn/<kod>@4x.png) ve kıyafet resimleri (/clothes/<ad>.png).
+Gerçek API anahtarı ve internet olmadan ölçüm yapabilmek içindir. Gecikme,
+gecikmeye eklenen rastgele sapma (jitter) ve hata oranı ayarlanabilir.
+
+Tek başına çalıştırma:
+    python benchmarks/owm_stub.py --port 8765 --latency 0.05 --jitter 0.02 --error-rate 0.05
+"""
+import os
+import sys
+import json
+import time
+import zlib
+import struct
+import random
+import argparse
+import threading
+from urllib.parse import urlparse, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import config
+
+# (OWM durum kodu, ikon, açıklama) örnekleri
+CONDITIONS = [
+    (800, "01", "açık"), (801, "02", "az bulutlu"), (803, "04", "parçalı bulutlu"),
+    (500, "10", "hafif yağmur"), (502, "10", "şiddetli yağmur"), (600, "13", "hafif kar yağışlı"),
+    (211, "11", "gök gürültülü fırtına"), (741, "50", "sis"),
+]
+
+
+def _temp(celsius, units):
+    # Çevrilen değerler yuvarlanmaz: her birimde birebir aynı hava gelsin
+    if units == "imperial":
+        return celsius * 1.8 + 32
+    if units == "standard":
+        return celsius + 273.15
+    return celsius
+
+
+def _wind(ms, units):
+    return ms / 0.44704 if units == "imperial" else ms
+
+
+def make_forecast(city, now=None, units="metric"):
+    """
+    Şehir adına göre her seferinde aynı çıkan, gerçekçi 40 dilimlik bir cevap üretir.
+    OWM gibi sıcaklıkları ve rüzgarı `units` biriminde verir (hava aynıdır).
+    """
+    rnd = random.Random(str(city).lower())
+    now = time.time() if now is None else now
+    slot = config.FORECAST_SLOT_SECONDS
+    start = (int(now) // slot + 1) * slot
+    base_temp = rnd.uniform(-10, 35)
+    items = []
+    for i in range(40):
+        dt = start + i * slot
+        hour = (dt // 3600) % 24
+        cond_id, icon, desc = rnd.choice(CONDITIONS)
+        pod = "d" if 6 <= hour < 18 else "n"
+        temp = round(base_temp + rnd.uniform(-4, 4), 2)
+        feels_like = round(temp - rnd.uniform(0, 3), 2)
+        temp = _temp(temp, units)
+        item = {
+            "dt": dt,
+            "main": {"temp": temp, "feels_like": _temp(feels_like, units),
+                     "temp_min": temp, "temp_max": temp, "pressure": rnd.randint(995, 1030),
+                     "sea_level": 1013, "grnd_level": 1000, "humidity": rnd.randint(20, 100),
+                     "temp_kf": 0},
+            "weather": [{"id": cond_id, "main": desc, "description": desc, "icon": icon + pod}],
+            "clouds": {"all": rnd.randint(0, 100)},
+            "wind": {"speed": _wind(round(rnd.uniform(0, 25), 2), units), "deg": rnd.randint(0, 359),
+                     "gust": _wind(round(rnd.uniform(0, 30), 2), units)},
+            "visibility": 10000,
+            "pop": round(rnd.random(), 2),
+            "sys": {"pod": pod},
+            "dt_txt": time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(dt)),
+        }
+        if cond_id // 100 == 5:
+            item["rain"] = {"3h": round(rnd.uniform(0.1, 8), 2)}
+        if cond_id // 100 == 6:
+            item["snow"] = {"3h": round(rnd.uniform(0.1, 5), 2)}
+        items.append(item)
+    city_id = rnd.randint(100000, 999999)
+    return {"cod": "200", "message": 0, "cnt": len(items), "list": items,
+            "city": {"id": city_id, "name": str(city).title(), "coord": {"lat": 0, "lon": 0},
+                     "country": "TR", "population": 0, "timezone": 10800,
+                     "sunrise": start, "sunset": start + 43200}}
+
+
+def make_png(seed, size=200):
+    """Tohuma göre renklenen, ortasında daire olan RGBA PNG (Pillow gerektirmez)."""
+    rnd = random.Random(seed)
+    color = bytes([rnd.randrange(256), rnd.randrange(256), rnd.randrange(256), 255])
+    clear = b"\x00\x00\x00\x00"
+    r2 = (size * 0.4) ** 2
+    c = size / 2
+    raw = bytearray()
+    for y in range(size):
+        raw.append(0)  # Filtre: yok
+        for x in range(size):
+            raw += color if (x - c) ** 2 + (y - c) ** 2 <= r2 else clear
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 6, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(bytes(raw), 6)) + chunk(b"IEND", b""))
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # Başlık ve gövde ayrı paketlerde beklemesin
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body, content_type="application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits += 1
+            delay = server.latency + (server.rnd.uniform(0, server.jitter) if server.jitter else 0)
+            fail = server.error_rate and server.rnd.random() < server.error_rate
+        if delay:
+            time.sleep(delay)
+        if fail:
+            with server.lock:
+                server.errors += 1
+            self._send(503, b'{"cod":"503","message":"service unavailable"}')
+            return
+
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if url.path.endswith("/forecast"):
+            city = (query.get("q") or query.get("id") or [""])[0]
+            if not city or city.lower().startswith("yok"):
+                self._send(404, b'{"cod":"404","message":"city not found"}')
+                return
+            units = (query.get("units") or ["metric"])[0]
+            self._send(200, json.dumps(make_forecast(city, units=units)).encode("utf-8"))
+            return
+        if url.path.endswith(".png"):
+            name = os.path.basename(url.path)
+            with server.lock:
+                body = server.images.get(name)
+                if body is None:
+                    body = server.images[name] = make_png(name)
+            self._send(200, body, "image/png")
+            return
+        self._send(404, b"{}")
+
+
+def start_stub(port=0, latency=0.0, jitter=0.0, error_rate=0.0, seed=0):
+    """
+    Sunucuyu arka planda başlatır; (server, taban_adres) döner.
+    Her istek latency + [0, jitter) saniye bekletilir ve error_rate olasılıkla 503 döner.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubHandler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.jitter = jitter
+    server.error_rate = error_rate
+    server.rnd = random.Random(seed)
+    server.hits = 0
+    server.errors = 0
+    server.images = {}
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def point_config_at(base_url, data_dir=None):
+    """
+    config içindeki adresleri yerel sunucuya çevirir. weather_logic'ten ÖNCE çağrılmalı.
+    data_dir verilirse önbellek ve geçmiş dosyaları da oraya yönlendirilir
+    (ölçümler kullanıcının ~/.akilli_hava_durumu klasörüne dokunmaz).
+    """
+    config.FORECAST_URL = base_url + "/data/2.5/forecast"
+    config.ICON_URL = base_url + "/img/wn/{code}@4x.png"
+    config.CLOTHING_URLS = {name: f"{base_url}/clothes/{name}.png" for name in config.CLOTHING_URLS}
+    if data_dir:
+        config.APP_DATA_DIR = data_dir
+        config.CACHE_DIR = os.path.join(data_dir, "cache")
+        config.ICON_CACHE_DIR = os.path.join(data_dir, "icons")
+        config.ICON_ATLAS_PATH = os.path.join(data_dir, "icons.atlas")
+        config.CITY_INDEX_PATH = os.path.join(data_dir, "cities.idx")
+        config.STORE_PATH = os.path.join(data_dir, "forecasts.sqlite3")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Yerel OpenWeatherMap taklidi")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="İstek başına gecikme (saniye)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Gecikmeye eklenen en fazla rastgele süre")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 dönen isteklerin oranı (0-1)")
+    args = parser.parse_args()
+    server, base = start_stub(args.port, args.latency, args.jitter, args.error_rate)
+    print(f"Dinleniyor: {base}  (Ctrl+C ile çık)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
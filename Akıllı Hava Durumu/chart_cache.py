@@ -0,0 +1,120 @@
+# chart_cache.py
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PyQt6.QtGui import QImage
+
+import config
+from chart_renderer import ChartRenderer
+
+BASE_DPI = 90  # Uygulamanın grafiklerdeki yazı boyutlarını ayarladığı DPI
+
+
+def series_hash(series):
+    """Bir günün grafik serilerinin kısa özeti; veri değişmediyse aynı kalır."""
+    h = hashlib.blake2b(digest_size=8)
+    h.update("|".join(series["times"]).encode("utf-8"))
+    for name in ("temps", "rains", "winds", "degs"):
+        h.update(np.ascontiguousarray(series[name], dtype=np.float32).tobytes())
+    return h.hexdigest()
+
+
+def make_key(city, day_name, series, size, dpr=1.0):
+    return (city, day_name, series_hash(series), (int(size[0]), int(size[1])), round(BASE_DPI * dpr, 2))
+
+
+class OffscreenChart:
+    """
+    Uygulamadaki üçlü grafiğin Qt'ye bağlı olmayan (Agg) kopyası.
+    Arka plan thread'inde çalışır ve sonucu QImage olarak verir.
+    Tek bir figür paylaşıldığı için render() çağrıları sıraya sokulur.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.fig = Figure(figsize=(6, 6), dpi=BASE_DPI)
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.ax_rain, self.ax_temp, self.ax_wind = self.fig.subplots(3, 1, sharex=True)
+        self.fig.subplots_adjust(top=0.92, bottom=0.1, hspace=0.5)
+
+        self.fig.patch.set_facecolor("none")
+        for ax in [self.ax_rain, self.ax_temp, self.ax_wind]:
+            ax.set_facecolor("none")
+            ax.tick_params(axis='x', colors='white', labelsize=9)
+            ax.tick_params(axis='y', colors='white')
+            ax.spines['bottom'].set_color('white')
+            ax.spines['top'].set_visible(False)
+            ax.spines['right'].set_visible(False)
+            ax.spines['left'].set_visible(False)
+            ax.get_yaxis().set_visible(False)
+        self.renderer = ChartRenderer(self.ax_rain, self.ax_temp, self.ax_wind)
+
+    def render(self, series, size, dpr=1.0):
+        """size: mantıksal piksel (genişlik, yükseklik). Saydam arka planlı QImage döner."""
+        dpi = BASE_DPI * dpr
+        with self._lock:
+            self.fig.set_dpi(dpi)
+            self.fig.set_size_inches(size[0] * dpr / dpi, size[1] * dpr / dpi)
+            self.renderer.update(series["times"], series["temps"], series["rains"],
+                                 series["winds"], series["degs"], series.get("x"), series.get("hourly"))
+            self.canvas.draw()
+            buf = self.canvas.buffer_rgba()
+            h, w = buf.shape[:2]
+            # copy(): resim figürün tamponuna değil kendi belleğine sahip olsun
+            img = QImage(bytes(buf), w, h, w * 4, QImage.Format.Format_RGBA8888).copy()
+        img.setDevicePixelRatio(dpr)
+        return img
+
+
+class ChartImageCache:
+    """
+    Hazır çizilmiş gün grafikleri için sınırlı LRU.
+    Anahtar: (şehir, gün, veri özeti, boyut, DPI). Veri ya da boyut değişince
+    anahtar da değiştiği için eski görüntüler kendiliğinden kullanılmaz olur;
+    clear() ile bellekten de hemen atılabilir.
+    """
+
+    def __init__(self, max_items=config.CHART_CACHE_MAX_ITEMS):
+        self.max_items = max_items
+        self._images = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"renders": 0, "hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key):
+        with self._lock:
+            img = self._images.get(key)
+            if img is None:
+                self.stats["misses"] += 1
+                return None
+            self._images.move_to_end(key)
+            self.stats["hits"] += 1
+            return img
+
+    def peek(self, key):
+        """İstatistikleri etkilemeden bakar (işçi thread'in çift çizimi önlemesi için)."""
+        with self._lock:
+            return self._images.get(key)
+
+    def put(self, key, img):
+        with self._lock:
+            self.stats["renders"] += 1
+            self._images[key] = img
+            self._images.move_to_end(key)
+            while len(self._images) > self.max_items:
+                self._images.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._images.clear()
+
+    def get_stats(self):
+        """'hits' = çizilmesine gerek kalmadan gösterilen grafik sayısı (kazanılan render)."""
+        with self._lock:
+            stats = dict(self.stats)
+            stats["size"] = len(self._images)
+        return stats
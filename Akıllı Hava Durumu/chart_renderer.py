@@ -0,0 +1,176 @@
+# chart_renderer.py
+import numpy as np
+from matplotlib.patches import Polygon
+from matplotlib.transforms import ScaledTranslation
+
+import config
+
+SLOT_WIDTH_H = 1.5  # Yağış çubuğunun genişliği (saat); 3 saatlik dilimin yarısı
+X_PAD_H = 1.8       # İlk / son dilimin yanındaki boşluk (saat)
+
+
+class ChartRenderer:
+    """
+    Yağış / sıcaklık / rüzgar grafiklerini çizen, artist'leri (çubuk, çizgi, yazı)
+    bir kez oluşturup sonraki günlerde sadece verilerini güncelleyen çizici.
+
+    Eskiden her gün değişiminde eksenler clear() ile silinip tüm çubuklar, çizgiler
+    ve dilim başına 4 yazı (dönük "⬇" okları dahil) yeniden yaratılıyordu.
+    Artık rüzgar yönü tek bir quiver koleksiyonu ile çiziliyor. Çizici Qt'ye bağlı
+    değildir: chart_cache.OffscreenChart onu çizim thread'inde Agg figürü üzerinde
+    kullanır, update() sonrası canvas.draw() ile resmi üretir ve sonuç QImage olarak
+    önbelleğe girer; arayüz sadece hazır resmi gösterir.
+
+    X ekseni gerçek zamandır (gece yarısından beri saat): eğriler saatlik ara
+    değerlenmiş seriden, çubuk ve değer yazıları ölçülen 3 saatlik dilimlerden çizilir.
+    """
+
+    def __init__(self, ax_rain, ax_temp, ax_wind, capacity=8):
+        self.ax_rain = ax_rain
+        self.ax_temp = ax_temp
+        self.ax_wind = ax_wind
+        self.capacity = 0
+        self.arrow_capacity = 0
+        self._bars = []
+        self._rain_labels = []
+        self._temp_labels = []
+        self._wind_labels = []
+        self._quiver = None
+
+        ax_rain.tick_params(labelbottom=True)
+        ax_temp.tick_params(labelbottom=True)
+        ax_rain.set_title("Yağış İhtimali (%)", loc='left', color=config.RAIN_COLOR, fontsize=10, fontweight='bold', pad=10)
+        ax_temp.set_title("Sıcaklık (°C)", loc='left', color=config.ACCENT, fontsize=10, fontweight='bold', pad=10)
+        ax_wind.set_title("Rüzgar (km/s)", loc='left', color=config.WIND_COLOR, fontsize=10, fontweight='bold', pad=10)
+        for ax in (ax_rain, ax_temp, ax_wind):
+            ax.set_autoscale_on(False)  # Limitleri biz veriyoruz, relim maliyeti olmasın
+        ax_rain.set_ylim(0, 115)
+
+        # Sıcaklık: dolgu + çizgi
+        self._temp_fill = Polygon(np.zeros((1, 2)), closed=True, color=config.ACCENT, alpha=0.2, linewidth=0)
+        ax_temp.add_patch(self._temp_fill)
+        self._temp_line, = ax_temp.plot([], [], color=config.ACCENT, linewidth=3)
+        self._temp_points, = ax_temp.plot([], [], linestyle='none', color=config.ACCENT, marker='o',
+                                          markerfacecolor='white')
+
+        # Yağış ihtimalinin saatlik seyri (çubukların üstünde ince çizgi)
+        self._rain_line, = ax_rain.plot([], [], color=config.RAIN_COLOR, linewidth=1.5, alpha=0.9)
+
+        # Rüzgar: çizgi
+        self._wind_line, = ax_wind.plot([], [], color=config.WIND_COLOR, linewidth=2)
+
+        self._ensure_capacity(capacity)
+        self._ensure_arrows(capacity)
+
+    def _ensure_capacity(self, n):
+        """Dilim sayısı kadar çubuk ve yazı hazır olsun (gerekirse havuzu büyüt)."""
+        if n <= self.capacity:
+            return
+        new_x = list(range(self.capacity, n))
+        bars = self.ax_rain.bar(new_x, [0] * len(new_x), color=config.RAIN_COLOR, alpha=0.7, width=SLOT_WIDTH_H)
+        self._bars.extend(bars.patches)
+        for _ in new_x:
+            self._rain_labels.append(self.ax_rain.text(0, 0, "", ha='center', va='bottom', color='white', fontsize=8))
+            self._temp_labels.append(self.ax_temp.annotate("", (0, 0), xytext=(0, 10), textcoords="offset points",
+                                                           ha='center', color='white', fontweight='bold', fontsize=9))
+            self._wind_labels.append(self.ax_wind.annotate("", (0, 0), xytext=(0, -15), textcoords="offset points",
+                                                           ha='center', color='white', fontsize=9))
+        self.capacity = n
+
+    def _ensure_arrows(self, n):
+        """
+        Yön okları: quiver'ın ok sayısı sabit olduğu için kapasite aşılınca yeniden kurulur.
+        Oklar noktanın 15pt üstünde durur (eski "⬇" yazısının yeri).
+        """
+        if n <= self.arrow_capacity:
+            return
+        if self._quiver is not None:
+            self._quiver.remove()
+        fig = self.ax_wind.figure
+        offset = self.ax_wind.transData + ScaledTranslation(0, 15 / 72, fig.dpi_scale_trans)
+        zeros = np.zeros(n)
+        self._quiver = self.ax_wind.quiver(zeros, zeros, zeros, zeros, transform=offset,
+                                           color=config.WIND_COLOR, pivot='middle', angles='uv',
+                                           units='inches', scale_units='inches', scale=1 / 0.2,
+                                           width=0.03, headwidth=3, headlength=3, headaxislength=2.5)
+        self.arrow_capacity = n
+
+    def update(self, times, temps, rains, winds, wind_degs, x=None, hourly=None):
+        """
+        Yeni günün verisini mevcut artist'lere yazar. Çizimi çağıran tetikler (OffscreenChart.render).
+
+        x: dilimlerin zaman eksenindeki yeri (gece yarısından beri saat); verilmezse
+        dilimler 3 saat arayla dizilir. hourly: forecast_interp.day_series'in sıklaştırılmış
+        serileri; eğriler, dolgu ve yön okları bunlardan, çubuk ve yazılar dilimlerden çizilir.
+        """
+        n = len(times)
+        self._ensure_capacity(n)
+        x = np.arange(n) * 3.0 if x is None else np.asarray(x, dtype=float)
+        temps = np.asarray(temps, dtype=float)
+        rains = np.asarray(rains, dtype=float)
+        winds = np.asarray(winds, dtype=float)
+        if hourly is None:
+            hourly = {"x": x, "temps": temps, "rains": rains, "winds": winds, "degs": wind_degs}
+        hx = np.asarray(hourly["x"], dtype=float)
+        h_temps = np.asarray(hourly["temps"], dtype=float)
+        h_rains = np.asarray(hourly["rains"], dtype=float)
+        h_winds = np.asarray(hourly["winds"], dtype=float)
+
+        self.ax_wind.set_xticks(x)  # sharex: üç eksen aynı konumlayıcıyı paylaşır
+        self.ax_wind.set_xticklabels(times)
+        if n:
+            self.ax_wind.set_xlim(x[0] - X_PAD_H, x[-1] + X_PAD_H)
+
+        # 1. Yağmur: dilim çubukları + saatlik ihtimal eğrisi
+        for i, bar in enumerate(self._bars):
+            visible = i < n
+            bar.set_visible(visible)
+            label = self._rain_labels[i]
+            if visible:
+                bar.set_x(x[i] - SLOT_WIDTH_H / 2)
+                bar.set_height(rains[i])
+                label.set_position((x[i], rains[i] + 1))
+                label.set_text(f'%{int(rains[i])}')
+            label.set_visible(visible and rains[i] > 0)
+        self._rain_line.set_data(hx, h_rains)
+
+        # 2. Sıcaklık: pürüzsüz eğri ve dolgu saatlik seriden, noktalar ölçülen dilimlerde
+        self._temp_line.set_data(hx, h_temps)
+        self._temp_points.set_data(x, temps)
+        if n:
+            low, high = min(temps.min(), h_temps.min()), max(temps.max(), h_temps.max())
+            self._temp_fill.set_xy(np.concatenate([np.column_stack([hx, h_temps]),
+                                                   [[hx[-1], low - 5], [hx[0], low - 5]]]))
+            self.ax_temp.set_ylim(low - 2, high + 2)
+        self._temp_fill.set_visible(n > 0)
+        for i, label in enumerate(self._temp_labels):
+            if i < n:
+                label.xy = (x[i], temps[i])
+                label.set_text(f"{temps[i]:.0f}°")
+            label.set_visible(i < n)
+
+        # 3. Rüzgar
+        self._wind_line.set_data(hx, h_winds)
+        if n:
+            self.ax_wind.set_ylim(min(winds.min(), h_winds.min()) - 1, max(winds.max(), h_winds.max()) + 5)
+        for i, label in enumerate(self._wind_labels):
+            if i < n:
+                label.xy = (x[i], winds[i])
+                label.set_text(f"{winds[i]:.0f}")
+            label.set_visible(i < n)
+
+        # Rüzgarın estiği yön: ⬇ okunun saat yönünde 'deg' kadar döndürülmüş hali.
+        # Oklar saatlik eğrinin üzerinde, en az CHART_ARROW_SPACING_H saat arayla
+        step = np.median(np.diff(hx)) if len(hx) > 1 else 1.0
+        pick = slice(None, None, max(1, int(round(config.CHART_ARROW_SPACING_H / step))))
+        arrow_x, arrow_y = hx[pick], h_winds[pick]
+        degs = np.radians(np.asarray(hourly["degs"], dtype=float)[pick])
+        m = len(arrow_x)
+        self._ensure_arrows(m)
+        pad = self.arrow_capacity - m
+        hidden = np.arange(self.arrow_capacity) >= m
+        offsets = np.column_stack([np.concatenate([arrow_x, np.zeros(pad)]), np.concatenate([arrow_y, np.zeros(pad)])])
+        u = np.ma.masked_array(np.concatenate([-np.sin(degs), np.zeros(pad)]), mask=hidden)
+        v = np.ma.masked_array(np.concatenate([-np.cos(degs), np.zeros(pad)]), mask=hidden)
+        self._quiver.set_offsets(offsets)
+        self._quiver.set_UVC(u, v)
@@ -0,0 +1,345 @@
+# city_index.py
+"""
+Uygulamayla birlikte gelen çevrimdışı şehir dizini: arama kutusunun otomatik
+tamamlaması ve yazılan adın OWM şehir ID'sine (id= sorgusu) çevrilmesi.
+
+Ham metni q= ile göndermek, yazım hatasında bile tam bir ağ gidiş dönüşüne
+("Bulunamadı!") ve her aramada sunucu tarafında ad çözümlemesine mal oluyordu.
+Dizin OWM'nin şehir listesinden (~200 bin şehir) bir kez üretilir:
+
+  - adlar Türkçe kurallarla katlanır (İ/I/ı -> i, ş -> s, ğ -> g, aksanlar atılır)
+  - katlanmış anahtarlar sıralı tutulur; önek araması ikili aramadır
+  - yazım hatasında sıralı dizi örtük bir trie gibi gezilir (aynı öneki paylaşan
+    kayıtlar bitişiktir) ve Levenshtein satırı, bitişik harflerin yer değiştirmesi
+    dahil, en fazla CITY_FUZZY_MAX_EDITS hataya kadar taşınır
+  - tercih edilen ülkelerin (CITY_INDEX_PREFERRED) şehirleri ayrı bölümdedir ve önce gelir
+
+Dosya mmap ile açılır, diziler kopyalanmadan doğrudan dosyadan okunur: bellek
+kullanımı şehir sayısına ve arama sayısına göre büyümez. Atlas gibi uygulamayla
+birlikte paketlenir (PyInstaller: --add-data "cities.idx;.").
+
+Oluşturma (kaynak dosya ya da adres, .gz olabilir):
+    python city_index.py
+    python city_index.py city.list.json.gz --output /tmp/cities.idx
+"""
+import os
+import re
+import sys
+import gzip
+import json
+import mmap
+import array
+import struct
+import argparse
+import unicodedata
+from collections import namedtuple
+
+import config
+
+MAGIC = b"AHDCITY1"
+_HEADER = struct.Struct("<I")  # Başlık JSON'unun bayt uzunluğu
+_ALIGN = 4                     # uint32 dizileri bu sınıra hizalanır
+
+# distance: 0 ise ad yazılanla başlıyor, değilse yazım hatası payıyla bulundu
+CityMatch = namedtuple("CityMatch", ["id", "label", "distance"])
+
+
+# --- KATLAMA ---
+_FOLD = str.maketrans({"İ": "i", "I": "i", "ı": "i", "ß": "ss", "ø": "o", "Ø": "o", "æ": "ae", "Æ": "ae",
+                       "œ": "oe", "Œ": "oe", "ł": "l", "Ł": "l", "đ": "d", "Đ": "d", "þ": "th", "Þ": "th"})
+_SEPARATORS = re.compile(r"[^0-9a-z]+")
+
+
+def fold(text):
+    """Büyük/küçük harf ve aksan farkı olmayan arama anahtarı: 'Şanlıurfa' -> 'sanliurfa'."""
+    # lower() 'İ'yi 'i̇' yapar; Türkçe harfler önce elle çevrilir
+    text = unicodedata.normalize("NFKD", str(text).translate(_FOLD))
+    text = "".join(c for c in text if not unicodedata.combining(c)).lower()
+    return _SEPARATORS.sub(" ", text).strip()
+
+
+def max_edits(length):
+    """Sorgu uzunluğuna göre hata payı: kısa sorguda tek hata bile sonucu boğar."""
+    if length < 4:
+        return 0
+    return min(config.CITY_FUZZY_MAX_EDITS, 1 if length < 8 else 2)
+
+
+def _step(row, prev_row, key, char, prev_char, depth, edits):
+    """
+    Levenshtein satırını bir karakter (öneğin `depth`. harfi) ilerletir; bitişik iki
+    harfin yer değiştirmesi tek hatadır. Sadece köşegenden en fazla `edits` uzak
+    hücreler hesaplanır, diğerleri zaten sınırı aşar (edits + 1 yazılır).
+    """
+    over = edits + 1
+    new = [over] * (len(key) + 1)
+    new[0] = min(depth, over)
+    for j in range(max(1, depth - edits), min(len(key), depth + edits) + 1):
+        q = key[j - 1]
+        best = min(new[j - 1] + 1, row[j] + 1, row[j - 1] + (q != char))
+        if prev_row is not None and j > 1 and q == prev_char and key[j - 2] == char:
+            best = min(best, prev_row[j - 2] + 1)
+        new[j] = min(best, over)
+    return new
+
+
+# --- OLUŞTURMA ---
+def read_city_list(source=config.CITY_LIST_URL):
+    """OWM city.list.json(.gz) kayıtları; kaynak dosya yolu ya da adres olabilir."""
+    if source.startswith(("http://", "https://")):
+        from http_client import HttpTransport
+        raw = HttpTransport().get_bytes(source)
+    else:
+        with open(source, "rb") as f:
+            raw = f.read()
+    if raw[:2] == b"\x1f\x8b":
+        raw = gzip.decompress(raw)
+    return json.loads(raw)
+
+
+def build_index(path=config.CITY_INDEX_PATH, cities=(), preferred=config.CITY_INDEX_PREFERRED):
+    """
+    Şehir kayıtlarından (id, name, state, country) dizini `path`e yazar; (şehir
+    sayısı, dosya boyutu) döner. Adı katlanınca boş kalanlar (Latin olmayan yazı)
+    ve etiketi aynı olan tekrarlar atlanır.
+    """
+    groups = ([], [])
+    seen = set()
+    for city in cities:
+        name = city.get("name") or ""
+        key = fold(name)
+        label = ", ".join(part for part in (name, city.get("state"), city.get("country")) if part)
+        if not key or label in seen:
+            continue
+        seen.add(label)
+        groups[city.get("country") not in preferred].append(
+            (key.encode("ascii"), label.encode("utf-8"), int(city["id"])))
+
+    parts, sections = [], []
+    size = 0
+
+    def put(data):
+        """Veri bölgesine ekler, başlangıç konumunu döner."""
+        nonlocal size
+        padding = -size % _ALIGN
+        parts.append(b"\0" * padding + data)
+        size += padding + len(data)
+        return size - len(data)
+
+    def blob(values):
+        offsets = array.array("I", [0])
+        for value in values:
+            offsets.append(offsets[-1] + len(value))
+        return put(b"".join(values)), put(offsets.tobytes())
+
+    for countries, rows in zip((list(preferred), None), groups):
+        rows.sort()
+        keys, key_offsets = blob([key for key, _, _ in rows])
+        labels, label_offsets = blob([label for _, label, _ in rows])
+        ids = put(array.array("I", [city_id for _, _, city_id in rows]).tobytes())
+        sections.append({"countries": countries, "count": len(rows), "keys": keys,
+                         "key_offsets": key_offsets, "labels": labels,
+                         "label_offsets": label_offsets, "ids": ids})
+
+    header = json.dumps({"byteorder": sys.byteorder, "size": size, "sections": sections}).encode("utf-8")
+    start = len(MAGIC) + _HEADER.size + len(header)
+    padding = b"\0" * (-start % _ALIGN)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(MAGIC + _HEADER.pack(len(header) + len(padding)) + header + padding)
+        for part in parts:
+            f.write(part)
+    os.replace(tmp, path)
+    return sum(s["count"] for s in sections), os.path.getsize(path)
+
+
+# --- ARAMA ---
+class _Section:
+    """Dizinin bir bölümü: katlanmış anahtara göre sıralı kayıtlar, hepsi mmap üzerinde."""
+
+    def __init__(self, buf, data, meta):
+        self.count = meta["count"]
+        self._buf = buf
+        self._keys = data + meta["keys"]
+        self._key_offsets = self._uint32(data + meta["key_offsets"], self.count + 1)
+        self._labels = data + meta["labels"]
+        self._label_offsets = self._uint32(data + meta["label_offsets"], self.count + 1)
+        self._ids = self._uint32(data + meta["ids"], self.count)
+
+    def _uint32(self, start, count):
+        return memoryview(self._buf)[start:start + count * 4].cast("I")
+
+    def key(self, i):
+        base, offsets = self._keys, self._key_offsets
+        return self._buf[base + offsets[i]:base + offsets[i + 1]]
+
+    def match(self, i, distance):
+        base, offsets = self._labels, self._label_offsets
+        label = self._buf[base + offsets[i]:base + offsets[i + 1]].decode("utf-8")
+        return CityMatch(self._ids[i], label, distance)
+
+    def lower_bound(self, target, lo=0, hi=None):
+        """Anahtarı `target`ten küçük olmayan ilk kaydın sırası."""
+        hi = self.count if hi is None else hi
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.key(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def prefix_range(self, prefix, lo=0, hi=None):
+        """Anahtarı `prefix` ile başlayan kayıtların [lo, hi) aralığı (anahtarlar ASCII)."""
+        lo = self.lower_bound(prefix, lo, hi)
+        return lo, self.lower_bound(prefix + b"\xff", lo, hi)
+
+    def _gallop(self, target, lo, hi):
+        """
+        lower_bound'un, sonucun `lo`ya yakın olduğu durum için hali (key(lo) < target):
+        adım ikiye katlanarak ilerlenir, sonra dar aralıkta ikili arama yapılır.
+        Trie'nin derin düğümlerinde çocuk aralıkları birkaç kayıttır.
+        """
+        step, bound = 1, lo + 1
+        while bound < hi and self.key(bound) < target:
+            lo, step = bound, step * 2
+            bound = lo + step
+        return self.lower_bound(target, lo + 1, min(bound, hi))
+
+    def fuzzy(self, key, edits, limit):
+        """
+        Bir öneki `key`e en fazla `edits` hata uzaklıkta olan kayıtlardan en fazla
+        `limit` tanesi, ad sırasıyla. İlk harf doğru kabul edilir (hatalar nadiren
+        baştadır); gezilen düğüm sayısı bu sayede onlarca kat azalır.
+        """
+        n = len(key)
+        lo, hi = self.prefix_range(key[:1])
+        if lo == hi:
+            return []
+        found = []
+        start = _step(list(range(n + 1)), None, key, key[0], None, 1, edits)
+        stack = [(1, lo, hi, start, None, key[0])]
+        while stack:
+            depth, lo, hi, row, prev_row, prev_char = stack.pop()
+            if row[n] <= edits:  # Bu önekle başlayan her kayıt uyar
+                found += [self.match(i, row[n]) for i in range(lo, min(hi, lo + limit - len(found)))]
+                if len(found) >= limit:
+                    break
+                continue
+            children = []
+            if min(row) == edits:
+                # Satır sınırda: çocuğu sadece sorgunun devamı olan (ya da yer değiştiren)
+                # harf yaşatabilir, diğer harflerin aralıklarına hiç bakılmaz
+                prefix = self.key(lo)[:depth]
+                chars = {key[j] for j in range(n) if row[j] <= edits}
+                if prev_row is not None:
+                    chars.update(key[j - 2] for j in range(2, n + 1)
+                                 if key[j - 1] == prev_char and prev_row[j - 2] < edits)
+                for char in sorted(chars):
+                    start, end = self.prefix_range(prefix + bytes((char,)), lo, hi)
+                    if start < end:
+                        child = _step(row, prev_row, key, char, prev_char, depth + 1, edits)
+                        if min(child) <= edits:
+                            children.append((depth + 1, start, end, child, row, char))
+            else:
+                i = lo
+                while i < hi:
+                    k = self.key(i)
+                    if len(k) == depth:  # Önekin kendisi olan ad; çocuğu yok
+                        i += 1
+                        continue
+                    char = k[depth]
+                    end = self._gallop(k[:depth] + bytes((char + 1,)), i, hi)
+                    child = _step(row, prev_row, key, char, prev_char, depth + 1, edits)
+                    if min(child) <= edits:
+                        children.append((depth + 1, i, end, child, row, char))
+                    i = end
+            stack += reversed(children)  # Ad sırasıyla gezilsin
+        return found
+
+
+class CityIndex:
+    """
+    mmap ile açılmış şehir dizini. Salt okunurdur; aramalar herhangi bir
+    thread'den yapılabilir.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if self._map[:len(MAGIC)] != MAGIC:
+                raise ValueError("şehir dizini dosyası değil")
+            (length,) = _HEADER.unpack_from(self._map, len(MAGIC))
+            start = len(MAGIC) + _HEADER.size
+            header = json.loads(bytes(self._map[start:start + length]).rstrip(b"\0"))
+            if header["byteorder"] != sys.byteorder:
+                raise ValueError("dizin başka bayt sıralı bir makinede üretilmiş")
+            data = start + length
+            if data + header["size"] > len(self._map):
+                raise ValueError("dizin dosyası eksik")
+            self._sections = [_Section(self._map, data, meta) for meta in header["sections"]]
+        except (ValueError, KeyError, TypeError, struct.error):
+            self._map.close()
+            raise
+
+    def __len__(self):
+        return sum(section.count for section in self._sections)
+
+    def resolve(self, text):
+        """Katlanmış adı tam eşleşen ilk şehir (tercih edilen ülkeler önce); yoksa None."""
+        key = fold(text).encode("ascii")
+        if not key:
+            return None
+        for section in self._sections:
+            i = section.lower_bound(key)
+            if i < section.count and section.key(i) == key:
+                return section.match(i, 0)
+        return None
+
+    def search(self, text, limit=config.AUTOCOMPLETE_LIMIT):
+        """
+        Otomatik tamamlama önerileri, en fazla `limit` CityMatch: adı yazılanla
+        başlayanlar; hiç yoksa yazım hatası payıyla benzerleri.
+        """
+        key = fold(text).encode("ascii")
+        if not key:
+            return []
+        found = []
+        for section in self._sections:
+            lo, hi = section.prefix_range(key)
+            found += [section.match(i, 0) for i in range(lo, min(hi, lo + limit - len(found)))]
+            if len(found) >= limit:
+                break
+        # Hata payı adım adım açılır: az hatayla bulunduysa daha uzak (ve pahalı) adaylara bakılmaz
+        for edits in range(1, max_edits(len(key)) + 1):
+            if found:
+                break
+            for section in self._sections:
+                found += section.fuzzy(key, edits, limit - len(found))
+                if len(found) >= limit:
+                    break
+        return found
+
+
+def open_index(path=config.CITY_INDEX_PATH):
+    """Dizin varsa ve okunabiliyorsa CityIndex, yoksa None (arama eskisi gibi q= ile yapılır)."""
+    try:
+        return CityIndex(path)
+    except (OSError, ValueError, KeyError, TypeError, struct.error):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Çevrimdışı şehir dizinini oluşturur.")
+    parser.add_argument("source", nargs="?", default=config.CITY_LIST_URL,
+                        help="OWM city.list.json(.gz) dosyası ya da adresi")
+    parser.add_argument("--output", default=config.CITY_INDEX_PATH)
+    args = parser.parse_args(argv)
+    count, size = build_index(args.output, read_city_list(args.source))
+    print(f"{args.output}: {count} şehir, {size / 2**20:.1f} MiB", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
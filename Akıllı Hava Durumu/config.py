@@ -1,7 +1,83 @@
 # config.py
+import os
+import sys
 
-API_KEY = "BURAYA_KENDI_API_KEYINIZI_YAZIN"
-FORECAST_URL = "http://api.openweathermap.org/data/2.5/forecast"
+# Sunucuda / toplu araçlarda dosyayı düzenlemeden ortam değişkeniyle de verilebilir
+API_KEY = os.environ.get("OWM_API_KEY", "BURAYA_KENDI_API_KEYINIZI_YAZIN")
+FORECAST_URL = os.environ.get("OWM_FORECAST_URL", "http://api.openweathermap.org/data/2.5/forecast")
+ICON_URL = os.environ.get("OWM_ICON_URL", "https://openweathermap.org/img/wn/{code}@4x.png")
+
+# --- AĞ AYARLARI ---
+HTTP_CONNECT_TIMEOUT = 3.05  # saniye
+HTTP_READ_TIMEOUT = 10
+HTTP_RETRIES = 3             # İlk denemeden sonra en fazla kaç kez tekrar denensin
+HTTP_BACKOFF = 0.3           # Üstel geri çekilmenin taban süresi (saniye)
+HTTP_BACKOFF_MAX = 5
+HTTP_POOL_SIZE = 10          # Host başına açık tutulacak bağlantı sayısı
+HTTP_CHUNK_SIZE = 16 * 1024  # Akışla okunan gövdelerde parça boyutu (bayt)
+
+# Arka plan işlerini (tahmin, ikon) çalıştıran sabit işçi sayısı
+WORKER_THREADS = 4
+
+# weather_logic.fetch_many için aynı anda açık tutulacak en fazla istek
+FETCH_CONCURRENCY = 8
+
+# --- ÖNBELLEK AYARLARI ---
+# Tahmin verisi OWM tarafında 3 saatte bir (UTC 00, 03, 06...) güncellenir
+FORECAST_SLOT_SECONDS = 3 * 60 * 60
+APP_DATA_DIR = os.path.join(os.path.expanduser("~"), ".akilli_hava_durumu")
+CACHE_DIR = os.path.join(APP_DATA_DIR, "cache")
+CACHE_MAX_ITEMS = 512       # Bellekte tutulacak en fazla şehir sayısı
+CACHE_MAX_STALE = 3 * 60 * 60  # Süresi dolmuş kayıt bu kadar saniye daha "bayat" olarak sunulabilir
+
+ICON_CACHE_DIR = os.path.join(APP_DATA_DIR, "icons")
+ICON_CACHE_MAX_ITEMS = 128  # Bellekte tutulacak hazır ikon (pixmap) sayısı
+# Uygulamayla birlikte paketlenen dosyaların klasörü (PyInstaller'da geçici açılış klasörü)
+BUNDLE_DIR = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
+# Tüm ikonların hazır boyutlandırılmış hali (icon_atlas.py); uygulamayla birlikte paketlenir
+ICON_ATLAS_PATH = os.path.join(BUNDLE_DIR, "icons.atlas")
+ICON_ATLAS_DPRS = (1.0, 1.25, 1.5, 2.0)  # Windows'un yaygın ölçekleri; diğerleri en yakından ölçeklenir
+CHART_CACHE_MAX_ITEMS = 24  # Hazır çizilmiş gün grafiği sayısı (4 şehir x 6 gün)
+
+# --- GRAFİK ARA DEĞERLEME (forecast_interp.py) ---
+INTERP_STEP_SECONDS = 60 * 60  # 3 saatlik dilimler grafikte bu aralıkla sıklaştırılır
+INTERP_CACHE_MAX_ITEMS = 32    # Ara değerlenmiş tahmin sayısı (veri özetine göre)
+CHART_ARROW_SPACING_H = 2      # Rüzgar yön okları arası (saat)
+
+# --- ŞEHİR DİZİNİ (city_index.py) ---
+# Arama kutusunun otomatik tamamlaması; OWM şehir listesinden üretilip uygulamayla paketlenir
+CITY_LIST_URL = "http://bulk.openweathermap.org/sample/city.list.json.gz"
+CITY_INDEX_PATH = os.path.join(BUNDLE_DIR, "cities.idx")
+CITY_INDEX_PREFERRED = ("TR",)  # Bu ülkelerin şehirleri önerilerde önce gelir
+CITY_FUZZY_MAX_EDITS = 2        # Yazım hatası payı (kısa sorgularda daha az)
+AUTOCOMPLETE_LIMIT = 8          # Gösterilecek en fazla öneri
+AUTOCOMPLETE_DEBOUNCE_MS = 150  # Yazma durduktan bu kadar sonra öneriler güncellenir
+
+# Çekilen tahminlerin kalıcı geçmişi (forecast_store.py)
+STORE_PATH = os.path.join(APP_DATA_DIR, "forecasts.sqlite3")
+STORE_BATCH = 256  # Toplu araçlarda tek transaction'a yazılan şehir sayısı
+
+# --- TAHMİN SERVİSİ (forecast_service.py) ---
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = 8080
+SERVICE_BACKLOG = 1024
+SERVICE_WORKERS = 8              # Önbellekte olmayan şehirleri çeken / cevabını hazırlayan işçiler
+SERVICE_MAX_ITEMS = CACHE_MAX_ITEMS  # Olay döngüsünde tutulan hazır (JSON + gzip) cevap sayısı
+SERVICE_RECHECK_SECONDS = 30     # Hazır cevap en geç bu kadar sonra tahmin önbelleğiyle yeniden karşılaştırılır
+SERVICE_KEEPALIVE_TIMEOUT = 15   # Boşta kalan bağlantı bu kadar saniye sonra kapatılır
+SERVICE_WRITE_BUFFER = 256 * 1024  # Yazma tamponu bunu aşarsa istemci okuyana kadar beklenir
+SERVICE_GZIP_MIN = 1024          # Bundan küçük gövdeler sıkıştırılmaz
+SERVICE_GZIP_LEVEL = 6
+
+# Performans izleme (perf_trace.py). Arayüzde F12 katmanı açınca da devreye girer.
+PERF_TRACE = os.environ.get("AHD_PERF_TRACE") == "1"
+PERF_OVERLAY_INTERVAL_MS = 500
+PERF_EXPORT_DIR = os.path.join(APP_DATA_DIR, "perf")
+
+# --- ZAMANLANMIŞ YENİLEME (refresh_scheduler.py) ---
+REFRESH_DELAY = 5 * 60    # Dilim sınırından sonra bu kadar bekle (OWM yeni veriyi biraz geç yayınlar)
+REFRESH_JITTER = 5 * 60   # Üstüne eklenen en fazla rastgele süre
+FAVORITE_CITIES = []      # Ekrandaki şehirle birlikte her yenilemede çekilecek şehirler
 
 APP_TITLE = "Akıllı Hava Durumu"
 APP_WIDTH = 1200
@@ -22,6 +98,7 @@ WEATHER_BG_COLORS = {
     "13d": "#95a5a6", "13n": "#535c68",
     "50d": "#636e72", "50n": "#2d3436"
 }
+THEME_TRANSITION_MS = 500  # Arka plan renginin bir temadan diğerine geçiş süresi (0: anında)
 
 # --- YENİ AYARLAR ---
 # Sol panel artık dümdüz değil, sağ taraf gibi "kart" görünümünde ama daha koyu
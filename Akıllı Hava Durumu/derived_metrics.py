@@ -0,0 +1,195 @@
+# derived_metrics.py
+"""
+Ham tahmin sütunlarından türetilen ölçüler: çiy noktası, sıcaklık endeksi (heat
+index), rüzgar soğuğu (wind chill), hissedilen sıcaklık, günlük yağış toplamları
+ve günün en sert rüzgar hamlesi.
+
+Hesaplar tek bir şehre değil, istenen sayıda ForecastFrame'in art arda eklenmiş
+(düz) sütunlarına tek geçişte uygulanır; dilim ya da gün başına Python döngüsü
+yoktur. Günler düz dizide de bitişik durduğu için günlük toplam / en büyük
+değerler tek bir reduceat ile bulunur. Python'da sadece şehir başına bir kez
+(sütunları birleştirmek için) dönülür.
+
+Formüller °C ve m/s üzerinden yazılmıştır; "imperial" (°F, mph) ve "standard"
+(K, m/s) birimlerindeki girdiler önce çevrilir, sıcaklık sonuçları yine girdinin
+biriminde döner. Yağış miktarları her zaman mm'dir.
+"""
+import numpy as np
+
+# Rüzgar soğuğu sadece bu koşullarda tanımlı (NWS / Environment Canada)
+WIND_CHILL_MAX_TEMP = 10.0   # °C
+WIND_CHILL_MIN_WIND = 4.8    # km/h
+# Sıcaklık endeksi bu sıcaklıktan itibaren hissedilen sıcaklığa yansır (80 °F)
+HEAT_INDEX_MIN_TEMP = 26.7   # °C
+
+
+# --- BİRİMLER ---
+def to_celsius(temp, units="metric"):
+    temp = np.asarray(temp, dtype=np.float64)
+    if units == "imperial":
+        return (temp - 32.0) * (5.0 / 9.0)
+    if units == "standard":
+        return temp - 273.15
+    return temp
+
+
+def from_celsius(temp_c, units="metric"):
+    if units == "imperial":
+        return temp_c * 1.8 + 32.0
+    if units == "standard":
+        return temp_c + 273.15
+    return temp_c
+
+
+def to_ms(wind, units="metric"):
+    wind = np.asarray(wind, dtype=np.float64)
+    return wind * 0.44704 if units == "imperial" else wind
+
+
+# --- DİLİM BAZLI ÖLÇÜLER (°C, m/s; her şekilde dizi) ---
+def dew_point(temp_c, humidity):
+    """Magnus formülüyle çiy noktası (°C). Nem %1-100 aralığına kırpılır."""
+    a, b = 17.625, 243.04
+    rh = np.clip(np.asarray(humidity, dtype=np.float64), 1.0, 100.0)
+    gamma = np.log(rh / 100.0) + a * temp_c / (b + temp_c)
+    return b * gamma / (a - gamma)
+
+
+def heat_index(temp_c, humidity):
+    """
+    NWS sıcaklık endeksi (°C): önce Steadman'ın basit formülü, sonuç 80 °F'yi
+    geçiyorsa Rothfusz regresyonu ve çok kuru / çok nemli hava düzeltmeleri.
+    """
+    t = temp_c * 1.8 + 32.0
+    rh = np.asarray(humidity, dtype=np.float64)
+    simple = 0.5 * (t + 61.0 + (t - 68.0) * 1.2 + rh * 0.094)
+    full = (-42.379 + 2.04901523 * t + 10.14333127 * rh - 0.22475541 * t * rh
+            - 0.00683783 * t * t - 0.05481717 * rh * rh + 0.00122874 * t * t * rh
+            + 0.00085282 * t * rh * rh - 0.00000199 * t * t * rh * rh)
+    dry = (rh < 13) & (t >= 80) & (t <= 112)
+    full -= np.where(dry, (13 - rh) / 4 * np.sqrt(np.clip((17 - np.abs(t - 95)) / 17, 0, None)), 0.0)
+    humid = (rh > 85) & (t >= 80) & (t <= 87)
+    full += np.where(humid, (rh - 85) / 10 * (87 - t) / 5, 0.0)
+    hi = np.where((simple + t) / 2 >= 80, full, simple)
+    return (hi - 32.0) * (5.0 / 9.0)
+
+
+def wind_chill(temp_c, wind_ms):
+    """Rüzgar soğuğu (°C); tanımlı olmadığı yerde (ılık ya da durgun hava) sıcaklığın kendisi."""
+    v = np.asarray(wind_ms, dtype=np.float64) * 3.6
+    vp = np.power(np.maximum(v, WIND_CHILL_MIN_WIND), 0.16)
+    wc = 13.12 + 0.6215 * temp_c - 11.37 * vp + 0.3965 * temp_c * vp
+    return np.where((temp_c <= WIND_CHILL_MAX_TEMP) & (v > WIND_CHILL_MIN_WIND), wc, temp_c)
+
+
+def apparent_temperature(temp_c, humidity, wind_ms):
+    """
+    Hissedilen sıcaklık (°C): soğukta rüzgar soğuğu, sıcakta sıcaklık endeksi,
+    aradaki ılık bantta ölçülen sıcaklık (NWS'in "feels like" birleşimi).
+    """
+    hot = np.where(temp_c >= HEAT_INDEX_MIN_TEMP, heat_index(temp_c, humidity), temp_c)
+    return np.where(temp_c <= WIND_CHILL_MAX_TEMP, wind_chill(temp_c, wind_ms), hot)
+
+
+# --- TOPLU HESAP ---
+class DerivedMetrics:
+    """
+    compute()'un sonucu. Dilim dizileri tüm şehirlerin dilimlerini art arda tutar
+    (i. şehir: slot_offsets[i]:slot_offsets[i+1]); günlük diziler de aynı şekilde
+    tüm şehirlerin günlerini (i. şehir: day_offsets[i]:day_offsets[i+1]).
+    """
+
+    SLOT_FIELDS = ("dew_point", "heat_index", "wind_chill", "apparent", "wind_peak", "precip")
+    DAY_FIELDS = ("day_precip", "day_rain", "day_snow", "day_gust", "day_apparent_min", "day_apparent_max")
+
+    # Kural motorunun bantları °C ve m/s'dir; girdinin biriminden bağımsız olarak bu ikisi tutulur
+    ADVICE_FIELDS = ("apparent_c", "wind_peak_ms")
+
+    __slots__ = ("units", "slot_offsets", "day_offsets") + SLOT_FIELDS + DAY_FIELDS + ADVICE_FIELDS
+
+    def __len__(self):
+        return len(self.slot_offsets) - 1
+
+    def slots(self, i):
+        """i. şehrin dilim ölçüleri: alan adı -> dizi (görünüm, kopya yok)."""
+        s = slice(int(self.slot_offsets[i]), int(self.slot_offsets[i + 1]))
+        return {name: getattr(self, name)[s] for name in self.SLOT_FIELDS}
+
+    def daily(self, i):
+        """i. şehrin gün gün özeti (sade Python tipleri); günlük kartlar bunu gösterir."""
+        s = slice(int(self.day_offsets[i]), int(self.day_offsets[i + 1]))
+        columns = [np.round(getattr(self, name)[s].astype(np.float64), 1).tolist() for name in self.DAY_FIELDS]
+        keys = [name[4:] for name in self.DAY_FIELDS]  # "day_precip" -> "precip"
+        return [dict(zip(keys, row)) for row in zip(*columns)]
+
+    def advice_inputs(self, i):
+        """
+        i. şehir için kural motorunun girdileri: (hissedilen sıcaklık °C, en yüksek rüzgar
+        m/s, yağış mm). `units` ne olursa olsun aynı hava aynı girdileri verir.
+        """
+        s = slice(int(self.slot_offsets[i]), int(self.slot_offsets[i + 1]))
+        return self.apparent_c[s], self.wind_peak_ms[s], self.precip[s]
+
+
+def compute(frames, units="metric"):
+    """
+    ForecastFrame listesinin tüm dilimleri için ölçüleri tek geçişte hesaplar.
+    Sıcaklık sonuçları `units` biriminde, rüzgar girdinin biriminde, yağış mm olarak döner.
+    """
+    frames = list(frames)
+    columns = {name: np.concatenate([getattr(f, name) for f in frames]) if frames else np.zeros(0)
+               for name in ("temp", "humidity", "wind_speed", "wind_gust", "rain", "snow")}
+    slot_counts = [len(f) for f in frames]
+    day_counts = [f.day_count for f in frames]
+    # Günlerin düz dizideki başlangıçları: şehrin kendi gün sınırları + şehrin ilk diliminin yeri
+    slot_offsets = np.zeros(len(frames) + 1, dtype=np.int64)
+    np.cumsum(slot_counts, out=slot_offsets[1:])
+    day_starts = (np.concatenate([f.day_offsets[:-1] for f in frames]).astype(np.int64)
+                  + np.repeat(slot_offsets[:-1], day_counts)) if frames else np.zeros(0, dtype=np.int64)
+    day_offsets = np.zeros(len(frames) + 1, dtype=np.int64)
+    np.cumsum(day_counts, out=day_offsets[1:])
+    return compute_arrays(columns["temp"], columns["humidity"], columns["wind_speed"], columns["wind_gust"],
+                          columns["rain"], columns["snow"], slot_offsets, day_offsets, day_starts, units)
+
+
+def compute_arrays(temp, humidity, wind_speed, wind_gust, rain, snow, slot_offsets, day_offsets,
+                   day_starts, units="metric"):
+    """compute()'un dizi hali: düz sütunlar ve şehir / gün sınırlarıyla doğrudan çağrılabilir."""
+    temp_c = to_celsius(temp, units)
+    wind_ms = to_ms(wind_speed, units)
+    wind_peak = np.maximum(wind_speed, wind_gust, dtype=np.float64)
+
+    m = DerivedMetrics()
+    m.units = units
+    m.slot_offsets = slot_offsets
+    m.day_offsets = day_offsets
+    heat_c = heat_index(temp_c, humidity)
+    chill_c = wind_chill(temp_c, wind_ms)
+    # apparent_temperature() ile aynı birleşim; endeksler bir kez hesaplansın diye burada açık
+    apparent_c = np.where(temp_c <= WIND_CHILL_MAX_TEMP, chill_c,
+                          np.where(temp_c >= HEAT_INDEX_MIN_TEMP, heat_c, temp_c))
+    m.dew_point = from_celsius(dew_point(temp_c, humidity), units)
+    m.heat_index = from_celsius(heat_c, units)
+    m.wind_chill = from_celsius(chill_c, units)
+    m.apparent = from_celsius(apparent_c, units)
+    m.wind_peak = wind_peak
+    m.apparent_c = apparent_c
+    m.wind_peak_ms = to_ms(wind_peak, units)
+    m.precip = np.add(rain, snow, dtype=np.float64)
+
+    if len(day_starts):
+        m.day_precip = np.add.reduceat(m.precip, day_starts)
+        m.day_rain = np.add.reduceat(rain, day_starts, dtype=np.float64)
+        m.day_snow = np.add.reduceat(snow, day_starts, dtype=np.float64)
+        m.day_gust = np.maximum.reduceat(wind_peak, day_starts)
+        m.day_apparent_min = np.minimum.reduceat(m.apparent, day_starts)
+        m.day_apparent_max = np.maximum.reduceat(m.apparent, day_starts)
+    else:
+        for name in DerivedMetrics.DAY_FIELDS:
+            setattr(m, name, np.zeros(0))
+    return m
+
+
+def for_frame(frame, units="metric"):
+    """Tek şehir için compute(); arayüz her yeni tahminde bunu bir kez çağırır."""
+    return compute([frame], units)
@@ -0,0 +1,155 @@
+# forecast_cache.py
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+import config
+
+
+def next_slot_boundary(now=None):
+    """Verilen andan sonraki ilk 3 saatlik tahmin diliminin (UTC) epoch zamanını döner."""
+    now = time.time() if now is None else now
+    slot = config.FORECAST_SLOT_SECONDS
+    return (int(now) // slot + 1) * slot
+
+
+# lower() 'İ'yi 'i̇' (i + birleşen nokta) yapar; I / ı da klavyeye göre karışık yazılır
+_DOTTED_I = str.maketrans({"İ": "i", "I": "i", "ı": "i"})
+
+
+def city_key(city):
+    """Şehir adının karşılaştırma hali: boşluklar sadeleşir, Türkçe I/İ/ı farkı ve büyük harf gider."""
+    return " ".join(str(city).translate(_DOTTED_I).split()).lower()
+
+
+def make_key(city, units="metric", lang="tr"):
+    """' kocaeli ', 'KOCAELİ' gibi yazımların aynı kayda düşmesi için anahtarı normalize eder."""
+    return f"{city_key(city)}|{units}|{lang}"
+
+
+class ForecastCache:
+    """
+    /forecast cevapları için iki katmanlı önbellek:
+    bellekte sınırlı bir LRU, arkasında da diskte şehir başına bir JSON dosyası.
+    Kayıtlar bir sonraki tahmin diliminde eskir; eskiyen kayıt CACHE_MAX_STALE
+    süresince yine sunulur ve arka planda yenilenir (stale-while-revalidate).
+    `dump` / `load` değeri diske yazarken JSON'a çevirir ve geri kurar
+    (varsayılan: değer zaten JSON'a uygundur).
+    """
+
+    def __init__(self, max_items=config.CACHE_MAX_ITEMS, cache_dir=config.CACHE_DIR,
+                 max_stale=config.CACHE_MAX_STALE, dump=None, load=None):
+        self.max_items = max_items
+        self.cache_dir = cache_dir
+        self.max_stale = max_stale
+        self.dump = dump or (lambda data: data)
+        self.load = load or (lambda data: data)
+        self._items = OrderedDict()  # key -> (expires_at, data)
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self.stats = {"hits": 0, "stale_hits": 0, "misses": 0, "evictions": 0,
+                      "disk_reads": 0, "refreshes": 0}
+
+    # --- DİSK ---
+    def _path(self, key):
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, name + ".json")
+
+    def _read_disk(self, key):
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            if entry.get("key") != key:
+                return None
+            return entry["expires_at"], self.load(entry["data"])
+        except (OSError, ValueError, KeyError, TypeError):  # Eski biçimdeki kayıtlar da ıska sayılır
+            return None
+
+    def _write_disk(self, key, expires_at, data):
+        if not self.cache_dir:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._path(key)
+            tmp = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "expires_at": expires_at, "data": self.dump(data)}, f)
+            os.replace(tmp, path)  # Yarım yazılmış dosya okunmasın
+        except OSError:
+            pass  # Disk önbelleği yazılamazsa uygulama bellekle devam eder
+
+    # --- BELLEK (LRU) ---
+    def _remember(self, key, expires_at, data):
+        with self._lock:
+            self._items[key] = (expires_at, data)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def lookup(self, key, now=None):
+        """
+        (data, taze_mi) döner. Kayıt yoksa ya da bayatlık sınırını aştıysa None.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is not None:
+                self._items.move_to_end(key)
+
+        if entry is None:
+            entry = self._read_disk(key)
+            if entry is not None:
+                with self._lock:
+                    self.stats["disk_reads"] += 1
+                self._remember(key, *entry)
+
+        with self._lock:
+            if entry is None or now >= entry[0] + self.max_stale:
+                self.stats["misses"] += 1
+                return None
+            if now < entry[0]:
+                self.stats["hits"] += 1
+                return entry[1], True
+            self.stats["stale_hits"] += 1
+            return entry[1], False
+
+    def store(self, key, data, expires_at=None):
+        expires_at = next_slot_boundary() if expires_at is None else expires_at
+        self._remember(key, expires_at, data)
+        self._write_disk(key, expires_at, data)
+
+    def refresh_async(self, key, loader):
+        """Bayat kaydı arka planda yeniler; aynı anahtar için tek yenileme çalışır."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def worker():
+            try:
+                data = loader()
+                if data:
+                    self.store(key, data)
+                    with self._lock:
+                        self.stats["refreshes"] += 1
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats["size"] = len(self._items)
+        return stats
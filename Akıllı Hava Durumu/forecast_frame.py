@@ -0,0 +1,221 @@
+# forecast_frame.py
+import sys
+import hashlib
+from datetime import datetime
+
+import numpy as np
+
+
+class ForecastFrame:
+    """
+    Bir şehrin 5 günlük / 3 saatlik tahmininin sütun bazlı (NumPy) hali.
+
+    Her alan 40 dilimlik tek bir dizidir; dilimler zamana göre sıralıdır ve
+    günler `day_offsets` ile ayrılır: i. günün dilimleri
+    day_offsets[i]:day_offsets[i+1] aralığındadır. Ham API sözlükleri saklanmaz.
+    """
+
+    __slots__ = ("city", "city_id", "dt", "temp", "feels_like", "humidity", "pressure",
+                 "visibility", "pop", "wind_speed", "wind_deg", "cond_id", "wind_gust", "rain", "snow",
+                 "icon", "desc",
+                 "times", "day_names", "day_offsets", "_day_index", "_slot_hashes")
+
+    # Sayısal sütunlar ve tipleri (metin sütunları: icon, desc).
+    # rain / snow: dilimin 3 saatlik yağış miktarı (mm); cevapta yoksa 0
+    NUMERIC = (("dt", np.int64), ("temp", np.float32), ("feels_like", np.float32),
+               ("humidity", np.int16), ("pressure", np.int16), ("visibility", np.int32),
+               ("pop", np.float32), ("wind_speed", np.float32), ("wind_deg", np.int16),
+               ("cond_id", np.int16), ("wind_gust", np.float32), ("rain", np.float32),
+               ("snow", np.float32))
+
+    @classmethod
+    def from_json(cls, data):
+        """/forecast cevabından (json.loads sonucu) tek geçişte oluşturur."""
+        return cls.from_items(data["list"], data["city"]["name"], data["city"].get("id"))
+
+    @classmethod
+    def from_items(cls, items, city=None, city_id=None):
+        """
+        Dilim sözlüklerinden (herhangi bir iterable, ör. akan bir çözücü) oluşturur.
+        Her sözlüğün gereken alanları hemen kopyalanır, sözlüğün kendisi tutulmaz.
+        """
+        dt, temp, feels_like, humidity, pressure, visibility = [], [], [], [], [], []
+        pop, wind_speed, wind_deg, cond_id, icon, desc = [], [], [], [], [], []
+        wind_gust, rain, snow = [], [], []
+        intern = sys.intern
+        for item in items:
+            main = item["main"]
+            weather = item["weather"][0]
+            wind = item["wind"]
+            dt.append(item["dt"])
+            temp.append(main["temp"])
+            feels_like.append(main.get("feels_like", main["temp"]))
+            humidity.append(main.get("humidity", 0))
+            pressure.append(main.get("pressure", 0))
+            visibility.append(item.get("visibility", 10000))
+            pop.append(item.get("pop", 0))
+            wind_speed.append(wind["speed"])
+            wind_deg.append(wind.get("deg", 0))
+            wind_gust.append(wind.get("gust", wind["speed"]))  # Hamle yoksa ortalama rüzgar
+            rain.append(item["rain"].get("3h", 0) if "rain" in item else 0)
+            snow.append(item["snow"].get("3h", 0) if "snow" in item else 0)
+            cond_id.append(weather.get("id", 0))
+            # Metinler az sayıda farklı değer aldığı için intern edilip paylaşılır
+            icon.append(intern(weather["icon"]))
+            desc.append(intern(weather["description"]))
+
+        self = cls.__new__(cls)
+        self.city = city
+        self.city_id = city_id
+        # Listeler sütun başına tek seferde diziye çevrilir (eleman eleman NumPy ataması yavaş)
+        for (name, dtype), values in zip(cls.NUMERIC, (dt, temp, feels_like, humidity, pressure, visibility,
+                                                        pop, wind_speed, wind_deg, cond_id, wind_gust,
+                                                        rain, snow)):
+            setattr(self, name, np.array(values, dtype=dtype))
+        self.icon = icon
+        self.desc = desc
+        self._index_days()
+        return self
+
+    @classmethod
+    def from_columns(cls, columns):
+        """to_columns() çıktısından geri kurar (disk önbelleği)."""
+        self = cls.__new__(cls)
+        self.city = columns["city"]
+        self.city_id = columns["city_id"]
+        for name, dtype in cls.NUMERIC:
+            if name in columns:
+                setattr(self, name, np.asarray(columns[name], dtype=dtype))
+        # Bu sütunlardan önce yazılmış disk kayıtları: hamle = rüzgar, yağış miktarı yok
+        if "wind_gust" not in columns:
+            self.wind_gust = self.wind_speed.copy()
+        for name in ("rain", "snow"):
+            if name not in columns:
+                setattr(self, name, np.zeros(len(self.dt), dtype=np.float32))
+        self.icon = [sys.intern(s) for s in columns["icon"]]
+        self.desc = [sys.intern(s) for s in columns["desc"]]
+        self._index_days()
+        return self
+
+    def to_columns(self):
+        """JSON'a yazılabilir sütun sözlüğü; ham API cevabının küçük bir kısmı kadar yer tutar."""
+        columns = {"city": self.city, "city_id": self.city_id}
+        for name, _ in self.NUMERIC:
+            columns[name] = getattr(self, name).tolist()
+        columns["icon"] = list(self.icon)
+        columns["desc"] = list(self.desc)
+        return columns
+
+    def _index_days(self):
+        """Saat etiketleri ve gün sınırları (yerel saate göre)."""
+        n = len(self.dt)
+        self.times = [None] * n
+        day_names = []
+        offsets = []
+        last_date = None
+        for i, ts in enumerate(self.dt.tolist()):
+            dt = datetime.fromtimestamp(ts)
+            self.times[i] = sys.intern(f"{dt.hour:02d}:{dt.minute:02d}")
+            # strftime("%A") yavaş ve dile bağlı; sadece takvim günü değişince çağrılır
+            if dt.date() != last_date:
+                last_date = dt.date()
+                d_name = dt.strftime("%A")
+                if not day_names or day_names[-1] != d_name:
+                    day_names.append(d_name)
+                    offsets.append(i)
+        offsets.append(n)
+
+        self.day_names = day_names
+        self.day_offsets = np.asarray(offsets, dtype=np.int32)
+        self._day_index = {name: i for i, name in enumerate(day_names)}
+        self._slot_hashes = None
+
+    def __len__(self):
+        return len(self.dt)
+
+    # --- GÜN ERİŞİMİ ---
+    @property
+    def day_count(self):
+        return len(self.day_names)
+
+    def day_index(self, day_name):
+        """Gün adının sırasını döner, yoksa None."""
+        return self._day_index.get(day_name)
+
+    def day_slice(self, day):
+        return slice(int(self.day_offsets[day]), int(self.day_offsets[day + 1]))
+
+    def day_series(self, day):
+        """Grafikler için günün dilim serileri (NumPy görünümleri, kopya yok)."""
+        s = self.day_slice(day)
+        return {"times": self.times[s], "temps": self.temp[s], "rains": self.pop[s] * 100,
+                "winds": self.wind_speed[s], "degs": self.wind_deg[s]}
+
+    # --- GÜN BAZLI VEKTÖREL HESAPLAR ---
+    def _starts(self):
+        return self.day_offsets[:-1]
+
+    def _day_ids(self):
+        return np.repeat(np.arange(self.day_count), np.diff(self.day_offsets))
+
+    def day_min(self, values=None):
+        values = self.temp if values is None else values
+        return np.minimum.reduceat(values, self._starts())
+
+    def day_max(self, values=None):
+        values = self.temp if values is None else values
+        return np.maximum.reduceat(values, self._starts())
+
+    def day_mean(self, values=None):
+        values = self.temp if values is None else values
+        return np.add.reduceat(values.astype(np.float64), self._starts()) / np.diff(self.day_offsets)
+
+    def day_argmax(self, values=None):
+        """Her gün için en büyük değerin (ilk) dilim indeksini, tüm dizi içinde döner."""
+        values = self.temp if values is None else values
+        is_max = values == self.day_max(values)[self._day_ids()]
+        positions = np.where(is_max, np.arange(len(values)), len(values))
+        return np.minimum.reduceat(positions, self._starts())
+
+    def daily_summary(self):
+        """Günlük kartlar için gün adı, ilk dilimin ikonu ve min/maks sıcaklık."""
+        mins, maxs = self.day_min(), self.day_max()
+        return [{"day": name, "icon": self.icon[int(self.day_offsets[i])],
+                 "min": round(float(mins[i]), 2), "max": round(float(maxs[i]), 2)}
+                for i, name in enumerate(self.day_names)]
+
+    # --- DEĞİŞİKLİK TESPİTİ ---
+    def slot_hashes(self):
+        """Her dilimin içerik özeti (zaman dahil); aynı veri her zaman aynı özeti verir."""
+        if self._slot_hashes is None:
+            numeric = np.column_stack([getattr(self, name) for name, _ in self.NUMERIC]).astype(np.float64)
+            hashes = []
+            for i, row in enumerate(numeric):
+                h = hashlib.blake2b(row.tobytes(), digest_size=8)
+                h.update(f"{self.icon[i]}|{self.desc[i]}".encode("utf-8"))
+                hashes.append(h.digest())
+            self._slot_hashes = hashes
+        return self._slot_hashes
+
+    def day_hashes(self):
+        """Gün adı -> o günün dilimlerinin birleşik özeti."""
+        hashes = self.slot_hashes()
+        return {name: hashlib.blake2b(b"".join(hashes[self.day_slice(i)]), digest_size=8).digest()
+                for i, name in enumerate(self.day_names)}
+
+    def changed_days(self, old):
+        """`old`a göre içeriği değişen (ya da yeni gelen) günlerin bu frame'deki sıraları."""
+        old_hashes = old.day_hashes() if old is not None else {}
+        return [i for i, (name, h) in enumerate(self.day_hashes().items()) if old_hashes.get(name) != h]
+
+    # --- TEK DİLİM ---
+    def slot(self, i):
+        """Arayüzün bir dilim için gösterdiği değerler (sade Python tipleri)."""
+        # float32 -> float dönüşümündeki kuyruk basamaklarını API'nin 2 hanesine geri yuvarla
+        return {"dt": int(self.dt[i]), "temp": round(float(self.temp[i]), 2),
+                "feels_like": round(float(self.feels_like[i]), 2), "humidity": int(self.humidity[i]),
+                "pressure": int(self.pressure[i]), "visibility": int(self.visibility[i]),
+                "pop": round(float(self.pop[i]), 2), "wind_speed": round(float(self.wind_speed[i]), 2),
+                "wind_deg": int(self.wind_deg[i]), "cond_id": int(self.cond_id[i]),
+                "wind_gust": round(float(self.wind_gust[i]), 2), "rain": round(float(self.rain[i]), 2),
+                "snow": round(float(self.snow[i]), 2), "icon": self.icon[i], "desc": self.desc[i]}
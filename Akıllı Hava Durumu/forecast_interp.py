@@ -0,0 +1,170 @@
+# forecast_interp.py
+"""
+3 saatlik tahminin grafikler için saatlik (ya da daha sık) hale getirilmesi.
+
+Sıcaklık, rüzgar hızı ve yağış ihtimali şekli koruyan monoton kübik Hermite
+(PCHIP, Fritsch-Carlson) ile ara değerlenir: eğri ölçülen noktalardan geçer,
+iki nokta arasında onların dışına taşmaz (yağış ihtimali %0-100 aralığında, rüzgar
+sıfırın üstünde kalır) ve düz giden kısımlarda dalgalanmaz. Rüzgar yönü açı olarak
+değil birim vektör olarak ara değerlenir; 350° ile 10° arası 180° üzerinden değil
+0° üzerinden geçer.
+
+Tüm seriler bir şehrin bütün dilimleri için tek seferde (vektörel) hesaplanır ve
+verinin özetine göre saklanır: gün değiştirmek ya da aynı veriyle gelen bir
+yenileme hesabı tekrarlatmaz. Ağ maliyeti yoktur; işlemci maliyeti
+benchmarks/bench_interp.py ile ölçülür.
+"""
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+import config
+import perf_trace
+
+
+# --- ARA DEĞERLEME ---
+def _edge_slope(h0, h1, m0, m1):
+    """Uç noktanın eğimi: üç noktalı tahmin, şekli bozmayacak şekilde kırpılır."""
+    d = ((2 * h0 + h1) * m0 - h0 * m1) / (h0 + h1)
+    d = np.where(np.sign(d) != np.sign(m0), 0.0, d)
+    return np.where((np.sign(m0) != np.sign(m1)) & (np.abs(d) > 3 * np.abs(m0)), 3 * m0, d)
+
+
+def pchip(x, y, xi):
+    """
+    Monoton kübik Hermite ara değerleme. x: artan (n,), y: (..., n) — aynı x'i
+    paylaşan birden çok seri tek çağrıda; xi: (m,). (..., m) döner.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    xi = np.asarray(xi, dtype=np.float64)
+    n = len(x)
+    if n < 2:
+        return np.repeat(y[..., :1], len(xi), axis=-1)
+
+    h = np.diff(x)
+    delta = np.diff(y, axis=-1) / h
+    slopes = np.empty_like(y)
+    if n == 2:
+        slopes[..., 0] = slopes[..., 1] = delta[..., 0]
+    else:
+        # İç noktalar: komşu eğimler aynı işaretliyse ağırlıklı harmonik ortalama, değilse 0
+        w1 = 2 * h[1:] + h[:-1]
+        w2 = h[1:] + 2 * h[:-1]
+        left, right = delta[..., :-1], delta[..., 1:]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = (w1 + w2) / (w1 / left + w2 / right)
+        slopes[..., 1:-1] = np.where(left * right > 0, mean, 0.0)
+        slopes[..., 0] = _edge_slope(h[0], h[1], delta[..., 0], delta[..., 1])
+        slopes[..., -1] = _edge_slope(h[-1], h[-2], delta[..., -1], delta[..., -2])
+
+    k = np.clip(np.searchsorted(x, xi, side="right") - 1, 0, n - 2)
+    t = (xi - x[k]) / h[k]
+    t2, t3 = t * t, t * t * t
+    return ((2 * t3 - 3 * t2 + 1) * y[..., k] + (t3 - 2 * t2 + t) * h[k] * slopes[..., k]
+            + (3 * t2 - 2 * t3) * y[..., k + 1] + (t3 - t2) * h[k] * slopes[..., k + 1])
+
+
+def interp_degrees(x, degrees, xi):
+    """Yön (derece) ara değerlemesi: birim vektörler üzerinden, en kısa yay boyunca."""
+    rad = np.radians(np.asarray(degrees, dtype=np.float64))
+    s = np.interp(xi, x, np.sin(rad))
+    c = np.interp(xi, x, np.cos(rad))
+    return np.degrees(np.arctan2(s, c)) % 360.0
+
+
+# --- ŞEHİR BAZLI, ÖZETLE SAKLANAN SERİLER ---
+class HourlySeries:
+    """
+    Bir tahminin sıklaştırılmış serileri. dt: epoch saniye; frame'in i. günü
+    day_offsets[i]:day_offsets[i+1] aralığındadır (günün ilk ve son diliminin arası).
+    """
+    __slots__ = ("dt", "temp", "wind", "pop", "deg", "day_offsets")
+
+
+def payload_hash(frame):
+    """Tahmin verisinin özeti; aynı veriyle gelen her frame (yenileme, başka şehir) aynı özeti verir."""
+    return hashlib.blake2b(b"".join(frame.slot_hashes()), digest_size=16).digest()
+
+
+def _build(frame, step):
+    dt = frame.dt.astype(np.float64)
+    if len(dt):
+        # Izgara ölçülen dilimleri de içersin: o noktalarda değerler aynen korunur
+        grid = np.union1d(np.arange(dt[0], dt[-1] + 1, step), dt)
+    else:
+        grid = dt
+    series = HourlySeries()
+    series.dt = grid.astype(np.int64)
+    series.temp, series.wind, series.pop = pchip(dt, np.vstack([frame.temp, frame.wind_speed, frame.pop]), grid)
+    series.pop = np.clip(series.pop, 0.0, 1.0)  # Yuvarlama kırıntılarına karşı
+    series.deg = interp_degrees(dt, frame.wind_deg, grid) if len(dt) else grid
+    starts = frame.dt[frame.day_offsets[:-1]]
+    ends = frame.dt[frame.day_offsets[1:] - 1]
+    series.day_offsets = np.column_stack([np.searchsorted(series.dt, starts, side="left"),
+                                          np.searchsorted(series.dt, ends, side="right")])
+    return series
+
+
+class InterpCache:
+    """Veri özeti -> HourlySeries LRU'su. Çizim thread'leri de kullandığı için kilitli."""
+
+    def __init__(self, max_items=config.INTERP_CACHE_MAX_ITEMS):
+        self.max_items = max_items
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def upsample(self, frame, step=None):
+        step = step or config.INTERP_STEP_SECONDS
+        key = (payload_hash(frame), step)
+        with self._lock:
+            series = self._items.get(key)
+            if series is not None:
+                self._items.move_to_end(key)
+                self.stats["hits"] += 1
+                return series
+            self.stats["misses"] += 1
+        with perf_trace.span("interpolate"):
+            series = _build(frame, step)
+        with self._lock:
+            self._items[key] = series
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+        return series
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats["size"] = len(self._items)
+        return stats
+
+
+CACHE = InterpCache()
+perf_trace.register_stats("interp_cache", CACHE.get_stats)
+
+
+def _local_midnight(ts):
+    t = time.localtime(ts)
+    return time.mktime((t.tm_year, t.tm_mon, t.tm_mday, 0, 0, 0, 0, 0, -1))
+
+
+def day_series(frame, day, step=None):
+    """
+    Grafiklerin bir gün için kullandığı seriler: ForecastFrame.day_series'in ölçülen
+    dilimleri + "x" (dilimlerin gece yarısından beri saat cinsinden yeri) + "hourly"
+    (aynı zaman ekseninde sıklaştırılmış x, temps, rains, winds, degs).
+    """
+    series = frame.day_series(day)
+    hourly = CACHE.upsample(frame, step)
+    s = frame.day_slice(day)
+    midnight = _local_midnight(int(frame.dt[s.start]))
+    lo, hi = hourly.day_offsets[day]
+    series["x"] = (frame.dt[s] - midnight) / 3600.0
+    series["hourly"] = {"x": (hourly.dt[lo:hi] - midnight) / 3600.0, "temps": hourly.temp[lo:hi],
+                        "rains": hourly.pop[lo:hi] * 100, "winds": hourly.wind[lo:hi],
+                        "degs": hourly.deg[lo:hi]}
+    return series
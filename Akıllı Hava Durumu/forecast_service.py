@@ -0,0 +1,379 @@
+# forecast_service.py
+"""
+Yerel tahmin servisi: işlenmiş tahminleri ve tavsiyeleri HTTP üzerinden JSON olarak sunar.
+
+Kiosklar ve iç araçlar masaüstü uygulamasını çalıştırıp her biri OWM'yi kendi
+anahtarıyla yoklamak yerine bu servise bağlanır. Bütün istemciler tek bir tahmin
+önbelleğini (weather_logic.forecast_cache) paylaşır; şehir başına tahmin dilimi
+başına tek bir OWM çağrısı yapılır, aynı anda gelen istekler single_flight ile birleşir.
+
+Her şehir için cevap bir kez hazırlanır (JSON gövdesi, gzip hali ve ETag) ve olay
+döngüsünde tutulur; sıcak yolda istek sadece ayrıştırılıp hazır baytlar yazılır.
+Ağa çıkma ve cevap hazırlama işçi thread'lerinde yapılır, olay döngüsü hiç beklemez.
+HTTP/1.1 keep-alive, gzip (Accept-Encoding) ve If-None-Match ile 304 desteklenir.
+
+    python forecast_service.py --port 8080
+    curl -H 'Accept-Encoding: gzip' 'http://127.0.0.1:8080/forecast?city=Kocaeli' | gunzip
+
+Uçlar:
+  GET /forecast?city=<ad|id>[&units=metric][&lang=tr]  gün gün özet, tavsiye, kıyafet ve dilimler
+  GET /health                                           canlılık
+  GET /stats                                            servis ve önbellek sayaçları (JSON)
+  GET /metrics                                          aynı sayaçlar Prometheus metin biçiminde
+"""
+import sys
+import gzip
+import json
+import time
+import asyncio
+import hashlib
+import argparse
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from email.utils import formatdate
+from urllib.parse import urlsplit, parse_qs
+
+import numpy as np
+
+import config
+import perf_trace
+import weather_logic
+from forecast_cache import make_key, next_slot_boundary
+from http_client import (WeatherError, CityNotFoundError, RequestTimeoutError, ConnectionFailedError,
+                         HttpStatusError, InvalidResponseError)
+
+UNITS = ("metric", "imperial", "standard")
+REASONS = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 431: "Request Header Fields Too Large", 500: "Internal Server Error",
+           502: "Bad Gateway"}
+INTERNAL_ERROR = {"error": "internal error"}
+JSON_TYPE = "application/json; charset=utf-8"
+
+
+# --- CEVAP GÖVDELERİ ---
+def forecast_document(frame, units, lang):
+    """
+    /forecast gövdesi: her gün için özet (min/maks, ikon, yağış toplamı, en sert hamle,
+    hissedilen sıcaklık aralığı), günün en sıcak diliminin tavsiyesi ve kıyafetleri,
+    ardından o günün dilimleri (her biri kendi tavsiyesi ve türetilmiş ölçüleriyle).
+    Sayılar `units` birimindedir; tavsiyeler ise her birimde °C ve m/s üzerinden
+    seçilir, yani aynı hava her birimde aynı tavsiyeyi verir.
+    """
+    metrics = weather_logic.get_derived_metrics(frame, units)
+    advice = weather_logic.advise_frame(frame, metrics)
+    apparent = np.round(metrics.apparent, 1).tolist()
+    dew_point = np.round(metrics.dew_point, 1).tolist()
+    peaks = frame.day_argmax().tolist()
+    days = []
+    for i, (day, derived) in enumerate(zip(frame.daily_summary(), metrics.daily(0))):
+        span = frame.day_slice(i)
+        slots = []
+        for j in range(span.start, span.stop):
+            slot = frame.slot(j)
+            slot["time"] = frame.times[j]
+            slot["apparent_temp"] = apparent[j]
+            slot["dew_point"] = dew_point[j]
+            slot["advice"], slot["clothing"] = advice[j]
+            slots.append(slot)
+        day.update(derived)
+        day["date"] = datetime.fromtimestamp(int(frame.dt[span.start])).date().isoformat()
+        day["advice"], day["clothing"] = advice[peaks[i]]
+        day["slots"] = slots
+        days.append(day)
+    return {"city": frame.city, "city_id": frame.city_id, "units": units, "lang": lang, "days": days}
+
+
+# İstemciye giden hata metinleri sabittir; hatanın kendi metni (adres, host) dışarı verilmez
+ERROR_MESSAGES = {
+    CityNotFoundError: "Şehir bulunamadı.",
+    RequestTimeoutError: "Hava durumu sağlayıcısı zamanında cevap vermedi.",
+    ConnectionFailedError: "Hava durumu sağlayıcısına bağlanılamadı.",
+    HttpStatusError: "Hava durumu sağlayıcısı hata döndürdü.",
+    InvalidResponseError: "Hava durumu sağlayıcısının cevabı çözülemedi.",
+}
+DEFAULT_ERROR_MESSAGE = "Hava durumu alınamadı."
+
+
+def error_document(error):
+    message = next((text for cls, text in ERROR_MESSAGES.items() if isinstance(error, cls)),
+                   DEFAULT_ERROR_MESSAGE)
+    return {"error": type(error).__name__, "message": message}
+
+
+class Response:
+    """Bir kez hazırlanıp tekrar tekrar gönderilen cevap: gövde, gzip hali ve ETag."""
+    __slots__ = ("status", "body", "gzipped", "etag", "expires", "frame", "content_type")
+
+    def __init__(self, status, document, expires=0.0, frame=None, content_type=JSON_TYPE):
+        self.status = status
+        self.content_type = content_type
+        if isinstance(document, bytes):
+            self.body = document
+        else:
+            self.body = json.dumps(document, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self.gzipped = None
+        if len(self.body) >= config.SERVICE_GZIP_MIN:
+            self.gzipped = gzip.compress(self.body, config.SERVICE_GZIP_LEVEL, mtime=0)
+        # Sadece önbelleğe giren cevaplar doğrulanabilir (ETag / 304)
+        self.etag = f'"{hashlib.blake2b(self.body, digest_size=12).hexdigest()}"' if expires else None
+        self.expires = expires
+        self.frame = frame
+
+
+def accepts_gzip(value):
+    """Accept-Encoding başlığı gzip'i (q=0 ile reddetmeden) kabul ediyor mu?"""
+    for part in (value or "").split(","):
+        coding, _, params = part.partition(";")
+        if coding.strip().lower() in ("gzip", "*"):
+            q = params.replace(" ", "").lower()
+            try:
+                return not q.startswith("q=") or float(q[2:]) > 0
+            except ValueError:
+                return True
+    return False
+
+
+def etag_matches(value, etag):
+    """If-None-Match listesinde (W/ önekli zayıf etiketler dahil) bu ETag var mı?"""
+    if value.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in value.split(","))
+
+
+class ForecastService:
+    """
+    Hazır cevapların LRU'su ve HTTP bağlantı işleyicisi. Cevaplar olay döngüsü
+    thread'inde tutulur; tahmin çekme ve hazırlama `executor`da çalışır.
+    """
+
+    def __init__(self, workers=config.SERVICE_WORKERS, max_items=config.SERVICE_MAX_ITEMS,
+                 recheck=config.SERVICE_RECHECK_SECONDS, keepalive=config.SERVICE_KEEPALIVE_TIMEOUT):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="service")
+        self.max_items = max_items
+        self.recheck = recheck
+        self.keepalive = keepalive
+        self._responses = OrderedDict()
+        self._pending = {}
+        self._date = (0, "")
+        self.stats = {"connections": 0, "requests": 0, "not_modified": 0, "gzip": 0,
+                      "renders": 0, "coalesced": 0, "errors": 0}
+
+    def get_stats(self):
+        stats = dict(self.stats)
+        stats["responses"] = len(self._responses)
+        stats["pending"] = len(self._pending)
+        return stats
+
+    # --- HAZIR CEVAPLAR ---
+    async def forecast(self, city, units, lang):
+        """Şehrin hazır cevabı; süresi dolmuşsa işçide yeniden çekilir (aynı şehir için tek iş)."""
+        key = make_key(city, units, lang)
+        entry = self._responses.get(key)
+        if entry is not None and entry.expires > time.time():
+            self._responses.move_to_end(key)
+            return entry
+        task = self._pending.get(key)
+        if task is None:
+            task = self._pending[key] = asyncio.ensure_future(self._reload(key, city, units, lang, entry))
+        else:
+            self.stats["coalesced"] += 1
+        # Bağlantısı kopan istemci işi iptal etmesin; aynı işi bekleyen başkaları olabilir
+        return await asyncio.shield(task)
+
+    async def _reload(self, key, city, units, lang, old):
+        try:
+            loop = asyncio.get_running_loop()
+            entry = await loop.run_in_executor(self.executor, self._load, city, units, lang, old)
+        finally:
+            del self._pending[key]
+        if entry is not old and entry.frame is not None:
+            self.stats["renders"] += 1
+        self._responses[key] = entry
+        self._responses.move_to_end(key)
+        while len(self._responses) > self.max_items:
+            self._responses.popitem(last=False)
+        return entry
+
+    def _load(self, city, units, lang, old):
+        """
+        İşçi thread'inde: tahmini önbellekten (gerekirse ağdan) alır ve cevabı hazırlar.
+        Önbellek hâlâ aynı ForecastFrame'i veriyorsa eski cevap yeniden hazırlanmaz.
+        """
+        try:
+            frame = weather_logic.fetch_weather_data(city, units, lang)
+        except CityNotFoundError as e:
+            return Response(404, error_document(e), time.time() + self.recheck)
+        except WeatherError as e:
+            return Response(502, error_document(e))
+        except Exception:
+            traceback.print_exc()
+            return Response(500, INTERNAL_ERROR)
+        expires = min(time.time() + self.recheck, next_slot_boundary())
+        if old is not None and old.frame is frame:
+            old.expires = expires
+            return old
+        try:
+            with perf_trace.span("service_render"):
+                return Response(200, forecast_document(frame, units, lang), expires, frame)
+        except Exception:
+            # Süresiz (expires=0) cevap önbellekte kalmaz, bir sonraki istek yeniden dener
+            traceback.print_exc()
+            return Response(500, INTERNAL_ERROR)
+
+    # --- HTTP ---
+    async def handle(self, reader, writer):
+        """Tek bağlantı: keep-alive boyunca istekleri sırayla (pipelining dahil) cevaplar."""
+        self.stats["connections"] += 1
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.keepalive)
+                except asyncio.LimitOverrunError:
+                    self.send(writer, Response(431, {"error": "header too large"}), False)
+                    break
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+                try:
+                    keep_alive = await self.respond(head, reader, writer)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except Exception:
+                    # Beklenmeyen hata bağlantı görevini sessizce öldürmesin: kaydedilir, 500 döner
+                    traceback.print_exc()
+                    self.send(writer, Response(500, INTERNAL_ERROR), False)
+                    break
+                if not keep_alive:
+                    break
+                if writer.transport.get_write_buffer_size() > config.SERVICE_WRITE_BUFFER:
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, head, reader, writer):
+        """Bir isteği cevaplar; bağlantı açık kalacaksa True döner."""
+        self.stats["requests"] += 1
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ")
+        except ValueError:
+            self.send(writer, Response(400, {"error": "bad request line"}), False)
+            return False
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            if name:
+                headers[name.strip().lower()] = value.strip()
+        connection = headers.get("connection", "").lower()
+        keep_alive = "close" not in connection if version == "HTTP/1.1" else "keep-alive" in connection
+        try:
+            length = int(headers.get("content-length") or 0)
+            if length:
+                await reader.readexactly(length)  # Gövde kullanılmaz ama akıştan çıkarılmalı
+        except ValueError:
+            self.send(writer, Response(400, {"error": "bad content-length"}), False)
+            return False
+        except asyncio.IncompleteReadError:
+            return False  # İstemci söylediğinden kısa gövde gönderip kapattı; cevap beklenmez
+
+        if method not in ("GET", "HEAD"):
+            entry = Response(405, {"error": "method not allowed"})
+        else:
+            entry = await self.route(urlsplit(target))
+        self.send(writer, entry, keep_alive, headers, method == "HEAD")
+        return keep_alive
+
+    async def route(self, url):
+        if url.path == "/forecast":
+            query = parse_qs(url.query)
+            city = (query.get("city") or [""])[0].strip()
+            units = (query.get("units") or ["metric"])[0]
+            lang = (query.get("lang") or ["tr"])[0]
+            if not city or units not in UNITS or not lang.replace("_", "").isalnum():
+                return Response(400, {"error": "city, units (metric|imperial|standard) ve lang gerekli"})
+            return await self.forecast(city, units, lang)
+        if url.path == "/health":
+            return Response(200, {"status": "ok"})
+        if url.path == "/stats":
+            return Response(200, {"service": self.get_stats(),
+                                  "forecast_cache": weather_logic.forecast_cache.get_stats(),
+                                  "forecast_flight": weather_logic.forecast_flights.get_stats()})
+        if url.path == "/metrics":
+            return Response(200, perf_trace.to_prometheus().encode("utf-8"),
+                            content_type="text/plain; version=0.0.4")
+        return Response(404, {"error": "not found"})
+
+    def http_date(self):
+        now = int(time.time())
+        if self._date[0] != now:
+            self._date = (now, formatdate(now, usegmt=True))
+        return self._date[1]
+
+    def send(self, writer, entry, keep_alive, headers=None, head_only=False):
+        headers = headers or {}
+        body = entry.body
+        not_modified = entry.etag is not None and etag_matches(headers.get("if-none-match", ""), entry.etag)
+        status = 304 if not_modified else entry.status
+        lines = [f"HTTP/1.1 {status} {REASONS.get(status, '')}", f"Date: {self.http_date()}",
+                 "Server: akilli-hava-durumu"]
+        if entry.etag is not None:
+            max_age = max(0, int(entry.expires - time.time()))
+            lines += [f"ETag: {entry.etag}", f"Cache-Control: max-age={max_age}", "Vary: Accept-Encoding"]
+        if not_modified:
+            body = None
+            self.stats["not_modified"] += 1
+        else:
+            if status >= 400:
+                self.stats["errors"] += 1
+            if entry.gzipped is not None and accepts_gzip(headers.get("accept-encoding")):
+                body = entry.gzipped
+                lines.append("Content-Encoding: gzip")
+                self.stats["gzip"] += 1
+            lines += [f"Content-Type: {entry.content_type}", f"Content-Length: {len(body)}"]
+        lines.append("Connection: keep-alive" if keep_alive else "Connection: close")
+        data = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+        writer.write(data if body is None or head_only else data + body)
+
+
+async def serve(host=config.SERVICE_HOST, port=config.SERVICE_PORT, service=None, ready=None):
+    """Servisi başlatıp sonsuza dek çalıştırır; `ready(adres)` dinlemeye başlayınca çağrılır."""
+    service = service or ForecastService()
+    server = await asyncio.start_server(service.handle, host, port, backlog=config.SERVICE_BACKLOG)
+    host, port = server.sockets[0].getsockname()[:2]
+    if ready is not None:
+        ready(f"http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tahminleri ve tavsiyeleri HTTP/JSON olarak sunan yerel servis.")
+    parser.add_argument("--host", default=config.SERVICE_HOST)
+    parser.add_argument("--port", type=int, default=config.SERVICE_PORT, help="0: boş bir port seç")
+    parser.add_argument("--workers", type=int, default=config.SERVICE_WORKERS)
+    parser.add_argument("--no-disk-cache", action="store_true",
+                        help="Tahminleri diske yazma (sadece bellek önbelleği)")
+    args = parser.parse_args(argv)
+
+    if args.no_disk_cache:
+        weather_logic.forecast_cache.cache_dir = None
+    service = ForecastService(workers=args.workers)
+    perf_trace.register_stats("service", service.get_stats)
+
+    def ready(address):
+        print(address, flush=True)  # Yük testi gibi araçlar seçilen portu buradan okur
+
+    try:
+        asyncio.run(serve(args.host, args.port, service, ready))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.executor.shutdown(wait=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
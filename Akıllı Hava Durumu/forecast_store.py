@@ -0,0 +1,228 @@
+# forecast_store.py
+import os
+import time
+import sqlite3
+import threading
+
+import numpy as np
+
+import config
+from forecast_cache import city_key
+from forecast_frame import ForecastFrame
+
+# Saklanan dilim alanları (ForecastFrame sütunları ile aynı adlar)
+FIELDS = ("temp", "feels_like", "humidity", "pressure", "visibility", "pop",
+          "wind_speed", "wind_deg", "cond_id", "icon", "desc", "wind_gust", "rain", "snow")
+_FLOAT_FIELDS = ("temp", "feels_like", "pop", "wind_speed", "wind_gust", "rain", "snow")
+# Şemaya sonradan eklenen sütunlar: eski dosyalarda ALTER TABLE ile açılır, eski satırlarda NULL'dur
+_ADDED_COLUMNS = (("wind_gust", "REAL"), ("rain", "REAL"), ("snow", "REAL"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cities (
+    city_id   INTEGER PRIMARY KEY,
+    name      TEXT NOT NULL,
+    name_key  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS cities_name_key ON cities (name_key);
+
+CREATE TABLE IF NOT EXISTS slots (
+    city_id    INTEGER NOT NULL,
+    dt         INTEGER NOT NULL,
+    fetched_at INTEGER NOT NULL,
+    temp REAL, feels_like REAL, humidity INTEGER, pressure INTEGER, visibility INTEGER,
+    pop REAL, wind_speed REAL, wind_deg INTEGER, cond_id INTEGER, icon TEXT, "desc" TEXT,
+    wind_gust REAL, rain REAL, snow REAL,
+    PRIMARY KEY (city_id, dt, fetched_at)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS slots_dt ON slots (dt);
+"""
+
+_COLUMNS = ", ".join(f'"{f}"' for f in FIELDS)
+
+# Her (şehir, dilim) için en son kaydedilen hali. SQLite, MAX() ile gruplanan
+# sorgularda diğer sütunları en büyük değerin bulunduğu satırdan verir.
+_LATEST = f"""
+SELECT city_id, dt, MAX(fetched_at) AS fetched_at, {_COLUMNS}
+FROM slots WHERE {{where}} GROUP BY city_id, dt
+"""
+
+
+def name_key(name):
+    return city_key(name)
+
+
+class ForecastStore:
+    """
+    Çekilen tahminlerin SQLite'ta saklandığı kalıcı geçmiş.
+
+    Her satır bir (şehir, dilim, çekilme anı) üçlüsüdür. Bir tahmin tekrar
+    çekildiğinde sadece değeri değişen dilimler yeni satır olarak eklenir, bu
+    yüzden aynı dilimin farklı çekimlerdeki halleri de izlenebilir. Sorgular her
+    dilimin en son halini döner. Arayüz ve toplu araçlar aynı dosyayı
+    paylaşabilir (WAL: okuyanlar yazanı beklemez).
+    """
+
+    def __init__(self, path=config.STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")  # WAL'da güvenli, her commit'te fsync yok
+        self._conn.executescript(_SCHEMA)
+        self._migrate()
+        self.stats = {"ingested": 0, "written": 0, "unchanged": 0}
+
+    def _migrate(self):
+        """Eski şemalı dosyaya eksik sütunları ekler (aynı dosyayı açan diğer süreçlerle sırayla)."""
+        conn = self._conn
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            present = {row[1] for row in conn.execute("PRAGMA table_info(slots)")}
+            for name, kind in _ADDED_COLUMNS:
+                if name not in present:
+                    conn.execute(f"ALTER TABLE slots ADD COLUMN {name} {kind}")
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # --- YAZMA ---
+    @staticmethod
+    def _rows(frame):
+        """Frame'in dilimlerini (dt, alanlar...) demetleri olarak; sayılar 2 haneye yuvarlanır."""
+        columns = [frame.dt.tolist()]
+        for name in FIELDS:
+            values = getattr(frame, name)
+            if name in _FLOAT_FIELDS:
+                values = np.round(values.astype(np.float64), 2).tolist()
+            elif isinstance(values, np.ndarray):
+                values = values.tolist()
+            columns.append(values)
+        return list(zip(*columns))
+
+    def ingest(self, frame, fetched_at=None):
+        return self.ingest_many([frame], fetched_at)
+
+    def ingest_many(self, frames, fetched_at=None):
+        """
+        Birden çok şehrin tahminini tek transaction'da ekler; yazılan satır sayısını döner.
+        Son kayıttan farkı olmayan dilimler atlanır. ID'si olmayan tahminler saklanmaz.
+        """
+        fetched_at = int(time.time()) if fetched_at is None else int(fetched_at)
+        written = unchanged = ingested = 0
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for frame in frames:
+                    if frame.city_id is None or not len(frame):
+                        continue
+                    city_id = int(frame.city_id)
+                    conn.execute("INSERT INTO cities (city_id, name, name_key) VALUES (?, ?, ?) "
+                                 "ON CONFLICT (city_id) DO UPDATE SET name = excluded.name, "
+                                 "name_key = excluded.name_key",
+                                 (city_id, frame.city, name_key(frame.city)))
+                    rows = self._rows(frame)
+                    latest = {r[1]: r[3:] for r in conn.execute(
+                        _LATEST.format(where="city_id = ? AND dt BETWEEN ? AND ?"),
+                        (city_id, rows[0][0], rows[-1][0]))}
+                    changed = [(city_id, r[0], fetched_at, *r[1:]) for r in rows
+                               if latest.get(r[0]) != r[1:]]
+                    conn.executemany(f"INSERT OR REPLACE INTO slots (city_id, dt, fetched_at, {_COLUMNS}) "
+                                     f"VALUES ({', '.join('?' * (3 + len(FIELDS)))})", changed)
+                    written += len(changed)
+                    unchanged += len(rows) - len(changed)
+                    ingested += 1
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            self.stats["ingested"] += ingested
+            self.stats["written"] += written
+            self.stats["unchanged"] += unchanged
+        return written
+
+    def prune(self, before):
+        """Dilim zamanı `before`dan eski tüm satırları siler; silinen sayıyı döner."""
+        with self._lock:
+            return self._conn.execute("DELETE FROM slots WHERE dt < ?", (int(before),)).rowcount
+
+    # --- OKUMA ---
+    def _query(self, sql, params):
+        with self._lock:
+            cur = self._conn.execute(sql, params)
+            names = [d[0] for d in cur.description]
+            return [dict(zip(names, row)) for row in cur.fetchall()]
+
+    def city_id(self, city):
+        """Şehir adından (büyük/küçük harf ve boşluk duyarsız) ya da ID'den saklı şehir ID'si."""
+        if isinstance(city, int) or str(city).strip().isdigit():
+            return int(city)
+        rows = self._query("SELECT city_id FROM cities WHERE name_key = ?", (name_key(city),))
+        return rows[0]["city_id"] if rows else None
+
+    def history(self, city_id, start, end=None):
+        """Şehrin [start, end) aralığındaki dilimlerinin en son halleri, zamana göre sıralı."""
+        end = 2 ** 62 if end is None else end
+        return self._query(_LATEST.format(where="city_id = ? AND dt >= ? AND dt < ?") + " ORDER BY dt",
+                           (city_id, int(start), int(end)))
+
+    def revisions(self, city_id, dt):
+        """Tek bir dilimin çekimden çekime değişen halleri (eskiden yeniye)."""
+        return self._query(f"SELECT fetched_at, {_COLUMNS} FROM slots WHERE city_id = ? AND dt = ? "
+                           "ORDER BY fetched_at", (city_id, int(dt)))
+
+    def cities_above(self, temp, start, end):
+        """[start, end) aralığında sıcaklığı `temp`i aşan şehirler ve o aralıktaki en yüksek değerleri."""
+        return self._query(f"""
+            SELECT l.city_id, c.name, MAX(l.temp) AS max_temp
+            FROM ({_LATEST.format(where="dt >= ? AND dt < ?")}) AS l
+            JOIN cities AS c USING (city_id)
+            WHERE l.temp > ?
+            GROUP BY l.city_id ORDER BY max_temp DESC""", (int(start), int(end), temp))
+
+    def latest_frame(self, city, since=None):
+        """
+        Saklı son tahminden ForecastFrame kurar (çevrimdışı gösterim için).
+        `since`den (varsayılan: şimdiki dilim) sonraki dilimler alınır; hiç yoksa None.
+        """
+        city_id = self.city_id(city)
+        if city_id is None:
+            return None
+        since = time.time() - config.FORECAST_SLOT_SECONDS if since is None else since
+        rows = self.history(city_id, since)
+        if not rows:
+            return None
+        name = self._query("SELECT name FROM cities WHERE city_id = ?", (city_id,))[0]["name"]
+        return ForecastFrame.from_json({
+            "city": {"name": name, "id": city_id},
+            "list": [self._item(r) for r in rows]})
+
+    @staticmethod
+    def _item(r):
+        """Saklı satırdan /forecast "list" elemanı; sütunlar eklenmeden önceki satırlarda hamle ve yağış yoktur."""
+        wind = {"speed": r["wind_speed"], "deg": r["wind_deg"]}
+        if r["wind_gust"] is not None:
+            wind["gust"] = r["wind_gust"]
+        item = {"dt": r["dt"],
+                "main": {"temp": r["temp"], "feels_like": r["feels_like"],
+                         "humidity": r["humidity"], "pressure": r["pressure"]},
+                "weather": [{"id": r["cond_id"], "icon": r["icon"], "description": r["desc"]}],
+                "wind": wind, "visibility": r["visibility"], "pop": r["pop"]}
+        for name in ("rain", "snow"):
+            if r[name]:
+                item[name] = {"3h": r[name]}
+        return item
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats["rows"] = self._conn.execute("SELECT COUNT(*) FROM slots").fetchone()[0]
+            stats["cities"] = self._conn.execute("SELECT COUNT(*) FROM cities").fetchone()[0]
+        return stats
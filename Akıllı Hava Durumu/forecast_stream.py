@@ -0,0 +1,135 @@
+# forecast_stream.py
+"""
+/forecast cevabını ağdan geldikçe, dilim dilim çözen akış çözücü.
+
+response.json() önce gövdenin tamamını, sonra 40 dilimin iç içe sözlük ağacını
+(main, weather, clouds, wind, sys, ...) kurar; ForecastFrame bunların küçük bir
+kısmını kopyalar. Burada gövde parça parça okunur, "list" dizisinin her elemanı
+tek başına çözülüp ForecastFrame.from_items'a verilir ve hemen atılır. Bellekte
+aynı anda en fazla bir dilimin sözlüğü ve henüz işlenmemiş metin parçası bulunur.
+
+Her değer yine json modülünün C tarayıcısıyla çözülür; Python
+tarafında sadece en dıştaki nesnenin ve dizinin ayraçları yürütülür.
+"""
+import json
+import codecs
+
+from forecast_frame import ForecastFrame
+
+_scan_once = json.JSONDecoder().scan_once  # C tarayıcı: (değer, bitiş) ya da StopIteration
+_WHITESPACE = " \t\n\r"
+# Geçerli bir değerden sonra gelebilecek karakterler; başka bir şey gelmişse değer yarım kalmıştır
+_AFTER_VALUE = ",:}]" + _WHITESPACE
+
+
+class _Reader:
+    """Bayt parçalarından beslenen, gerektikçe dolan metin tamponu."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        """Tampona bir parça daha ekler (okunmuş kısım atılır); girdi bittiyse False."""
+        if self.eof:
+            return False
+        for chunk in self._chunks:
+            text = self._utf8.decode(chunk)
+            if text:
+                self.buf = self.buf[self.pos:] + text
+                self.pos = 0
+                return True
+        self.eof = True
+        tail = self._utf8.decode(b"", final=True)
+        if tail:
+            self.buf = self.buf[self.pos:] + tail
+            self.pos = 0
+        return bool(tail)
+
+    def peek(self):
+        """Boşlukları atlayıp sıradaki karakteri döner; girdi bittiyse ""."""
+        while True:
+            buf, pos = self.buf, self.pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def take(self, expected):
+        """Sıradaki ayraç karakterini tüketir; `expected` içinde değilse ValueError."""
+        buf, pos = self.buf, self.pos
+        if pos < len(buf) and buf[pos] in expected:  # Sık yol: sıkıştırılmış JSON'da boşluk yok
+            self.pos = pos + 1
+            return buf[pos]
+        char = self.peek()
+        if not char or char not in expected:
+            raise ValueError(f"{expected!r} bekleniyordu, {char!r} geldi")
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Sıradaki JSON değerini çözer; tampona sığmadıysa yeni parça okuyup tekrar dener."""
+        if self.pos >= len(self.buf) or self.buf[self.pos] in _WHITESPACE:
+            self.peek()
+        while True:
+            try:
+                value, end = _scan_once(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            except StopIteration:
+                if not self._fill():
+                    raise ValueError(f"JSON değeri bekleniyordu (konum {self.pos})") from None
+                continue
+            # Tamponun sonunda ya da yarıda biten bir sayının devamı sonraki parçada
+            # olabilir: "12" + "3", "0." + "0077", "1e" + "-5"
+            if (end == len(self.buf) or self.buf[end] not in _AFTER_VALUE) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def _iter_array(reader):
+    reader.take("[")
+    if reader.peek() == "]":
+        reader.pos += 1
+        return
+    while True:
+        yield reader.value()
+        if reader.take(",]") == "]":
+            return
+
+
+def decode_forecast(chunks):
+    """
+    /forecast gövdesini (bayt parçaları iterable'ı) doğrudan ForecastFrame'e çevirir.
+    Bozuk ya da eksik gövdede ValueError / KeyError fırlatır.
+    """
+    reader = _Reader(chunks)
+    reader.take("{")
+    frame = None
+    city = None
+    if reader.peek() != "}":
+        while True:
+            key = reader.value()
+            reader.take(":")
+            if key == "list":
+                frame = ForecastFrame.from_items(_iter_array(reader))
+            elif key == "city":
+                city = reader.value()
+            else:
+                reader.value()  # cod, message, cnt: kullanılmıyor
+            if reader.take(",}") == "}":
+                break
+    if frame is None or city is None:
+        raise KeyError("list" if frame is None else "city")
+    frame.city = city["name"]
+    frame.city_id = city.get("id")
+    return frame
@@ -0,0 +1,138 @@
+# http_client.py
+import time
+import random
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import config
+import perf_trace
+
+
+# --- HATA TİPLERİ ---
+class WeatherError(Exception):
+    """Ağ katmanındaki tüm hataların atası."""
+
+class CityNotFoundError(WeatherError):
+    """API 404 döndü: şehir yok ya da yanlış yazıldı."""
+
+class RequestTimeoutError(WeatherError):
+    """Bağlantı kurulamadı ya da cevap zamanında gelmedi."""
+
+class ConnectionFailedError(WeatherError):
+    """DNS, TCP veya TLS seviyesinde hata."""
+
+class HttpStatusError(WeatherError):
+    """200 dışındaki (ve 404 olmayan) HTTP cevapları."""
+    def __init__(self, status, url):
+        super().__init__(f"HTTP {status}: {url}")
+        self.status = status
+
+class InvalidResponseError(WeatherError):
+    """Cevap geldi ama JSON / resim olarak çözülemedi."""
+
+
+# Bu durum kodları geçici kabul edilir ve tekrar denenir
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def _wrap(cls, error, url):
+    """
+    requests hatasından `cls` tipinde hata. requests'in metni tam adresi (appid dahil)
+    içerdiği için metin sadece hata sınıfı ve host'tur; asıl hata __cause__'da durur.
+    """
+    wrapped = cls(f"{type(error).__name__} ({urlsplit(url).netloc})")
+    wrapped.__cause__ = error
+    return wrapped
+
+
+class HttpTransport:
+    """
+    Tüm ağ çağrılarının paylaştığı oturum. Host başına bağlantı havuzu
+    (keep-alive), bağlantı/okuma zaman aşımları ve rastgele gecikmeli
+    (jitter) üstel geri çekilmeyle tekrar deneme yapar.
+    """
+
+    def __init__(self, timeout=(config.HTTP_CONNECT_TIMEOUT, config.HTTP_READ_TIMEOUT),
+                 retries=config.HTTP_RETRIES, backoff=config.HTTP_BACKOFF,
+                 pool_size=config.HTTP_POOL_SIZE):
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _sleep_before_retry(self, attempt):
+        # "Full jitter": aynı anda düşen istekler aynı anda tekrar denemesin
+        delay = min(config.HTTP_BACKOFF_MAX, self.backoff * (2 ** attempt))
+        time.sleep(random.uniform(0, delay))
+
+    def get(self, url, params=None, stream=False):
+        """
+        Başarılı cevabı döner; başarısızlıkta WeatherError alt tiplerinden birini fırlatır.
+        stream=True ise gövde henüz okunmamıştır (bkz. get_chunks).
+        """
+        last_error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                perf_trace.count("http_retries")
+                self._sleep_before_retry(attempt - 1)
+            try:
+                with perf_trace.span("http"):
+                    response = self.session.get(url, params=params, timeout=self.timeout, stream=stream)
+                perf_trace.count("http_requests")
+                if not stream:
+                    perf_trace.count("http_bytes", len(response.content))
+            except requests.Timeout as e:
+                last_error = _wrap(RequestTimeoutError, e, url)
+                continue
+            except requests.ConnectionError as e:
+                last_error = _wrap(ConnectionFailedError, e, url)
+                continue
+            except requests.RequestException as e:
+                raise _wrap(WeatherError, e, url)
+
+            if response.status_code == 200:
+                return response
+            response.close()  # Akışta okunmamış gövde bağlantıyı havuza dönmekten alıkoymasın
+            if response.status_code == 404:
+                raise CityNotFoundError(url)
+            last_error = HttpStatusError(response.status_code, url)
+            if response.status_code not in RETRY_STATUSES:
+                break
+        raise last_error
+
+    def get_json(self, url, params=None):
+        response = self.get(url, params=params)
+        try:
+            with perf_trace.span("json_decode"):
+                return response.json()
+        except ValueError as e:
+            raise InvalidResponseError(str(e)) from e
+
+    def get_chunks(self, url, params=None, chunk_size=config.HTTP_CHUNK_SIZE):
+        """
+        Gövdeyi ağdan geldikçe parça parça üreten iterator; gövde bütün halde tutulmaz.
+        Okuma sırasında kopan bağlantı da WeatherError alt tipi olarak fırlatılır.
+        """
+        return self._iter_body(self.get(url, params=params, stream=True), chunk_size)
+
+    @staticmethod
+    def _iter_body(response, chunk_size):
+        try:
+            for chunk in response.iter_content(chunk_size):
+                perf_trace.count("http_bytes", len(chunk))
+                yield chunk
+        except requests.Timeout as e:
+            raise _wrap(RequestTimeoutError, e, response.url)
+        except requests.RequestException as e:
+            # Okuma zaman aşımı da requests tarafında ConnectionError olarak gelir
+            raise _wrap(ConnectionFailedError, e, response.url)
+        finally:
+            response.close()
+
+    def get_bytes(self, url):
+        return self.get(url).content
@@ -0,0 +1,216 @@
+# icon_atlas.py
+"""
+Uygulamadaki tüm ikonların, kullanılan her boyut ve piksel oranında önceden
+hazırlanıp tek dosyada toplandığı atlas: 18 hava durumu kodu (130 ve 50 px) ve
+CLOTHING_URLS'teki kıyafetler (45 px).
+
+Dosya sıkıştırılmamış RGBA8888 piksellerdir; her piksel oranı kendi şeridindedir
+(şerit genişliği boşluk en az olacak şekilde seçilir). Açılışta dosya mmap ile eşlenir, sadece ekranın piksel oranına ait
+şerit tek bir QImage olarak sarılıp bir kez QPixmap'e çevrilir. İkonlar bu
+pixmap'ten dikdörtgen kopyalanarak alınır: PNG çözme, boyutlandırma ve ağ yok.
+Atlas uygulamayla birlikte paketlenir (PyInstaller: --add-data "icons.atlas;.").
+
+Oluşturma (kaynak PNG'ler ikon disk önbelleğinden, yoksa ağdan):
+    python icon_atlas.py
+    python icon_atlas.py --dpr 1 2 --output /tmp/icons.atlas
+"""
+import os
+import sys
+import json
+import mmap
+import struct
+import argparse
+
+import config
+
+MAGIC = b"AHDATLS1"
+_HEADER = struct.Struct("<I")  # Başlık JSON'unun bayt uzunluğu
+_ALIGN = 16                    # Piksel verisi bu sınıra hizalanır
+
+WEATHER_SIZES = ((130, 130), (50, 50))
+CLOTHING_SIZES = ((45, 45),)
+
+
+def atlas_name(source):
+    """IconCache kaynağını (ikon kodu ya da kıyafet adresi) atlastaki ada çevirir; atlasta yoksa None."""
+    if source in config.WEATHER_BG_COLORS:
+        return source
+    for name, url in config.CLOTHING_URLS.items():
+        if url == source:
+            return name
+    return None
+
+
+def atlas_entries():
+    """(ad, boyut) çiftleri: atlasa girecek her ikon ve kullanıldığı her boyut."""
+    entries = [(code, size) for code in config.WEATHER_BG_COLORS for size in WEATHER_SIZES]
+    entries += [(name, size) for name in config.CLOTHING_URLS for size in CLOTHING_SIZES]
+    return entries
+
+
+def pixel_size(size, dpr):
+    return round(size[0] * dpr), round(size[1] * dpr)
+
+
+# --- OLUŞTURMA (PIL gerekir) ---
+def _pack_rows(items, width):
+    """Basit raf yerleşimi: uzundan kısaya, soldan sağa. {anahtar: (x, y)} ve toplam yükseklik."""
+    places = {}
+    x = y = shelf = 0
+    for key, (w, h) in sorted(items, key=lambda item: -item[1][1]):
+        if x + w > width:
+            x, y, shelf = 0, y + shelf, 0
+        places[key] = (x, y)
+        x += w
+        shelf = max(shelf, h)
+    return places, y + shelf
+
+
+def _pack(items):
+    """En geniş ikonun katları arasından alanı en küçük tutan şerit genişliğini seçer."""
+    widest = max(w for _, (w, _) in items)
+    best = None
+    for columns in range(1, len(items) + 1):
+        places, height = _pack_rows(items, widest * columns)
+        if best is None or widest * columns * height < best[1] * best[2]:
+            best = (places, widest * columns, height)
+    return best
+
+
+def build_atlas(path=config.ICON_ATLAS_PATH, dprs=config.ICON_ATLAS_DPRS, read_bytes=None):
+    """
+    Atlası oluşturup `path`e yazar; (ikon sayısı, dosya boyutu) döner.
+    read_bytes(url) -> PNG baytları; verilmezse IconCache (disk önbelleği + ağ) kullanılır.
+    """
+    from io import BytesIO
+    from PIL import Image
+    if read_bytes is None:
+        from icon_cache import IconCache, icon_source_url
+        cache = IconCache()
+        read_bytes = lambda source: cache.get_bytes(icon_source_url(source))
+
+    sources = {}
+    for name, _ in atlas_entries():
+        if name not in sources:
+            source = config.CLOTHING_URLS.get(name, name)
+            sources[name] = Image.open(BytesIO(read_bytes(source))).convert("RGBA")
+
+    entries, bands, band_images = [], {}, []
+    offset = 0
+    for dpr in dprs:
+        items = [((name, size), pixel_size(size, dpr)) for name, size in atlas_entries()]
+        places, width, height = _pack(items)
+        band = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        for (name, size), px in items:
+            x, y = places[(name, size)]
+            band.paste(sources[name].resize(px, Image.Resampling.LANCZOS), (x, y))
+            entries.append([name, size[0], size[1], dpr, x, y])  # Şeridin içindeki konum
+        bands[str(dpr)] = [offset, width, height]  # Piksel verisinin başından bayt uzaklığı
+        band_images.append(band)
+        offset += width * height * 4
+
+    header = json.dumps({"size": offset, "bands": bands, "entries": entries}).encode("utf-8")
+    start = len(MAGIC) + _HEADER.size + len(header)
+    padding = b"\0" * (-start % _ALIGN)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(MAGIC + _HEADER.pack(len(header) + len(padding)) + header + padding)
+        for band in band_images:
+            f.write(band.tobytes())
+    os.replace(tmp, path)
+    return len(entries), os.path.getsize(path)
+
+
+# --- YÜKLEME (GUI thread) ---
+class IconAtlas:
+    """
+    mmap ile açılmış atlas. Kurulum sadece başlığı okur (her thread'de güvenli);
+    pixmap() ilk çağrıldığı piksel oranının şeridini QPixmap'e çevirir ve sadece
+    GUI thread'inden çağrılmalıdır.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if self._map[:len(MAGIC)] != MAGIC:
+                raise ValueError("atlas dosyası değil")
+            (length,) = _HEADER.unpack_from(self._map, len(MAGIC))
+            start = len(MAGIC) + _HEADER.size
+            header = json.loads(bytes(self._map[start:start + length]).rstrip(b"\0"))
+            self._data = start + length
+            self._bands = {float(dpr): band for dpr, band in header["bands"].items()}
+            self._entries = {(name, (w, h), float(dpr)): (x, y)
+                             for name, w, h, dpr, x, y in header["entries"]}
+            if self._data + header["size"] > len(self._map):
+                raise ValueError("atlas dosyası eksik")
+        except (ValueError, KeyError, TypeError, struct.error):
+            self._map.close()
+            raise
+        self._pages = {}  # piksel oranı -> şeridin QPixmap'i
+
+    @property
+    def dprs(self):
+        return sorted(self._bands)
+
+    def best_dpr(self, dpr):
+        """Tam eşleşme yoksa en yakın büyük oran (küçültmek büyütmekten net görünür)."""
+        if dpr in self._bands:
+            return dpr
+        larger = [d for d in self._bands if d >= dpr]
+        return min(larger) if larger else max(self._bands)
+
+    def _page(self, dpr):
+        page = self._pages.get(dpr)
+        if page is None:
+            from PyQt6.QtGui import QImage, QPixmap
+            offset, width, height = self._bands[dpr]
+            offset += self._data
+            view = memoryview(self._map)[offset:offset + width * height * 4]
+            # QImage mmap'teki baytları kopyalamadan sarar; fromImage tek kopyayı yapar
+            page = QPixmap.fromImage(QImage(view, width, height, width * 4, QImage.Format.Format_RGBA8888))
+            self._pages[dpr] = page
+        return page
+
+    def has(self, name, size, dpr):
+        return (name, tuple(size), self.best_dpr(round(float(dpr), 2))) in self._entries
+
+    def pixmap(self, name, size, dpr):
+        """İkonun hazır QPixmap'i; atlasta o ikon / boyut yoksa None."""
+        from PyQt6.QtCore import QRect, QSize, Qt
+        dpr = round(float(dpr), 2)
+        best = self.best_dpr(dpr)
+        place = self._entries.get((name, tuple(size), best))
+        if place is None:
+            return None
+        w, h = pixel_size(size, best)
+        pix = self._page(best).copy(QRect(place[0], place[1], w, h))
+        if best != dpr:
+            w, h = pixel_size(size, dpr)
+            pix = pix.scaled(QSize(w, h), Qt.AspectRatioMode.IgnoreAspectRatio,
+                             Qt.TransformationMode.SmoothTransformation)
+        pix.setDevicePixelRatio(dpr)
+        return pix
+
+
+def open_atlas(path=config.ICON_ATLAS_PATH):
+    """Atlas varsa ve okunabiliyorsa IconAtlas, yoksa None (ikonlar eski yoldan gelir)."""
+    try:
+        return IconAtlas(path)
+    except (OSError, ValueError, KeyError, TypeError, struct.error):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="İkon atlasını oluşturur.")
+    parser.add_argument("--output", default=config.ICON_ATLAS_PATH)
+    parser.add_argument("--dpr", type=float, nargs="+", default=list(config.ICON_ATLAS_DPRS),
+                        help="Hazırlanacak piksel oranları")
+    args = parser.parse_args(argv)
+    count, size = build_atlas(args.output, args.dpr)
+    print(f"{args.output}: {count} ikon, {size / 2**20:.1f} MiB", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,202 @@
+# icon_cache.py
+import os
+import json
+import hashlib
+import threading
+from io import BytesIO
+from collections import OrderedDict
+
+from PIL import Image, ImageQt
+from PyQt6.QtGui import QPixmap
+
+import config
+import perf_trace
+import weather_logic
+from icon_atlas import open_atlas, atlas_name
+
+
+def icon_source_url(source):
+    """Hava durumu ikon kodunu ('01d') adrese çevirir; tam adresler olduğu gibi döner."""
+    if source in config.WEATHER_BG_COLORS:
+        return config.ICON_URL.format(code=source)
+    return source
+
+
+def make_key(source, size, dpr=1.0):
+    return (source, tuple(size), round(float(dpr), 2))
+
+
+class IconCache:
+    """
+    İkonlar için iki katmanlı önbellek.
+    1) Disk: ham PNG baytları içerik özetine (sha256) göre saklanır, adres -> özet
+       eşlemesi index.json dosyasında durur. Aynı resim iki kez yazılmaz.
+    2) Bellek: (kaynak, boyut, piksel oranı) anahtarlı, sınırlı bir LRU içinde
+       boyutlandırılmış, kullanıma hazır QPixmap'ler.
+    İkon atlası (icon_atlas.py) varsa uygulamanın kendi ikonları doğrudan ondan
+    kesilir; bu ikonlar için diske, ağa ve PIL'e hiç gidilmez.
+
+    load_image() işçi thread'lerde çalışabilir (QImage üretir);
+    get_pixmap() / put_image() ise yalnızca GUI thread'inden çağrılmalıdır.
+    """
+
+    def __init__(self, cache_dir=config.ICON_CACHE_DIR, max_items=config.ICON_CACHE_MAX_ITEMS,
+                 atlas_path=config.ICON_ATLAS_PATH):
+        self.cache_dir = cache_dir
+        self.max_items = max_items
+        self._pixmaps = OrderedDict()
+        self._lock = threading.Lock()
+        self._index = None
+        self.atlas = open_atlas(atlas_path) if atlas_path else None
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "disk_reads": 0, "downloads": 0,
+                      "atlas_hits": 0}
+
+    # --- DİSK (HAM BAYTLAR) ---
+    def _index_path(self):
+        return os.path.join(self.cache_dir, "index.json")
+
+    def _blob_path(self, digest):
+        return os.path.join(self.cache_dir, digest[:2], digest + ".png")
+
+    def _load_index(self):
+        if self._index is None:
+            try:
+                with open(self._index_path(), "r", encoding="utf-8") as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _save_index(self):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp = f"{self._index_path()}.{threading.get_ident()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._index, f)
+            os.replace(tmp, self._index_path())
+        except OSError:
+            pass
+
+    def get_bytes(self, url):
+        """
+        Ham resim baytlarını önce diskten, yoksa ağdan getirir. Aynı adres aynı anda
+        birden çok thread'den istenirse tek indirme yapılır, diğerleri onu bekler.
+        """
+        with self._lock:
+            digest = self._load_index().get(url)
+        if digest:
+            try:
+                with open(self._blob_path(digest), "rb") as f:
+                    content = f.read()
+                with self._lock:
+                    self.stats["disk_reads"] += 1
+                return content
+            except OSError:
+                pass  # Dosya silinmişse tekrar indir
+        return weather_logic.download_bytes(url, lambda: self._download(url))
+
+    def _download(self, url):
+        content = weather_logic.transport.get_bytes(url)
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._blob_path(digest)
+        try:
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp = f"{path}.{threading.get_ident()}.tmp"
+                with open(tmp, "wb") as f:
+                    f.write(content)
+                os.replace(tmp, path)
+        except OSError:
+            return content
+        with self._lock:
+            self.stats["downloads"] += 1
+            self._load_index()[url] = digest
+            self._save_index()
+        return content
+
+    # --- ÇÖZME & BOYUTLANDIRMA (işçi thread) ---
+    def load_image(self, key):
+        """Anahtardaki boyuta getirilmiş QImage döner. Ağ hatasında WeatherError fırlatır."""
+        source, size, dpr = key
+        content = self.get_bytes(icon_source_url(source))
+        with perf_trace.span("icon_decode"):
+            try:
+                img = Image.open(BytesIO(content)).convert("RGBA")
+            except (OSError, ValueError) as e:
+                raise weather_logic.InvalidResponseError(str(e)) from e
+            px_size = (round(size[0] * dpr), round(size[1] * dpr))
+            img = img.resize(px_size, Image.Resampling.LANCZOS)
+            qimg = ImageQt.ImageQt(img).copy()  # PIL tamponundan ayır, thread'ler arası taşınabilsin
+        qimg.setDevicePixelRatio(dpr)
+        return qimg
+
+    # --- BELLEK (HAZIR PIXMAP'LER, GUI thread) ---
+    def get_pixmap(self, key):
+        with self._lock:
+            pix = self._pixmaps.get(key)
+            if pix is not None:
+                self._pixmaps.move_to_end(key)
+                self.stats["hits"] += 1
+                return pix
+        pix = self._from_atlas(key)
+        with self._lock:
+            if pix is None:
+                self.stats["misses"] += 1
+                return None
+            self.stats["atlas_hits"] += 1
+        self._remember(key, pix)
+        return pix
+
+    def _from_atlas(self, key):
+        if self.atlas is None:
+            return None
+        name = atlas_name(key[0])
+        return self.atlas.pixmap(name, key[1], key[2]) if name else None
+
+    def in_atlas(self, key):
+        """Anahtar atlastan karşılanabiliyor mu (indirme / ön ısıtma gerekmez)."""
+        return self.atlas is not None and self.atlas.has(atlas_name(key[0]), key[1], key[2])
+
+    def put_image(self, key, qimage):
+        pix = QPixmap.fromImage(qimage)
+        pix.setDevicePixelRatio(key[2])
+        self._remember(key, pix)
+        return pix
+
+    def _remember(self, key, pix):
+        with self._lock:
+            self._pixmaps[key] = pix
+            self._pixmaps.move_to_end(key)
+            while len(self._pixmaps) > self.max_items:
+                self._pixmaps.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    # --- ÖN ISITMA ---
+    def prewarm_keys(self, dpr=1.0):
+        """Uygulamada kullanılan ve atlasta bulunmayan tüm ikon / boyut çiftleri."""
+        keys = []
+        for code in config.WEATHER_BG_COLORS:
+            keys.append(make_key(code, (130, 130), dpr))
+            keys.append(make_key(code, (50, 50), dpr))
+        for url in config.CLOTHING_URLS.values():
+            keys.append(make_key(url, (45, 45), dpr))
+        return [key for key in keys if not self.in_atlas(key)]
+
+    def prewarm(self, keys, on_image=None):
+        """
+        Verilen anahtarları diske indirip çözer. on_image(key, qimage) verilirse
+        hazırlanan resimler GUI tarafına aktarılıp bellek katmanına da konabilir.
+        """
+        for key in keys:
+            try:
+                qimg = self.load_image(key)
+            except weather_logic.WeatherError:
+                continue
+            if on_image:
+                on_image(key, qimg)
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats["size"] = len(self._pixmaps)
+        return stats
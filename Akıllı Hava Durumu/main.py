@@ -1,22 +1,51 @@
 # main.py
 import sys
 import os
+import json
+import time
 import threading
 from datetime import datetime
-from PIL import Image, ImageQt
 
-from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                             QHBoxLayout, QLabel, QLineEdit, QPushButton, QFrame, QGraphicsDropShadowEffect)
-from PyQt6.QtGui import QPixmap, QFont, QColor, QCursor
-from PyQt6.QtCore import Qt, pyqtSignal, QObject
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QSizePolicy,
+                             QHBoxLayout, QLabel, QLineEdit, QPushButton, QFrame, QGraphicsDropShadowEffect,
+                             QCompleter)
+from PyQt6.QtGui import QPixmap, QFont, QColor, QCursor, QShortcut, QKeySequence
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QTimer, QStringListModel
 from PyQt6.QtGui import QIcon
 
-# Grafik Kütüphanesi
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg
-import matplotlib.pyplot as plt
-
 import config
-import weather_logic
+import perf_trace
+from refresh_scheduler import RefreshSchedule
+from theme import ThemeBackground, theme_for
+from task_scheduler import (TaskScheduler, PRIORITY_FORECAST, PRIORITY_ICON,
+                            PRIORITY_DECOR, PRIORITY_PREFETCH)
+
+# --- Ağır Modüller ---
+# weather_logic (requests, numpy), forecast_interp (numpy), icon_cache (PIL) ve
+# chart_cache (matplotlib) birlikte pencerenin kendisinden daha geç açılır. Bu yüzden pencere ilk kez boyandıktan sonra
+# arka planda ya da ilk ihtiyaç anında load_heavy_modules() ile yüklenirler.
+weather_logic = None
+forecast_interp = None  # Grafik serilerinin saatlik ara değerlemesi
+icons = None   # icon_cache modülü
+charts = None  # chart_cache modülü (grafikler arka planda Agg ile çizilip resim olarak gösterilir)
+
+def load_weather_logic():
+    global weather_logic, forecast_interp
+    if weather_logic is None:
+        import forecast_interp as _forecast_interp
+        import weather_logic as _weather_logic
+        forecast_interp = _forecast_interp
+        weather_logic = _weather_logic  # En son atanır: "yüklendi" işareti
+
+def load_heavy_modules():
+    global icons, charts
+    load_weather_logic()
+    if charts is not None:
+        return
+    import icon_cache as _icons
+    import chart_cache as _charts
+    icons = _icons
+    charts = _charts  # En son atanır: "yüklendi" işareti
 
 def resource_path(relative_path):
     try:
@@ -27,24 +56,83 @@ def resource_path(relative_path):
 
 # --- Tıklanabilir Kart Sınıfı ---
 class DailyCard(QFrame):
+    """
+    Bir günün kartı. Kartlar pencereyle birlikte bir kez kurulur; yeni aramada
+    sadece metinleri ve ikonu değişir (set_day). Stili daily_frame'den gelir.
+    """
     clicked = pyqtSignal(str) # Tıklanınca gün ismini sinyal olarak gönderir
 
-    def __init__(self, day_name, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.day_name = day_name
+        self.day_name = None
         self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor)) # Üzerine gelince el işareti
 
+        cl = QVBoxLayout(self)
+        cl.setContentsMargins(5, 5, 5, 5)
+
+        self.lbl_day = QLabel()
+        self.lbl_day.setObjectName("cardDay")
+        self.lbl_day.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self.lbl_icon = QLabel()
+        self.lbl_icon.setFixedSize(50, 50)
+        self.lbl_icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        icon_wrap = QWidget()
+        iw_box = QHBoxLayout(icon_wrap)
+        iw_box.addWidget(self.lbl_icon, alignment=Qt.AlignmentFlag.AlignCenter)
+        iw_box.setContentsMargins(0,0,0,0)
+
+        self.lbl_temp = QLabel()
+        self.lbl_temp.setObjectName("cardTemp")
+        self.lbl_temp.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        # Günlük yağış toplamı ve en sert rüzgar hamlesi
+        self.lbl_extra = QLabel()
+        self.lbl_extra.setObjectName("cardExtra")
+        self.lbl_extra.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        cl.addWidget(self.lbl_day)
+        cl.addWidget(icon_wrap)
+        cl.addWidget(self.lbl_temp)
+        cl.addWidget(self.lbl_extra)
+
+    def set_day(self, day_name, title, temps, extra=""):
+        self.day_name = day_name
+        self.lbl_day.setText(title)
+        self.lbl_temp.setText(temps)
+        self.lbl_extra.setText(extra)
+
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
             self.clicked.emit(self.day_name)
         super().mousePressEvent(event)
 
+# --- Hazır Grafik Resmini Gösteren Alan ---
+class ChartView(QLabel):
+    resized = pyqtSignal() # Boyut değişince grafikler yeniden çizilmeli
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Boyutu içindeki resim değil yerleşim belirlesin (yoksa her çizimde büyür)
+        self.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.resized.emit()
+
 # --- Thread Sinyalleri ---
+# Son parametre her zaman işin jetonudur; GUI tarafı bayat sonuçları bununla eler
 class WeatherSignals(QObject):
-    data_ready = pyqtSignal(object, object, object, dict, list) 
-    error_occurred = pyqtSignal(str)
-    icon_ready = pyqtSignal(object, QLabel)
-    clothes_ready = pyqtSignal(list)
+    data_ready = pyqtSignal(object, object)  # (ForecastFrame, jeton)
+    refreshed = pyqtSignal(object, object)   # (zamanlanmış yenilemeden ForecastFrame, arama jetonu)
+    refresh_done = pyqtSignal()
+    error_occurred = pyqtSignal(str, object)
+    icon_ready = pyqtSignal(object, object, object, object)  # (anahtar, QImage, QLabel veya None, jeton)
+    clothes_ready = pyqtSignal(list, object)
+    chart_ready = pyqtSignal(object, object, object)  # (anahtar, QImage, jeton)
+    modules_ready = pyqtSignal()
 
 class WeatherApp(QMainWindow):
     def __init__(self):
@@ -55,18 +143,46 @@ class WeatherApp(QMainWindow):
         self.setWindowTitle(config.APP_TITLE)
 
         self.resize(config.APP_WIDTH, config.APP_HEIGHT)
-        self.setStyleSheet(f"background-color: {config.MAIN_BG_COLOR}; transition: background-color 0.5s;")
         
-        self.weather_cache = {} 
+        self.forecast = None  # Son aramanın ForecastFrame'i
+        self.metrics = None  # Tahminin türetilmiş ölçüleri (derived_metrics.DerivedMetrics)
+        self.slot_advice = []  # Her dilimin (tavsiye, kıyafetler) ikilisi
+        self.current_city = None  # Son aranan şehir (zamanlanmış yenileme bunu da çeker)
+        self.search_token = None
+        self.panel_day = None  # Sol panelde seçili günün adı; None: şu anki hava
+        self.cards_token = None
+        self._city_index = None  # İlk öneri isteğinde açılır; dosya yoksa False
+        self.city_suggestions = {}  # Gösterilen öneriler: etiket -> OWM şehir ID'si
+        self._icon_cache = None
+        self._forecast_store = None  # Sadece işçi thread'lerinden, ilk kullanımda açılır
+        self._store_lock = threading.Lock()
+        self.scheduler = TaskScheduler()
+        perf_trace.register_stats("scheduler", self.scheduler.get_stats)
+        self.view_token = None  # Sol paneldeki büyük ikon + kıyafetler için geçerli jeton
+
+        # Grafikler tek bir çizim thread'inde sırayla, önceden hazırlanır
+        self.offscreen_chart = None  # Sadece çizim thread'inde, ilk çizimde kurulur
+        self._chart_cache = None
+        self.render_pool = TaskScheduler(workers=1)
+        self.chart_token = None
+        self.chart_day = None  # Şu an grafiği gösterilen günün sırası
         
         self.signals = WeatherSignals()
         self.signals.data_ready.connect(self.on_data_ready)
         self.signals.error_occurred.connect(self.show_error)
         self.signals.icon_ready.connect(self.update_icon)
-        self.signals.clothes_ready.connect(self.render_clothes)
+        self.signals.clothes_ready.connect(self.on_clothes_ready)
+        self.signals.chart_ready.connect(self.on_chart_ready)
+        self.signals.modules_ready.connect(self.on_modules_ready)
+        self.signals.refreshed.connect(self.on_forecast_refreshed)
+        self.signals.refresh_done.connect(self.schedule_refresh)
+        self._shell_painted = False
+        self.search_started = None  # Son aramanın başladığı an (izleme için)
 
         # --- ANA DÜZEN ---
-        central_widget = QWidget()
+        # Arka plan rengini merkez widget boyar; tema değişimi ağacı yeniden stillendirmez
+        central_widget = self.background = ThemeBackground()
+        central_widget.first_paint.connect(self.on_shell_painted)
         self.setCentralWidget(central_widget)
         
         main_layout = QHBoxLayout(central_widget)
@@ -81,7 +197,99 @@ class WeatherApp(QMainWindow):
         self.create_content_area()
         main_layout.addWidget(self.content_area, 9)
 
+        self.create_perf_overlay()
+
+        # Dilim sınırlarından hemen sonra arka planda yenileme
+        self.refresh_plan = RefreshSchedule()
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.timeout.connect(self.start_refresh)
+
+    # --- AÇILIŞ ---
+    def on_shell_painted(self):
+        if not self._shell_painted:
+            # Pencere iskeleti ekranda; ağır işler bundan sonra başlasın
+            self._shell_painted = True
+            QTimer.singleShot(0, self.finish_startup)
+
+    def finish_startup(self):
         self.start_search("Kocaeli")
+        self.scheduler.submit(self.warm_up, priority=PRIORITY_PREFETCH)
+        self.schedule_refresh()
+
+    def warm_up(self):
+        # İşçi thread: modülleri GUI'yi bekletmeden yükle
+        load_heavy_modules()
+        self.signals.modules_ready.emit()
+
+    def on_modules_ready(self):
+        # Tüm ikonları en düşük öncelikle diske ve belleğe hazırla
+        on_image = lambda key, img: self.signals.icon_ready.emit(key, img, None, None)
+        for key in self.icon_cache.prewarm_keys(self.devicePixelRatioF()):
+            self.scheduler.submit(self.icon_cache.prewarm, [key], on_image, priority=PRIORITY_PREFETCH)
+
+    # --- PERFORMANS KATMANI (F12: aç/kapa, Ctrl+F12: dışa aktar) ---
+    def create_perf_overlay(self):
+        self.perf_overlay = QLabel(self)
+        self.perf_overlay.setStyleSheet("background-color: rgba(0, 0, 0, 200); color: #7CFC00; "
+                                        "padding: 8px; border-radius: 6px;")
+        self.perf_overlay.setFont(QFont("Consolas", 9))
+        self.perf_overlay.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.perf_overlay.hide()
+        self.perf_timer = QTimer(self)
+        self.perf_timer.setInterval(config.PERF_OVERLAY_INTERVAL_MS)
+        self.perf_timer.timeout.connect(self.refresh_perf_overlay)
+        QShortcut(QKeySequence("F12"), self, activated=self.toggle_perf_overlay)
+        QShortcut(QKeySequence("Ctrl+F12"), self, activated=self.export_perf)
+
+    def toggle_perf_overlay(self):
+        if self.perf_overlay.isVisible():
+            self.perf_overlay.hide()
+            self.perf_timer.stop()
+            perf_trace.enable(config.PERF_TRACE)
+            return
+        perf_trace.enable()
+        self.refresh_perf_overlay()
+        self.perf_overlay.show()
+        self.perf_overlay.raise_()
+        self.perf_timer.start()
+
+    def refresh_perf_overlay(self):
+        self.perf_overlay.setText(perf_trace.format_table())
+        self.perf_overlay.adjustSize()
+        self.perf_overlay.move(self.width() - self.perf_overlay.width() - 10, 10)
+
+    def export_perf(self):
+        """Anlık ölçümleri PERF_EXPORT_DIR'e JSON ve Prometheus metni olarak yazar."""
+        snap = perf_trace.snapshot()
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        try:
+            os.makedirs(config.PERF_EXPORT_DIR, exist_ok=True)
+            base = os.path.join(config.PERF_EXPORT_DIR, f"perf-{stamp}")
+            with open(base + ".json", "w", encoding="utf-8") as f:
+                json.dump(snap, f, ensure_ascii=False, indent=2)
+            with open(base + ".prom", "w", encoding="utf-8") as f:
+                f.write(perf_trace.to_prometheus(snap))
+        except OSError:
+            return
+        if self.perf_overlay.isVisible():
+            self.perf_overlay.setText(perf_trace.format_table(snap) + f"\n\n-> {base}.json")
+
+    @property
+    def icon_cache(self):
+        if self._icon_cache is None:
+            load_heavy_modules()
+            self._icon_cache = icons.IconCache()
+            perf_trace.register_stats("icon_cache", self._icon_cache.get_stats)
+        return self._icon_cache
+
+    @property
+    def chart_cache(self):
+        if self._chart_cache is None:
+            load_heavy_modules()
+            self._chart_cache = charts.ChartImageCache()
+            perf_trace.register_stats("chart_cache", self._chart_cache.get_stats)
+        return self._chart_cache
 
     def add_shadow(self, widget, blur=15):
         shadow = QGraphicsDropShadowEffect()
@@ -116,7 +324,24 @@ class WeatherApp(QMainWindow):
                 border-radius: 12px; color: white; padding: 10px; font-size: 14px;
             }}
         """)
-        self.entry_search.returnPressed.connect(lambda: self.start_search())
+        self.entry_search.returnPressed.connect(self.on_search_return)
+
+        # Otomatik tamamlama: çevrimdışı şehir dizininden, yazma durduktan sonra
+        self.city_model = QStringListModel(self)
+        self.completer = QCompleter(self.city_model, self)
+        self.completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        self.completer.setWidget(self.entry_search)
+        self.completer.activated.connect(self.on_city_chosen)
+        self.completer.popup().setStyleSheet(f"""
+            QListView {{ background-color: {config.MAIN_BG_COLOR}; color: {config.TEXT_WHITE};
+                         border: 1px solid rgba(255,255,255,30); font-size: 14px; }}
+            QListView::item:selected {{ background-color: {config.HOVER_COLOR}; color: {config.ACCENT}; }}
+        """)
+        self.suggest_timer = QTimer(self)
+        self.suggest_timer.setSingleShot(True)
+        self.suggest_timer.setInterval(config.AUTOCOMPLETE_DEBOUNCE_MS)
+        self.suggest_timer.timeout.connect(self.update_suggestions)
+        self.entry_search.textEdited.connect(self.suggest_timer.start)
         
         btn_search = QPushButton("🔍")
         btn_search.setFixedSize(45, 45)
@@ -231,6 +456,14 @@ class WeatherApp(QMainWindow):
         self.clothing_layout.setContentsMargins(0, 10, 0, 0)
         self.clothing_layout.setSpacing(15)
         self.clothing_layout.setAlignment(Qt.AlignmentFlag.AlignCenter) 
+
+        # Kıyafet başına bir etiket, bir kez; stil kapsayıcıdan gelir
+        self.clothing_labels = []
+        for _ in config.CLOTHING_URLS:
+            lbl = QLabel()
+            lbl.hide()
+            self.clothing_layout.addWidget(lbl)
+            self.clothing_labels.append(lbl)
         
         ac_layout.addWidget(self.clothing_container)
 
@@ -295,102 +528,208 @@ class WeatherApp(QMainWindow):
         self.lbl_chart_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         chart_layout.addWidget(self.lbl_chart_title)
 
-        self.fig, (self.ax_rain, self.ax_temp, self.ax_wind) = plt.subplots(3, 1, figsize=(6, 6), dpi=90, sharex=True)
-        self.fig.subplots_adjust(top=0.92, bottom=0.1, hspace=0.5) 
-        
-        self.fig.patch.set_facecolor("none")
-        for ax in [self.ax_rain, self.ax_temp, self.ax_wind]:
-            ax.set_facecolor("none")
-            ax.tick_params(axis='x', colors='white', labelsize=9)
-            ax.tick_params(axis='y', colors='white')
-            ax.spines['bottom'].set_color('white')
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.spines['left'].set_visible(False)
-            ax.get_yaxis().set_visible(False) 
-        
-        self.canvas = FigureCanvasQTAgg(self.fig)
-        self.canvas.setStyleSheet("background-color: transparent;")
-        chart_layout.addWidget(self.canvas)
+        self.chart_view = ChartView()
+        self.chart_view.setStyleSheet("background-color: transparent; border: none;")
+        chart_layout.addWidget(self.chart_view, stretch=1)
+
+        # Pencere boyutlanırken her adımda değil, durulunca yeniden çiz
+        self.chart_resize_timer = QTimer(self)
+        self.chart_resize_timer.setSingleShot(True)
+        self.chart_resize_timer.setInterval(150)
+        self.chart_resize_timer.timeout.connect(self.on_chart_resized)
+        self.chart_view.resized.connect(self.chart_resize_timer.start)
         
         layout.addWidget(chart_card, stretch=5)
 
         # GÜNLÜK TAHMİN (Tıklanabilir Kartlar)
         self.daily_frame = QWidget()
-        self.daily_frame.setStyleSheet("background-color: transparent;")
+        self.daily_frame.setStyleSheet(f"""
+            QWidget {{ background-color: transparent; }}
+            DailyCard {{ 
+                background-color: {config.CARD_BG}; 
+                border-radius: 15px;
+                border: 1px solid rgba(255,255,255,10);
+            }}
+            DailyCard:hover {{
+                background-color: rgba(255, 255, 255, 30);
+                border: 1px solid {config.ACCENT};
+            }}
+            DailyCard QLabel {{ background-color: transparent; border: none; }}
+            QLabel#cardDay {{ color: white; font-weight: bold; }}
+            QLabel#cardTemp {{ color: {config.TEXT_GRAY}; }}
+            QLabel#cardExtra {{ color: {config.TEXT_GRAY}; font-size: 11px; }}
+        """)
         self.daily_layout = QHBoxLayout(self.daily_frame)
         self.daily_layout.setContentsMargins(0,0,0,0)
         self.daily_layout.setSpacing(15) 
+
+        # 6 GÜN GÖSTERME: kartlar bir kez kurulur, veride olmayan günlerinki gizlenir
+        self.daily_cards = []
+        for _ in range(6):
+            card = DailyCard()
+            card.clicked.connect(self.switch_chart_day)
+            card.hide()
+            self.daily_layout.addWidget(card)
+            self.daily_cards.append(card)
         
         layout.addWidget(self.daily_frame)
 
+    # --- ŞEHİR ARAMA ---
+    @property
+    def city_index(self):
+        """Çevrimdışı şehir dizini; ilk kullanımda açılır, dosya yoksa None (öneri yok, q= ile arama)."""
+        if self._city_index is None:
+            import city_index
+            self._city_index = city_index.open_index(config.CITY_INDEX_PATH) or False
+        return self._city_index or None
+
+    def update_suggestions(self):
+        text = self.entry_search.text()
+        index = self.city_index
+        if index is None or text in self.city_suggestions:
+            return
+        with perf_trace.span("autocomplete"):
+            matches = index.search(text) if len(text.strip()) >= 2 else []
+        self.city_suggestions = {m.label: m.id for m in matches}
+        self.city_model.setStringList(list(self.city_suggestions))
+        if matches:
+            self.completer.complete()
+        else:
+            self.completer.popup().hide()
+
+    def on_city_chosen(self, label):
+        self.entry_search.setText(label)
+        self.start_search(self.city_suggestions.get(label, label))
+
+    def on_search_return(self):
+        popup = self.completer.popup()
+        if popup.isVisible() and popup.currentIndex().isValid():
+            return  # Enter bir öneriyi seçti; arama on_city_chosen'dan başlar
+        self.start_search()
+
+    def resolve_query(self, text):
+        """
+        Arama kutusundaki metni sorguya çevirir: dizinde adı tam eşleşen şehrin ID'si.
+        Eşleşme yoksa ağa çıkılmaz; benzer şehirler önerilir ya da "Bulunamadı!" yazılır.
+        Dizin yoksa ya da metin OWM'nin "Ad,ÜLKE" yazımıysa metin olduğu gibi sorgulanır.
+        """
+        text = text.strip()
+        if not text:
+            return None
+        if text in self.city_suggestions:
+            return self.city_suggestions[text]
+        index = self.city_index
+        if index is None or "," in text or text.isdigit():
+            return text
+        match = index.resolve(text)
+        if match:
+            return match.id
+        self.suggest_timer.stop()
+        self.update_suggestions()
+        if not self.city_suggestions:
+            self.lbl_desc.setText("Bulunamadı!")
+        return None
+
     def start_search(self, city_arg=None):
-        city = city_arg if city_arg else self.entry_search.text()
+        city = city_arg if city_arg else self.resolve_query(self.entry_search.text())
         if not city: return
         self.lbl_desc.setText("Yükleniyor...")
-        threading.Thread(target=self.process_weather, args=(city,), daemon=True).start()
-
-    def process_weather(self, city):
-        data = weather_logic.fetch_weather_data(city)
-        if not data:
-            self.signals.error_occurred.emit("Bulunamadı!")
+        # Yeni arama, henüz bitmemiş eski aramaları geçersiz kılar
+        token = self.scheduler.new_token("search")
+        self.current_city, self.search_token = city, token
+        self.search_started = time.perf_counter()
+        self.scheduler.submit(self.process_weather, city, token, priority=PRIORITY_FORECAST, token=token)
+
+    def process_weather(self, city, token=None):
+        load_weather_logic()  # Grafik / resim modüllerini beklemeden veriyi çek
+        try:
+            frame = weather_logic.fetch_weather_data(city)
+        except weather_logic.CityNotFoundError:
+            self.signals.error_occurred.emit("Bulunamadı!", token)
+            return
+        except weather_logic.RequestTimeoutError:
+            self.show_stored_or_error(city, "Zaman aşımı!", token)
+            return
+        except weather_logic.WeatherError:
+            self.show_stored_or_error(city, "Bağlantı hatası!", token)
             return
-
-        curr = data["list"][0]
-        desc = curr["weather"][0]["description"].title()
-        
-        weather_by_day = {}
-        daily_summary = []
-        
-        seen_days = set()
-        
-        for item in data["list"]:
-            dt = datetime.fromtimestamp(item["dt"])
-            d_name = dt.strftime("%A")
-            
-            if d_name not in weather_by_day:
-                weather_by_day[d_name] = {
-                    "times": [], "temps": [], "rains": [], "winds": [], "degs": [], "items": []
-                }
-            
-            weather_by_day[d_name]["items"].append(item)
-
-            weather_by_day[d_name]["times"].append(dt.strftime("%H:%M"))
-            weather_by_day[d_name]["temps"].append(item["main"]["temp"])
-            weather_by_day[d_name]["rains"].append(item.get("pop", 0) * 100)
-            weather_by_day[d_name]["winds"].append(item["wind"]["speed"])
-            weather_by_day[d_name]["degs"].append(item["wind"]["deg"])
-            
-            if d_name not in seen_days:
-                daily_summary.append({
-                    "day": d_name,
-                    "icon": item["weather"][0]["icon"],
-                    "temp_sample": item["main"]["temp"] 
-                })
-                seen_days.add(d_name)
-        
-        # Min/Max hesapla
-        for d_sum in daily_summary:
-            day_key = d_sum["day"]
-            temps = weather_by_day[day_key]["temps"]
-            d_sum["min"] = min(temps)
-            d_sum["max"] = max(temps)
 
         # Sinyal ile veriyi gönder
-        self.signals.data_ready.emit(curr, data["city"]["name"], desc, weather_by_day, daily_summary)
-        
-        self.download_and_emit_icon(curr["weather"][0]["icon"], self.icon_label, (130, 130))
-        temp = curr['main']['temp']
-        clothing_urls = weather_logic.get_clothing_icon_urls(temp, desc)
-        self.download_clothes(clothing_urls)
-
-    def on_data_ready(self, curr, city, desc, weather_map, daily_summary):
+        if self.scheduler.is_current(token):
+            self.signals.data_ready.emit(frame, token)
+        self.scheduler.submit(self.save_forecast, frame, priority=PRIORITY_PREFETCH)
+
+    # --- KALICI TAHMİN GEÇMİŞİ (işçi thread'lerinde) ---
+    def forecast_store(self):
+        """Açılamazsa (salt okunur disk vb.) None; uygulama geçmişsiz çalışmaya devam eder."""
+        with self._store_lock:
+            if self._forecast_store is None:
+                import sqlite3
+                import forecast_store
+                try:
+                    self._forecast_store = forecast_store.ForecastStore()
+                except (sqlite3.Error, OSError):
+                    self._forecast_store = False
+            return self._forecast_store or None
+
+    def save_forecast(self, frame):
+        store = self.forecast_store()
+        if store:
+            store.ingest(frame)
+
+    def show_stored_or_error(self, city, message, token):
+        """Ağa ulaşılamazsa şehrin saklı son tahminini gösterir; o da yoksa hatayı."""
+        store = self.forecast_store()
+        frame = store.latest_frame(city) if store else None
+        if frame is None:
+            self.signals.error_occurred.emit(message, token)
+        elif self.scheduler.is_current(token):
+            self.signals.data_ready.emit(frame, token)
+
+    @perf_trace.traced("ui_update")
+    def on_data_ready(self, frame, token=None):
         """Veri geldiğinde çalışır"""
-        self.weather_cache = weather_map 
-        self.daily_summary_cache = daily_summary
-        
-        self.lbl_city.setText(city)
-        self.lbl_temp.setText(f"{curr['main']['temp']:.0f}°")
+        if not self.scheduler.is_current(token):
+            return  # Bu arada daha yeni bir arama yapılmış
+        if self.search_started is not None:
+            perf_trace.record("search_to_data", (time.perf_counter() - self.search_started) * 1000)
+        load_heavy_modules()  # Genelde warm_up bitirmiş olur; olmadıysa burada tamamlanır
+        self.set_forecast(frame)
+        daily_summary = self.daily_rows(frame)
+
+        self.show_current(frame)
+        self.fill_daily_cards(daily_summary)
+
+        # Yeni veri geldi: eski grafikler atılır, tüm günler arka planda çizilmeye başlar
+        self.chart_cache.clear()
+        self.chart_day = 0 if daily_summary else None
+        self.prerender_charts()
+
+        if daily_summary:
+            # Otomatik olarak listedeki ilk günün grafiğini göster
+            self.show_chart_titled(0)
+
+    def set_forecast(self, frame):
+        """
+        Gösterilen tahmini değiştirir. Türetilmiş ölçüler (hissedilen sıcaklık, yağış,
+        hamle) ve tüm dilimlerin tavsiyeleri burada tek vektörel geçişte hesaplanır.
+        """
+        self.forecast = frame
+        self.metrics = weather_logic.get_derived_metrics(frame)
+        self.slot_advice = weather_logic.advise_frame(frame, self.metrics)
+
+    def daily_rows(self, frame):
+        """Kartların verisi: günlük özet + günün yağış toplamı ve en sert hamlesi."""
+        return [{**day, **derived} for day, derived in zip(frame.daily_summary(), self.metrics.daily(0))]
+
+    def show_current(self, frame):
+        """Sol paneli tahminin ilk dilimiyle (şu anki hava) doldurur."""
+        self.panel_day = None
+        curr = frame.slot(0)
+        desc = curr["desc"].title()
+
+        self.lbl_city.setText(frame.city)
+        self.lbl_temp.setText(f"{curr['temp']:.0f}°")
         self.lbl_desc.setText(desc)
         
         # Tarih Gösterimi (Bilgisayarın o anki zamanını kullanır)
@@ -405,94 +744,117 @@ class WeatherApp(QMainWindow):
         
         self.lbl_date.setText(f"{now.day} {month_tr}, {day_tr}")
 
-        icon_code = curr['weather'][0]['icon'] 
-        new_bg_color = config.WEATHER_BG_COLORS.get(icon_code, config.MAIN_BG_COLOR)
-        self.setStyleSheet(f"background-color: {new_bg_color}; transition: background-color 0.5s;")
+        icon_code = curr['icon'] 
+        self.background.set_theme(theme_for(icon_code))
 
-        self.stat_labels["hum"].setText(f"%{curr['main']['humidity']}")
-        self.stat_labels["feels"].setText(f"{curr['main']['feels_like']:.0f}°")
-        self.stat_labels["vis"].setText(f"{curr.get('visibility', 10000)/1000:.1f} km")
-        self.stat_labels["pres"].setText(f"{curr['main']['pressure']} hPa")
+        self.stat_labels["hum"].setText(f"%{curr['humidity']}")
+        self.stat_labels["feels"].setText(f"{curr['feels_like']:.0f}°")
+        self.stat_labels["vis"].setText(f"{curr['visibility']/1000:.1f} km")
+        self.stat_labels["pres"].setText(f"{curr['pressure']} hPa")
 
-        advice = weather_logic.get_smart_advice(curr['main']['temp'], desc.lower(), curr['wind']['speed'])
+        advice, clothes = self.slot_advice[0]
         self.lbl_advice.setText(advice)
 
-        self.create_daily_cards(daily_summary)
-
-        if daily_summary:
-            # Otomatik olarak listedeki ilk günün grafiğini çiz
-            first_day = daily_summary[0]["day"]
-            if first_day in weather_map:
-                data = weather_map[first_day]
-                tr_name = tr_days.get(first_day, first_day)
-                self.lbl_chart_title.setText(f"{tr_name} Günü Detaylı Analiz")
-                self.draw_charts(data["times"], data["temps"], data["rains"], data["winds"], data["degs"])
-
-    def create_daily_cards(self, daily_data):
-        while self.daily_layout.count():
-            child = self.daily_layout.takeAt(0)
-            if child.widget(): child.widget().deleteLater()
-            
+        self.view_token = self.scheduler.new_token("view")
+        self.show_icon(icon_code, self.icon_label, (130, 130), self.view_token)
+        self.show_clothes([config.CLOTHING_URLS[c] for c in clothes], self.view_token)
+
+    # --- ZAMANLANMIŞ YENİLEME ---
+    def schedule_refresh(self):
+        self.refresh_wake = self.refresh_plan.next_wake()
+        self.refresh_timer.start(int(max(0.0, self.refresh_wake - time.time()) * 1000))
+
+    def start_refresh(self):
+        # Zamanlayıcı biraz erken / geç tetiklense de planlanan dilim yenilenmiş sayılır
+        self.refresh_plan.mark_done(self.refresh_wake)
+        targets = self.refresh_plan.targets(self.current_city)
+        if not targets:
+            self.schedule_refresh()
+            return
+        self.scheduler.submit(self.refresh_watched, targets, self.current_city, self.search_token,
+                              priority=PRIORITY_PREFETCH)
+
+    def refresh_watched(self, cities, current, token):
+        """İşçi thread: izlenen şehirleri önbelleği atlayarak tek seferde çeker ve saklar."""
+        load_weather_logic()
+        try:
+            frames = []
+            for result in weather_logic.fetch_many(cities, refresh=True):
+                if result.forecast is None:
+                    continue  # Ağ hatası: ekrandaki veri kalır, bir sonraki dilimde tekrar denenir
+                frames.append(result.forecast)
+                if result.city == current and self.scheduler.is_current(token):
+                    self.signals.refreshed.emit(result.forecast, token)
+            store = self.forecast_store()
+            if store and frames:
+                store.ingest_many(frames)
+        finally:
+            self.signals.refresh_done.emit()
+
+    def on_forecast_refreshed(self, frame, token):
+        """Yenilenen tahmini eldekiyle dilim dilim karşılaştırıp sadece değişen kısımları çizer."""
+        old = self.forecast
+        if not self.scheduler.is_current(token) or old is None:
+            return
+        if frame.slot_hashes() == old.slot_hashes():
+            perf_trace.count("refresh_unchanged")
+            return
+        perf_trace.count("refresh_changed")
+        changed = frame.changed_days(old)
+        chart_name = old.day_names[self.chart_day] if self.chart_day is not None else None
+        self.set_forecast(frame)
+
+        daily_summary = self.daily_rows(frame)
+        if frame.day_names[:6] != old.day_names[:6]:
+            self.fill_daily_cards(daily_summary)  # Gün kaydı: kartların sırası değişti
+        else:
+            for day in changed:
+                if day < len(self.daily_cards):
+                    self.fill_daily_card(self.daily_cards[day], daily_summary[day])
+
+        # Değişmeyen günlerin grafikleri önbellekte aynı anahtarla durur, sadece değişenler çizilir
+        day = frame.day_index(chart_name) if chart_name is not None else None
+        self.chart_day = day if day is not None else (0 if daily_summary else None)
+        self.prerender_charts(changed)
+
+        panel_day = frame.day_index(self.panel_day) if self.panel_day is not None else None
+        if panel_day is not None:
+            if panel_day in changed:
+                self.switch_chart_day(self.panel_day)  # Grafiği de gösterir
+            return
+        if self.panel_day is not None or frame.slot_hashes()[0] != old.slot_hashes()[0]:
+            self.show_current(frame)  # Seçili gün tahminden düştüyse şu anki havaya dön
+        if self.chart_day is not None and (day is None or day in changed):
+            self.show_chart_titled(self.chart_day)
+
+    # --- GÜNLÜK KARTLAR ---
+    def fill_daily_cards(self, daily_data):
+        """Kart havuzunu günlerle doldurur; fazla kartlar gizlenir."""
+        self.cards_token = self.scheduler.new_token("cards")  # Eski günün ikonu karta geç basılmasın
+        for i, card in enumerate(self.daily_cards):
+            if i < len(daily_data):
+                self.fill_daily_card(card, daily_data[i])
+            card.setVisible(i < len(daily_data))
+
+    def fill_daily_card(self, card, d):
         tr_days = {"Monday":"PZT", "Tuesday":"SAL", "Wednesday":"ÇAR", "Thursday":"PER", "Friday":"CUM", "Saturday":"CMT", "Sunday":"PAZ"}
-
-        # 6 GÜN GÖSTERME (Eğer API'de o kadar gün varsa)
-        for i, d in enumerate(daily_data[:6]): 
-            d_name_raw = d["day"]
-            d_name_tr = tr_days.get(d_name_raw, d_name_raw[:3])
-            
-            card = DailyCard(d_name_raw)
-            card.clicked.connect(self.switch_chart_day)
-
-            card.setStyleSheet(f"""
-                DailyCard {{ 
-                    background-color: {config.CARD_BG}; 
-                    border-radius: 15px;
-                    border: 1px solid rgba(255,255,255,10);
-                }}
-                DailyCard:hover {{
-                    background-color: rgba(255, 255, 255, 30);
-                    border: 1px solid {config.ACCENT};
-                }}
-                QLabel {{ background-color: transparent; border: none; }}
-            """)
-            
-            cl = QVBoxLayout(card)
-            cl.setContentsMargins(5, 5, 5, 5) 
-            
-            lbl_day = QLabel(d_name_tr)
-            lbl_day.setStyleSheet("color: white; font-weight: bold;")
-            lbl_day.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            lbl_icon = QLabel()
-            lbl_icon.setFixedSize(50, 50)
-            lbl_icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            threading.Thread(target=self.download_and_emit_icon, args=(d["icon"], lbl_icon, (50,50)), daemon=True).start()
-            
-            icon_wrap = QWidget()
-            iw_box = QHBoxLayout(icon_wrap); 
-            iw_box.addWidget(lbl_icon, alignment=Qt.AlignmentFlag.AlignCenter)
-            iw_box.setContentsMargins(0,0,0,0)
-
-            lbl_temp = QLabel(f"{d['max']:.0f}° / {d['min']:.0f}°")
-            lbl_temp.setStyleSheet(f"color: {config.TEXT_GRAY};")
-            lbl_temp.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            cl.addWidget(lbl_day)
-            cl.addWidget(icon_wrap)
-            cl.addWidget(lbl_temp)
-            
-            self.daily_layout.addWidget(card)
+        d_name_raw = d["day"]
+        card.set_day(d_name_raw, tr_days.get(d_name_raw, d_name_raw[:3]), f"{d['max']:.0f}° / {d['min']:.0f}°",
+                     f"{d['precip']:.1f} mm · {d['gust']:.0f} m/s")
+        if not self.show_icon(d["icon"], card.lbl_icon, (50, 50), self.cards_token, PRIORITY_DECOR):
+            card.lbl_icon.clear()  # İkon gelene kadar önceki günün ikonu kalmasın
 
     def switch_chart_day(self, day_name):
         """Seçilen güne göre TÜM ekranı günceller"""
-        if day_name not in self.weather_cache:
+        frame = self.forecast
+        day = frame.day_index(day_name) if frame is not None else None
+        if day is None:
             return
+        self.panel_day = day_name
 
-        data = self.weather_cache[day_name]
-        
-        temps = data["temps"]
-        max_idx = temps.index(max(temps))
-        rep_item = data["items"][max_idx]
+        # Günün temsilcisi: en sıcak dilim
+        rep = int(frame.day_argmax()[day])
+        rep_item = frame.slot(rep)
 
         dt = datetime.fromtimestamp(rep_item["dt"])
         day_eng = dt.strftime("%A")
@@ -504,114 +866,152 @@ class WeatherApp(QMainWindow):
         
         self.lbl_date.setText(f"{dt.day} {month_tr}, {day_tr}")
 
-        curr_temp = rep_item["main"]["temp"]
-        desc = rep_item["weather"][0]["description"].title()
+        curr_temp = rep_item["temp"]
+        desc = rep_item["desc"].title()
         
         self.lbl_temp.setText(f"{curr_temp:.0f}°")
         self.lbl_desc.setText(desc)
 
-        icon_code = rep_item["weather"][0]["icon"]
-        threading.Thread(target=self.download_and_emit_icon, args=(icon_code, self.icon_label, (130, 130)), daemon=True).start()
+        icon_code = rep_item["icon"]
+        self.view_token = self.scheduler.new_token("view")
+        self.show_icon(icon_code, self.icon_label, (130, 130), self.view_token)
 
-        new_bg_color = config.WEATHER_BG_COLORS.get(icon_code, config.MAIN_BG_COLOR)
-        self.setStyleSheet(f"background-color: {new_bg_color}; transition: background-color 0.5s;")
+        self.background.set_theme(theme_for(icon_code))
 
-        self.stat_labels["hum"].setText(f"%{rep_item['main']['humidity']}")
-        self.stat_labels["feels"].setText(f"{rep_item['main']['feels_like']:.0f}°")
-        vis = rep_item.get('visibility', 10000) / 1000
+        self.stat_labels["hum"].setText(f"%{rep_item['humidity']}")
+        self.stat_labels["feels"].setText(f"{rep_item['feels_like']:.0f}°")
+        vis = rep_item['visibility'] / 1000
         self.stat_labels["vis"].setText(f"{vis:.1f} km")
-        self.stat_labels["pres"].setText(f"{rep_item['main']['pressure']} hPa")
+        self.stat_labels["pres"].setText(f"{rep_item['pressure']} hPa")
 
-        wind_speed = rep_item['wind']['speed']
-        advice = weather_logic.get_smart_advice(curr_temp, desc.lower(), wind_speed)
+        advice, clothes = self.slot_advice[rep]
         self.lbl_advice.setText(advice)
 
-        clothing_urls = weather_logic.get_clothing_icon_urls(curr_temp, desc)
-        threading.Thread(target=self.download_clothes, args=(clothing_urls,), daemon=True).start()
-
-        tr_name = tr_days.get(day_name, day_name)
-        self.lbl_chart_title.setText(f"{tr_name} Günü Detaylı Analiz")
-
-        self.draw_charts(data["times"], data["temps"], data["rains"], data["winds"], data["degs"])
-
-    def draw_charts(self, times, temps, rains, winds, wind_degs):
-        self.ax_rain.clear()
-        self.ax_temp.clear()
-        self.ax_wind.clear()
-
-        self.ax_rain.tick_params(labelbottom=True)
-        self.ax_temp.tick_params(labelbottom=True)
-
-        self.ax_rain.set_title("Yağış İhtimali (%)", loc='left', color=config.RAIN_COLOR, fontsize=10, fontweight='bold', pad=10)
-        self.ax_temp.set_title("Sıcaklık (°C)", loc='left', color=config.ACCENT, fontsize=10, fontweight='bold', pad=10)
-        self.ax_wind.set_title("Rüzgar (km/s)", loc='left', color=config.WIND_COLOR, fontsize=10, fontweight='bold', pad=10)
-
-        # 1. Yağmur
-        bars = self.ax_rain.bar(times, rains, color=config.RAIN_COLOR, alpha=0.7, width=0.5)
-        self.ax_rain.set_ylim(0, 115) 
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0:
-                self.ax_rain.text(bar.get_x() + bar.get_width()/2., height + 1,
-                                  f'%{int(height)}', ha='center', va='bottom', color='white', fontsize=8)
-
-        # 2. Sıcaklık
-        self.ax_temp.plot(times, temps, color=config.ACCENT, linewidth=3, marker='o', markerfacecolor='white')
-        self.ax_temp.fill_between(times, temps, min(temps)-5, color=config.ACCENT, alpha=0.2)
-        if temps: self.ax_temp.set_ylim(min(temps)-2, max(temps)+2)
-        for i, t in enumerate(temps):
-            self.ax_temp.annotate(f"{t:.0f}°", (times[i], t), xytext=(0,10), 
-                             textcoords="offset points", ha='center', color='white', fontweight='bold', fontsize=9)
-
-        # 3. Rüzgar
-        self.ax_wind.plot(times, winds, color=config.WIND_COLOR, linewidth=2)
-        if winds: self.ax_wind.set_ylim(min(winds)-1, max(winds)+5)
-        
-        for i, w in enumerate(winds):
-            self.ax_wind.annotate(f"{w:.0f}", (times[i], w), xytext=(0, -15), 
-                                  textcoords="offset points", ha='center', color='white', fontsize=9)
-            rotation = -wind_degs[i] 
-            self.ax_wind.annotate("⬇", (times[i], w), xytext=(0, 15),
-                              textcoords="offset points",
-                              color=config.WIND_COLOR, ha='center', va='center', 
-                              fontsize=14, rotation=rotation)
-
-        self.canvas.draw()
-
-    def download_and_emit_icon(self, code, label_widget, size):
-        pil_img = weather_logic.download_icon(code)
-        if pil_img:
-            pil_img = pil_img.resize(size, Image.Resampling.LANCZOS)
-            qim = ImageQt.ImageQt(pil_img)
-            pix = QPixmap.fromImage(qim)
-            self.signals.icon_ready.emit(pix, label_widget)
-
-    def update_icon(self, pixmap, label):
-        label.setPixmap(pixmap)
-
-    def download_clothes(self, urls):
+        self.show_clothes([config.CLOTHING_URLS[c] for c in clothes], self.view_token)
+
+        self.show_chart_titled(day)
+
+    # --- GRAFİKLER (önceden çizilmiş resimler) ---
+    def chart_key(self, day):
+        size = self.chart_view.size()
+        return charts.make_key(self.forecast.city, self.forecast.day_names[day], self.forecast.day_series(day),
+                         (size.width(), size.height()), self.chart_view.devicePixelRatioF())
+
+    def show_chart_titled(self, day):
+        tr_days = {"Monday":"Pazartesi", "Tuesday":"Salı", "Wednesday":"Çarşamba", "Thursday":"Perşembe", "Friday":"Cuma", "Saturday":"Cumartesi", "Sunday":"Pazar"}
+        day_name = self.forecast.day_names[day]
+        self.lbl_chart_title.setText(f"{tr_days.get(day_name, day_name)} Günü Detaylı Analiz")
+        self.show_chart(day)
+
+    def show_chart(self, day):
+        """Günün grafiği hazırsa sadece resmi değiştirir, değilse öne alıp çizdirir."""
+        self.chart_day = day
+        key = self.chart_key(day)
+        img = self.chart_cache.get(key)
+        if img is not None:
+            self.chart_view.setPixmap(QPixmap.fromImage(img))
+            return
+        self.render_pool.submit(self.render_chart, key, forecast_interp.day_series(self.forecast, day), self.chart_token,
+                                priority=PRIORITY_FORECAST, token=self.chart_token)
+
+    def prerender_charts(self, days=None):
+        """
+        Günlerin (varsayılan: hepsi) grafiklerini o anki boyutta sıraya koyar;
+        eski sıradakileri iptal eder.
+        """
+        self.chart_token = self.render_pool.new_token("charts")
+        if self.forecast is None:
+            return
+        for day in (range(self.forecast.day_count) if days is None else days):
+            priority = PRIORITY_FORECAST if day == self.chart_day else PRIORITY_DECOR
+            self.render_pool.submit(self.render_chart, self.chart_key(day), forecast_interp.day_series(self.forecast, day),
+                                    self.chart_token, priority=priority, token=self.chart_token)
+
+    def render_chart(self, key, series, token=None):
+        # Çizim thread'i: aynı anahtar daha önce çizildiyse tekrar çizme
+        img = self.chart_cache.peek(key)
+        if img is None:
+            size, dpr = key[3], key[4] / charts.BASE_DPI
+            if size[0] < 10 or size[1] < 10:
+                return  # Alan henüz yerleşmemiş
+            if self.offscreen_chart is None:
+                self.offscreen_chart = charts.OffscreenChart()
+            with perf_trace.span("chart_render"):
+                img = self.offscreen_chart.render(series, size, dpr)
+            self.chart_cache.put(key, img)
+        self.signals.chart_ready.emit(key, img, token)
+
+    def on_chart_ready(self, key, img, token=None):
+        if self.chart_day is None or not self.render_pool.is_current(token):
+            return
+        if key == self.chart_key(self.chart_day):
+            self.chart_view.setPixmap(QPixmap.fromImage(img))
+            if self.search_started is not None:
+                perf_trace.record("search_to_chart", (time.perf_counter() - self.search_started) * 1000)
+                self.search_started = None
+
+    def on_chart_resized(self):
+        if self.forecast is None:
+            return  # Henüz çizilecek veri yok
+        # Boyut değişti: eski boyuttaki resimler işe yaramaz
+        self.chart_cache.clear()
+        self.prerender_charts()
+
+    def show_icon(self, code, label_widget, size, token=None, priority=PRIORITY_ICON):
+        """Önbellekte hazır pixmap varsa anında basar (True), yoksa işçi havuzuna hazırlatır (False)."""
+        key = icons.make_key(code, size, label_widget.devicePixelRatioF())
+        pix = self.icon_cache.get_pixmap(key)
+        if pix is not None:
+            label_widget.setPixmap(pix)
+            return True
+        self.scheduler.submit(self.download_and_emit_icon, key, label_widget, token,
+                              priority=priority, token=token)
+        return False
+
+    def download_and_emit_icon(self, key, label_widget, token=None):
+        try:
+            qimg = self.icon_cache.load_image(key)
+        except weather_logic.WeatherError:
+            return  # İkon gelmezse eski ikon yerinde kalır
+        self.signals.icon_ready.emit(key, qimg, label_widget, token)
+
+    def update_icon(self, key, qimg, label, token=None):
+        pix = self.icon_cache.put_image(key, qimg)  # Bayat olsa da önbelleğe girsin
+        if label is not None and self.scheduler.is_current(token):
+            label.setPixmap(pix)
+
+    def show_clothes(self, urls, token=None):
+        dpr = self.clothing_container.devicePixelRatioF()
+        keys = [icons.make_key(url, (45, 45), dpr) for url in urls]
+        pixmaps = [self.icon_cache.get_pixmap(key) for key in keys]
+        if all(pix is not None for pix in pixmaps):
+            self.render_clothes(pixmaps)
+            return
+        self.scheduler.submit(self.download_clothes, keys, token, priority=PRIORITY_ICON, token=token)
+
+    def download_clothes(self, keys, token=None):
         images = []
-        for url in urls:
-            pil_img = weather_logic.download_image_from_url(url)
-            if pil_img:
-                pil_img = pil_img.resize((45, 45), Image.Resampling.LANCZOS)
-                qim = ImageQt.ImageQt(pil_img)
-                pix = QPixmap.fromImage(qim)
-                images.append(pix)
-        self.signals.clothes_ready.emit(images)
+        for key in keys:
+            try:
+                images.append((key, self.icon_cache.load_image(key)))
+            except weather_logic.WeatherError:
+                continue
+        self.signals.clothes_ready.emit(images, token)
+
+    def on_clothes_ready(self, images, token=None):
+        pixmaps = [self.icon_cache.put_image(key, qimg) for key, qimg in images]
+        if self.scheduler.is_current(token):
+            self.render_clothes(pixmaps)
 
     def render_clothes(self, pixmaps):
-        while self.clothing_layout.count():
-            child = self.clothing_layout.takeAt(0)
-            if child.widget(): child.widget().deleteLater()
-        for pix in pixmaps:
-            lbl = QLabel()
-            lbl.setPixmap(pix)
-            lbl.setStyleSheet("background-color: transparent; border: none;") 
-            self.clothing_layout.addWidget(lbl)
-
-    def show_error(self, msg):
-        self.lbl_desc.setText(msg)
+        for i, lbl in enumerate(self.clothing_labels):
+            if i < len(pixmaps):
+                lbl.setPixmap(pixmaps[i])
+            lbl.setVisible(i < len(pixmaps))
+
+    def show_error(self, msg, token=None):
+        if self.scheduler.is_current(token):
+            self.lbl_desc.setText(msg)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -0,0 +1,182 @@
+# perf_trace.py
+"""
+Hafif performans izleme: aşama süreleri (span), sayaçlar ve anlık değerler.
+
+    with perf_trace.span("fetch"):
+        ...
+    perf_trace.count("http_bytes", len(body))
+
+Kapalıyken span() hep aynı boş nesneyi döner ve count() hemen çıkar; ölçülen
+kodda sadece bir fonksiyon çağrısı kalır. Açıkken her span adı için son
+HISTORY_SIZE süre tutulur, p50 / p95 bunlardan hesaplanır.
+"""
+import time
+import functools
+import threading
+from collections import deque
+
+import config
+
+HISTORY_SIZE = 512
+
+_enabled = config.PERF_TRACE
+_lock = threading.Lock()
+_spans = {}      # ad -> deque(süre_ms)
+_totals = {}     # ad -> (adet, toplam_ms)
+_counters = {}   # ad -> sayı
+_providers = {}  # önek -> get_stats benzeri fonksiyon (dışarıdaki sayaçlar)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.name, (time.perf_counter() - self.start) * 1000)
+        return False
+
+
+# --- AÇ / KAPAT ---
+def is_enabled():
+    return _enabled
+
+
+def enable(on=True):
+    global _enabled
+    _enabled = on
+
+
+def reset():
+    with _lock:
+        _spans.clear()
+        _totals.clear()
+        _counters.clear()
+
+
+# --- KAYIT ---
+def span(name):
+    """Süresi ölçülecek blok için context manager."""
+    return _Span(name) if _enabled else _NULL_SPAN
+
+
+def traced(name):
+    """Fonksiyonun her çağrısını `name` adlı span olarak ölçen dekoratör."""
+    def wrap(fn):
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _Span(name):
+                return fn(*args, **kwargs)
+        return inner
+    return wrap
+
+
+def record(name, ms):
+    if not _enabled:
+        return
+    with _lock:
+        history = _spans.get(name)
+        if history is None:
+            history = _spans[name] = deque(maxlen=HISTORY_SIZE)
+        history.append(ms)
+        n, total = _totals.get(name, (0, 0.0))
+        _totals[name] = (n + 1, total + ms)
+
+
+def count(name, n=1):
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def register_stats(prefix, get_stats):
+    """Önbellek gibi kendi sayaçlarını tutan nesneleri rapora ekler (ör. 'forecast_cache')."""
+    with _lock:
+        _providers[prefix] = get_stats
+
+
+# --- RAPOR ---
+def _percentile(sorted_values, q):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))]
+
+
+def snapshot():
+    """Tüm ölçümlerin o anki hali (JSON'a çevrilebilir sözlük)."""
+    with _lock:
+        spans = {name: sorted(h) for name, h in _spans.items()}
+        totals = dict(_totals)
+        counters = dict(_counters)
+        providers = dict(_providers)
+
+    result = {"enabled": _enabled, "time": time.time(), "spans": {}, "counters": counters,
+              "gauges": {"threads": threading.active_count()}}
+    for name, values in spans.items():
+        n, total = totals[name]
+        result["spans"][name] = {"count": n, "total_ms": round(total, 3),
+                                 "p50_ms": round(_percentile(values, 0.5), 3),
+                                 "p95_ms": round(_percentile(values, 0.95), 3),
+                                 "max_ms": round(values[-1], 3)}
+    for prefix, get_stats in providers.items():
+        try:
+            stats = get_stats()
+        except Exception:
+            continue
+        for key, value in stats.items():
+            if isinstance(value, (int, float)):
+                result["gauges"][f"{prefix}_{key}"] = value
+    return result
+
+
+def to_prometheus(snap=None):
+    """Prometheus metin formatı (node_exporter textfile toplayıcısı vb. için)."""
+    snap = snapshot() if snap is None else snap
+    lines = ["# TYPE ahd_span_ms summary"]
+    for name, s in sorted(snap["spans"].items()):
+        lines.append(f'ahd_span_ms{{span="{name}",quantile="0.5"}} {s["p50_ms"]}')
+        lines.append(f'ahd_span_ms{{span="{name}",quantile="0.95"}} {s["p95_ms"]}')
+        lines.append(f'ahd_span_ms_sum{{span="{name}"}} {s["total_ms"]}')
+        lines.append(f'ahd_span_ms_count{{span="{name}"}} {s["count"]}')
+    lines.append("# TYPE ahd_counter counter")
+    for name, value in sorted(snap["counters"].items()):
+        lines.append(f'ahd_counter{{name="{name}"}} {value}')
+    lines.append("# TYPE ahd_gauge gauge")
+    for name, value in sorted(snap["gauges"].items()):
+        lines.append(f'ahd_gauge{{name="{name}"}} {value}')
+    return "\n".join(lines) + "\n"
+
+
+def format_table(snap=None):
+    """Arayüzdeki hata ayıklama katmanı için düz metin özet."""
+    snap = snapshot() if snap is None else snap
+    lines = [f"{'aşama':<16}{'adet':>6}{'p50':>9}{'p95':>9}"]
+    for name, s in sorted(snap["spans"].items()):
+        lines.append(f"{name:<16}{s['count']:>6}{s['p50_ms']:>9.1f}{s['p95_ms']:>9.1f}")
+    if snap["counters"]:
+        lines.append("")
+        lines.extend(f"{name:<28}{value:>12}" for name, value in sorted(snap["counters"].items()))
+    lines.append("")
+    lines.extend(f"{name:<28}{value:>12}" for name, value in sorted(snap["gauges"].items()))
+    return "\n".join(lines)
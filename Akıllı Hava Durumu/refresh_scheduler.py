@@ -0,0 +1,66 @@
+# refresh_scheduler.py
+import time
+import random
+
+import config
+from forecast_cache import make_key
+
+
+class RefreshSchedule:
+    """
+    Açık kalan pencere için zamanlanmış yenileme planı.
+
+    OWM tahmini 3 saatlik dilim sınırlarında (UTC 00, 03, ...) yeniler. Uyanma
+    zamanı sınırdan REFRESH_DELAY sonrasına, üstüne [0, REFRESH_JITTER) arası rastgele
+    bir süre eklenerek konur; böylece aynı anda açık birçok pencere API'ye aynı
+    saniyede yüklenmez. Rastgele süre dilim başına bir kez seçilir ve yenilenen dilim
+    mark_done ile işaretlenir: yenileme bitip plan yeniden sorulduğunda aynı dilime
+    ikinci kez uyanılmaz. Her uyanışta favori şehirler ve ekrandaki şehir tek seferde
+    (fetch_many ile) çekilir; aynı şehrin farklı yazımları bir kez sayılır.
+    """
+
+    def __init__(self, favorites=None, delay=config.REFRESH_DELAY, jitter=config.REFRESH_JITTER, rnd=None):
+        self.favorites = list(config.FAVORITE_CITIES if favorites is None else favorites)
+        self.delay = delay
+        self.jitter = jitter
+        self.rnd = rnd or random.Random()
+        self.done_slot = None  # En son yenilenen dilimin başlangıcı
+        self._jitters = {}     # dilim başlangıcı -> o dilimin rastgele gecikmesi
+
+    def _wake(self, start):
+        """`start` ile başlayan dilimin uyanma zamanı; aynı dilim için hep aynıdır."""
+        jitter = self._jitters.get(start)
+        if jitter is None:
+            # Geçmiş dilimlerin kayıtları atılır; sözlükte en fazla birkaç dilim durur
+            self._jitters = {s: j for s, j in self._jitters.items() if s >= start - config.FORECAST_SLOT_SECONDS}
+            jitter = self._jitters[start] = self.rnd.uniform(0, self.jitter)
+        return start + self.delay + jitter
+
+    def next_wake(self, now=None):
+        """Bir sonraki yenilemenin epoch zamanı."""
+        now = time.time() if now is None else now
+        slot = config.FORECAST_SLOT_SECONDS
+        start = (int(now) // slot) * slot
+        # Bu dilimin yenilemesi geçtiyse ya da yapıldıysa bir sonrakine
+        while start == self.done_slot or self._wake(start) <= now:
+            start += slot
+        return self._wake(start)
+
+    def mark_done(self, wake):
+        """next_wake'in verdiği `wake` zamanındaki yenileme yapıldı; o dilime tekrar uyanılmaz."""
+        slot = config.FORECAST_SLOT_SECONDS
+        self.done_slot = (int(wake - self.delay) // slot) * slot
+
+    def targets(self, current=None):
+        """
+        Yenilenecek şehirler: ekrandaki şehir + favoriler, tekrarlar ayıklanmış.
+        Ekrandaki şehir başta ve yazıldığı haliyle kalır (sonuç onunla eşleştirilir).
+        """
+        seen = set()
+        cities = []
+        for city in ([current] if current else []) + self.favorites:
+            key = make_key(city)
+            if key not in seen:
+                seen.add(key)
+                cities.append(city)
+        return cities
@@ -0,0 +1,70 @@
+# single_flight.py
+"""
+Aynı anahtar için aynı anda gelen istekleri tek çağrıda birleştirir (single-flight).
+
+Açılışta, fetch_many ile toplu yenilemede ya da aynı ikonu gösteren kartlar
+dolarken aynı şehir / aynı adres için birkaç thread aynı anda ağa çıkabiliyordu:
+önbellek ancak ilk cevap geldikten sonra dolduğu için bu istekler birbirini
+görmüyordu. Burada anahtarı ilk isteyen thread (lider) işi yapar; o sırada aynı
+anahtarı isteyenler onun bitmesini bekler ve aynı sonucu ya da aynı hatayı alır.
+İş bitince anahtar düşürülür; sonraki istek yeniden çalıştırır, yani sonuçlar
+burada saklanmaz (o iş önbelleklerin).
+"""
+import threading
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.stats = {"calls": 0, "executions": 0, "deduplicated": 0}
+
+    def do(self, key, fn):
+        """
+        fn()'i `key` için bir kez çalıştırır. Aynı anahtar zaten uçuştaysa beklenir ve
+        liderin sonucu döner; lider hata aldıysa aynı istisna burada da fırlatılır.
+        """
+        with self._lock:
+            self.stats["calls"] += 1
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.stats["deduplicated"] += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.stats["executions"] += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats["in_flight"] = len(self._calls)
+        return stats
@@ -0,0 +1,83 @@
+# task_scheduler.py
+import queue
+import itertools
+import threading
+import traceback
+
+import config
+
+# Öncelik şeritleri: küçük sayı önce çalışır
+PRIORITY_FORECAST = 0   # Ana tahmin verisi
+PRIORITY_ICON = 1       # Ekranda o an görünen büyük ikon ve kıyafetler
+PRIORITY_DECOR = 2      # Günlük kart ikonları
+PRIORITY_PREFETCH = 3   # Ön ısıtma vb. acelesi olmayan işler
+
+
+class TaskScheduler:
+    """
+    Sabit sayıda işçi thread'i olan öncelikli iş kuyruğu.
+
+    Her iş bir "jeton" (token) ile gönderilebilir: (şerit, nesil). Aynı şerit için
+    new_token() çağrıldığında eski nesildeki işler bayatlar; kuyrukta bekleyenler hiç
+    çalıştırılmadan atılır, çalışmakta olanların sonuçları da is_current() ile elenir.
+    Böylece hızlı arama / gün değiştirmede geç gelen eski cevap ekranı ezemez.
+    """
+
+    def __init__(self, workers=config.WORKER_THREADS):
+        self._queue = queue.PriorityQueue()
+        self._seq = itertools.count()  # Aynı öncelikte FIFO sırası
+        self._lock = threading.Lock()
+        self._generations = {}
+        self.stats = {"submitted": 0, "completed": 0, "cancelled": 0, "failed": 0}
+        self._threads = []
+        for i in range(workers):
+            t = threading.Thread(target=self._run, name=f"weather-worker-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def new_token(self, lane):
+        """Şeridin neslini bir artırır; o şeritteki önceki tüm işler bayatlar."""
+        with self._lock:
+            generation = self._generations.get(lane, 0) + 1
+            self._generations[lane] = generation
+        return (lane, generation)
+
+    def is_current(self, token):
+        if token is None:
+            return True
+        lane, generation = token
+        with self._lock:
+            return self._generations.get(lane) == generation
+
+    def submit(self, fn, *args, priority=PRIORITY_ICON, token=None):
+        with self._lock:
+            self.stats["submitted"] += 1
+        self._queue.put((priority, next(self._seq), token, fn, args))
+
+    def _run(self):
+        while True:
+            priority, _, token, fn, args = self._queue.get()
+            try:
+                if not self.is_current(token):
+                    with self._lock:
+                        self.stats["cancelled"] += 1
+                    continue
+                fn(*args)
+                with self._lock:
+                    self.stats["completed"] += 1
+            except Exception:
+                with self._lock:
+                    self.stats["failed"] += 1
+                traceback.print_exc()
+            finally:
+                self._queue.task_done()
+
+    def pending(self):
+        return self._queue.qsize()
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self.stats)
+        stats["pending"] = self.pending()
+        stats["workers"] = len(self._threads)
+        return stats
@@ -0,0 +1,87 @@
+# theme.py
+"""
+Hava durumuna göre değişen pencere arka planı.
+
+Eskiden her aramada ve gün seçiminde ana pencereye setStyleSheet çağrılıyordu:
+Qt bunun için bütün widget ağacını yeniden "polish" eder (stil kuralları her
+widget için tekrar çözülür) ve CSS'teki "transition" özelliğini hiç tanımaz.
+Burada her WEATHER_BG_COLORS girdisi için tema nesnesi bir kez hazırlanır; arka
+planı merkez widget (ThemeBackground) kendisi boyar. Tema değişimi sadece onun
+rengini değiştirip yeniden boyar, stil sistemine hiç dokunmaz. Geçiş
+QVariantAnimation ile renk ara değerleri üzerinden yapılır; her karede yapılan
+iş tek bir düz dolgudur.
+"""
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtGui import QColor, QPainter
+from PyQt6.QtCore import Qt, QVariantAnimation, QAbstractAnimation, QEasingCurve, pyqtSignal
+
+import config
+
+
+class Theme:
+    """Bir hava durumu koduna ait hazır renkler."""
+    __slots__ = ("code", "background")
+
+    def __init__(self, code, background):
+        self.code = code
+        self.background = QColor(background)
+
+
+DEFAULT_THEME = Theme(None, config.MAIN_BG_COLOR)
+THEMES = {code: Theme(code, color) for code, color in config.WEATHER_BG_COLORS.items()}
+
+
+def theme_for(icon_code):
+    """İkon kodunun teması; bilinmeyen kodda varsayılan tema."""
+    return THEMES.get(icon_code, DEFAULT_THEME)
+
+
+class ThemeBackground(QWidget):
+    """
+    Pencerenin merkez widget'ı: arka planı kendisi düz renkle boyar.
+    Çocuk widget'lar saydam olduğundan rengin değişmesi yeniden stillendirme gerektirmez.
+    """
+    first_paint = pyqtSignal()  # Pencere iskeleti ilk kez ekrana çizildi
+
+    def __init__(self, parent=None, duration=config.THEME_TRANSITION_MS):
+        super().__init__(parent)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)  # Tüm alanı kendisi boyar
+        self.theme = DEFAULT_THEME
+        self._painted = False
+        self._color = QColor(DEFAULT_THEME.background)
+        self._anim = QVariantAnimation(self)
+        self._anim.setDuration(duration)
+        self._anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
+        self._anim.valueChanged.connect(self._set_color)
+
+    @property
+    def color(self):
+        return QColor(self._color)
+
+    @property
+    def animating(self):
+        return self._anim.state() == QAbstractAnimation.State.Running
+
+    def set_theme(self, theme, animate=True):
+        """Temayı değiştirir; animate ise o anki renkten yeni renge yumuşak geçer."""
+        if theme is self.theme:
+            return
+        self.theme = theme
+        self._anim.stop()
+        if not animate or self._anim.duration() <= 0 or not self.isVisible():
+            self._set_color(theme.background)
+            return
+        self._anim.setStartValue(QColor(self._color))
+        self._anim.setEndValue(theme.background)
+        self._anim.start()
+
+    def _set_color(self, color):
+        self._color = QColor(color)
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), self._color)
+        if not self._painted:
+            self._painted = True
+            self.first_paint.emit()
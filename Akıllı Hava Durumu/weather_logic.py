@@ -1,129 +1,177 @@
 # weather_logic.py
-import requests
-from io import BytesIO
-from PIL import Image
-from config import API_KEY, FORECAST_URL, CLOTHING_URLS
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from config import API_KEY, FORECAST_URL, FETCH_CONCURRENCY
+from forecast_cache import ForecastCache, make_key
+from forecast_frame import ForecastFrame
+from forecast_stream import decode_forecast
+from single_flight import SingleFlight
+from advice_rules import ENGINE, group_from_desc
+import derived_metrics
+import perf_trace
+from http_client import (HttpTransport, WeatherError, CityNotFoundError, RequestTimeoutError,
+                         ConnectionFailedError, HttpStatusError, InvalidResponseError)
 
-def fetch_weather_data(city):
+# Dışarıya açık adlar. Hata tipleri http_client'tan yeniden dışa verilir: arayüz ağ katmanını
+# weather_logic üzerinden tembel yükler ve hataları weather_logic.* olarak yakalar.
+__all__ = [
+    "WeatherError", "CityNotFoundError", "RequestTimeoutError", "ConnectionFailedError",
+    "HttpStatusError", "InvalidResponseError",
+    "transport", "forecast_cache", "forecast_flights", "download_flights",
+    "fetch_weather_data", "fetch_many", "CityResult", "get_cache_stats",
+    "get_smart_advice", "get_clothing_items", "advise", "advise_many",
+    "get_derived_metrics", "advise_frame", "download_bytes",
+]
+
+# Tüm ağ çağrılarının paylaştığı bağlantı havuzu
+transport = HttpTransport()
+
+# Tüm aramaların paylaştığı tahmin önbelleği; ham cevap değil ForecastFrame tutar
+forecast_cache = ForecastCache(dump=ForecastFrame.to_columns, load=ForecastFrame.from_columns)
+perf_trace.register_stats("forecast_cache", lambda: forecast_cache.get_stats())
+
+# Aynı anda gelen aynı istekler tek ağ çağrısında birleşir: tahminler önbellek
+# anahtarıyla, resimler adresle
+forecast_flights = SingleFlight()
+download_flights = SingleFlight()
+perf_trace.register_stats("forecast_flight", forecast_flights.get_stats)
+perf_trace.register_stats("download_flight", download_flights.get_stats)
+
+def _city_params(city):
+    # Sayısal değerler OWM şehir ID'si olarak, diğerleri şehir adı olarak sorgulanır
+    if isinstance(city, int) or str(city).strip().isdigit():
+        return {"id": str(city).strip()}
+    return {"q": city}
+
+def _request_forecast(city, units="metric", lang="tr"):
+    # Gövde ağdan geldikçe dilim dilim çözülür; ham sözlük ağacı hiç kurulmaz
+    params = {**_city_params(city), "appid": API_KEY, "units": units, "lang": lang}
+    chunks = transport.get_chunks(FORECAST_URL, params=params)
+    try:
+        with perf_trace.span("stream_decode"):
+            return decode_forecast(chunks)
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        raise InvalidResponseError(str(e)) from e
+
+def _refresh_forecast(city, units, lang):
+    # Arka plan yenilemesi başarısız olursa eldeki bayat kayıt kullanılmaya devam eder
+    try:
+        return _request_forecast(city, units, lang)
+    except WeatherError:
+        return None
+
+def _fetch_and_store(key, city, units, lang):
+    data = _request_forecast(city, units, lang)
+    if data:
+        forecast_cache.store(key, data)
+    return data
+
+def fetch_weather_data(city, units="metric", lang="tr", refresh=False):
+    """
+    Şehrin tahminini ForecastFrame olarak döner.
+    Önce önbelleğe bakar. Taze kayıt varsa ağa hiç çıkmaz; bayat kayıt varsa
+    onu hemen döndürüp arka planda yeniler. Hiç kayıt yoksa API'ye gider.
+    refresh=True önbelleği atlayıp doğrudan API'ye gider (zamanlanmış yenileme).
+    Aynı anahtar için uçuşta bir istek varsa yenisi açılmaz, onun sonucu (ya da
+    hatası) paylaşılır.
+    Başarısızlıkta WeatherError alt tiplerinden birini fırlatır
+    (CityNotFoundError, RequestTimeoutError, ...).
+    """
+    key = make_key(city, units, lang)
+    cached = None if refresh else forecast_cache.lookup(key)
+    if cached:
+        data, fresh = cached
+        if not fresh:
+            forecast_cache.refresh_async(key, lambda: _refresh_forecast(city, units, lang))
+        return data
+
+    return forecast_flights.do(key, lambda: _fetch_and_store(key, city, units, lang))
+
+# fetch_many'nin ürettiği sonuçlar: forecast veya error'dan biri doludur
+CityResult = namedtuple("CityResult", ["city", "forecast", "error"])
+
+def _fetch_one(city, units, lang, refresh=False):
     try:
-        params = {"q": city, "appid": API_KEY, "units": "metric", "lang": "tr"}
-        response = requests.get(FORECAST_URL, params=params)
-        return response.json() if response.status_code == 200 else None
-    except: return None
+        return CityResult(city, fetch_weather_data(city, units, lang, refresh), None)
+    except WeatherError as e:
+        return CityResult(city, None, e)
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        return CityResult(city, None, InvalidResponseError(str(e)))
+
+def fetch_many(cities, concurrency=FETCH_CONCURRENCY, units="metric", lang="tr", refresh=False):
+    """
+    Birden çok şehri (ad veya ID) aynı anda en fazla `concurrency` istekle çeker ve
+    sonuçları bitiş sırasına göre CityResult olarak üretir (generator).
+    Bir şehrin hatası diğerlerini durdurmaz; hata o şehrin `error` alanında döner.
+    Girdi tembel okunur, yani çok uzun listelerde de bellekte sadece açık işler durur.
+    """
+    cities = iter(cities)
+    end = object()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        pending = set()
+        for city in cities:
+            pending.add(pool.submit(_fetch_one, city, units, lang, refresh))
+            if len(pending) >= concurrency:
+                break
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+                next_city = next(cities, end)
+                if next_city is not end:
+                    pending.add(pool.submit(_fetch_one, next_city, units, lang, refresh))
+
+def get_cache_stats():
+    """Önbellek isabet / ıska / tahliye sayaçları."""
+    return forecast_cache.get_stats()
 
 def get_smart_advice(temp, desc, wind_speed):
     """
     Sıcaklık, hava durumu açıklaması ve rüzgar hızına göre
     detaylı ve arkadaş canlısı tavsiyeler üretir.
+    Durum kodu elindeyse advise() tercih edilmeli; açıklama metni dile bağlıdır.
     """
-    advice = ""
-    desc = desc.lower()
-    
-    # --- 1. ÖZEL HAVA DURUMLARI (KAR & YAĞMUR) ---
-    
-    # KAR
-    if "kar" in desc or "snow" in desc:
-        advice += "❄️ KAR YAĞIŞI: Dışarısı beyaz bir masal gibi ama soğuk şakaya gelmez! Mutlaka su geçirmeyen botlarını ve en kalın montunu giy.\n\n"
-        advice += "🎒 İPUCU: Atkı, bere ve eldiven üçlüsü olmadan çıkma. Araç kullanacaksan buz kazıyıcıyı unutma."
-        return advice # Kar varsa başka şeye bakmaya gerek yok
-
-    # YAĞMUR
-    elif "yağmur" in desc or "sağanak" in desc or "rain" in desc:
-        if temp < 12:
-            advice += "☔ SOĞUK YAĞMUR: Hava hem ıslak hem üşütücü. Su geçirmeyen kalın bir mont ve sağlam botlar şart.\n\n"
-            advice += "🎒 İPUCU: Rüzgara dayanıklı bir şemsiye al. Ayakların ıslanırsa günün zehir olur, dikkat et!"
-        else:
-            advice += "🌦️ ILIK YAĞMUR: Yağmur var ama hava yumuşak. İnce bir yağmurluk veya trençkot işini görür.\n\n"
-            advice += "🎒 İPUCU: Şemsiyeni yanından ayırma. Islanan elektronik cihazlar için çantanda yer aç."
-
-    # --- 2. SICAKLIK BAZLI TAVSİYELER (YAĞIŞ YOKSA) ---
-    
-    # DONDURUCU SOĞUK (< 5°C)
-    elif temp < 5:
-        advice += "🥶 KURU SOĞUK: Hava buz gibi! Termal içliklerin varsa tam zamanı. Lahana gibi kat kat giyinmek seni sıcak tutar.\n\n"
-        advice += "🎒 İPUCU: Soğuk cildini kurutabilir, nemlendirici sürmeyi ve kulaklarını bereyle korumayı unutma."
-
-    # SERİN / BAHAR (5°C - 18°C)
-    elif 5 <= temp <= 18:
-        advice += "☁️ SERİN HAVA: Tam bir geçiş havası. Tişört üstüne hırka veya mevsimlik bir ceket alarak 'katmanlı' giyin.\n\n"
-        advice += "🎒 İPUCU: Güneşe aldanma, akşam serinliği çarpar. Yanına yedek bir üst al."
-
-    # KEYİFLİ / GÜZEL (18°C - 25°C)
-    elif 18 < temp <= 25:
-        advice += "🌤️ HARİKA HAVA: Ne üşütür ne terletir. En sevdiğin tişörtünü, kotunu veya rahat spor kıyafetlerini giy.\n\n"
-        advice += "🎒 İPUCU: Dışarıda vakit geçirmek için mükemmel gün. Güneş gözlüğün yanında olsun."
-
-    # SICAK (25°C - 32°C)
-    elif 25 < temp <= 32:
-        advice += "☀️ SICAK: Güneş kendini hissettiriyor. Açık renkli, pamuklu ve terletmeyen ince kıyafetler tercih et.\n\n"
-        advice += "🎒 İPUCU: Güneş gözlüğü ve şapka şart. Susuz kalmamak için su mataranı mutlaka yanına al."
-
-    # AŞIRI SICAK (> 32°C)
-    elif temp > 32:
-        advice += "🔥 AŞIRI SICAK: Hava bunaltıcı seviyede. Mümkünse gölgeden ayrılma ve en ferah, en ince kıyafetlerini giy.\n\n"
-        advice += "🎒 İPUCU: Sıcakta telefon şarjı çabuk biter, powerbank al. Ve tabii ki bol bol su iç!"
-
-    # --- 3. RÜZGAR EKLENTİSİ ---
-    if wind_speed > 20:
-        advice += "\n\n🌬️ UYARI: Rüzgar sert esiyor! Rüzgar kesici (Windbreaker) bir mont giymezsen üşütürsün."
-        
-    # Hata durumunda boş dönmesin
-    if advice == "":
-        advice = "Hava değişken olabilir, tedbirli olmakta fayda var!"
-
-    return advice
-
-# weather_logic.py içindeki get_clothing_icon_urls fonksiyonunu bununla değiştir:
-
-def get_clothing_icon_urls(temp, desc):
-    icons = []
-    desc = desc.lower()
-    
-    # --- 1. Temel Kıyafet Seçimi (Sıcaklığa Göre) ---
-    if temp < 5:
-        icons.append(CLOTHING_URLS["winter_coat"])
-        icons.append(CLOTHING_URLS["scarf"]) # Çok soğuksa atkı/bere ekle
-    elif 5 <= temp < 15:
-        icons.append(CLOTHING_URLS["winter_coat"])
-    elif 15 <= temp < 22:
-        icons.append(CLOTHING_URLS["jacket"])
-    else:
-        icons.append(CLOTHING_URLS["tshirt"])
-        
-    # --- 2. Hava Olayına Göre Ekipmanlar ---
-    
-    # KAR VARSA
-    if "snow" in desc or "kar" in desc:
-        icons.append(CLOTHING_URLS["snow_boots"]) # Kar botu
-        if CLOTHING_URLS["scarf"] not in icons:   # Eğer yukarıda eklenmediyse ekle
-            icons.append(CLOTHING_URLS["scarf"])
-            
-    # YAĞMUR VARSA
-    elif "rain" in desc or "yağmur" in desc or "sağanak" in desc: 
-        icons.append(CLOTHING_URLS["raincoat"]) # Yağmurluk
-        icons.append(CLOTHING_URLS["umbrella"]) # Şemsiye (İstediğin özellik)
-    
-    # GÜNEŞLİ / SICAKSA
-    if ("clear" in desc or "açık" in desc or "sun" in desc) and temp > 18:
-        icons.append(CLOTHING_URLS["sunglasses"])
-        
-    # ÇOK SICAKSA ŞAPKA EKLE
-    if temp > 25:
-        icons.append(CLOTHING_URLS["cap"])
-        
-    return icons
-
-def download_icon(icon_code):
-    try:
-        url = f"https://openweathermap.org/img/wn/{icon_code}@4x.png"
-        response = requests.get(url, stream=True)
-        if response.status_code == 200:
-            return Image.open(BytesIO(response.content))
-    except: return None
+    return ENGINE.table[ENGINE.cell(temp, group_from_desc(desc), wind_speed)][0]
 
-def download_image_from_url(url):
-    try:
-        response = requests.get(url, stream=True)
-        if response.status_code == 200:
-            return Image.open(BytesIO(response.content))
-    except: return None
\ No newline at end of file
+def get_clothing_items(temp, desc):
+    """Önerilen kıyafetlerin CLOTHING_URLS anahtarları ("winter_coat", "umbrella", ...)."""
+    return ENGINE.table[ENGINE.cell(temp, group_from_desc(desc), 0)][1]
+
+def advise(temp, cond_id, wind_speed, precip=0.0):
+    """Tek dilim için (tavsiye metni, kıyafet anahtarları demeti); OWM durum koduna göre. °C, m/s, mm."""
+    return ENGINE.lookup(temp, cond_id, wind_speed, precip)
+
+def advise_many(temps, cond_ids, wind_speeds, precips=None):
+    """advise()'ın dizi hali: tüm dilimler tek vektörel değerlendirmeyle."""
+    table = ENGINE.table
+    return [table[c] for c in ENGINE.evaluate(temps, cond_ids, wind_speeds, precips).tolist()]
+
+def get_derived_metrics(frames, units="metric"):
+    """
+    Çiy noktası, hissedilen sıcaklık, günlük yağış toplamı, en sert hamle...
+    (derived_metrics.DerivedMetrics). Tek frame ya da frame listesi alır; liste
+    tek dizi geçişinde hesaplanır.
+    """
+    if isinstance(frames, ForecastFrame):
+        frames = [frames]
+    return derived_metrics.compute(frames, units)
+
+def advise_frame(frame, metrics=None, index=0):
+    """
+    Frame'in tüm dilimleri için tavsiyeler. Kurallara ham sıcaklık ve ortalama rüzgar
+    yerine hissedilen sıcaklık (°C), hamle dahil en yüksek rüzgar (m/s) ve yağış
+    miktarı verilir; frame hangi birimde çekildiyse ölçüler de o `units` ile hesaplanmış
+    olmalıdır. Ölçüler önceden hesaplandıysa `metrics` ve frame'in oradaki sırası
+    (`index`) verilir.
+    """
+    if metrics is None:
+        metrics, index = get_derived_metrics(frame), 0
+    apparent, wind, precip = metrics.advice_inputs(index)
+    return advise_many(apparent, frame.cond_id, wind, precip)
+
+def download_bytes(url, loader=None):
+    """
+    Adresin ham baytları; aynı adrese aynı anda gelen istekler tek indirmede birleşir.
+    `loader` verilirse düz indirme yerine o çalışır (ör. indirip diske de yazan ikon önbelleği).
+    """
+    return download_flights.do(url, loader or (lambda: transport.get_bytes(url)))